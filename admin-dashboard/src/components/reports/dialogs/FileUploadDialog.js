@@ -128,7 +128,13 @@ export default function FileUploadDialog({
         
         try {
           // onUpload 함수 호출 - 개별 토스트 메시지 없이, fetchReportDetail 호출 없이 업로드만 수행
-          const success = await onUpload(fileData.file, fileData.displayName, false, true);
+          const success = await onUpload(
+            fileData.file, fileData.displayName, false, true,
+            (progress) => setUploadProgress(prev => ({
+              ...prev,
+              [fileData.id]: { status: 'uploading', progress }
+            }))
+          );
           
           if (success) {
             console.log(`✅ 파일 ${i + 1} 업로드 성공:`, fileData.name);
@@ -321,7 +327,7 @@ export default function FileUploadDialog({
                   지원 형식: MP3, WAV, M4A, AAC, OGG, FLAC
                 </Typography>
                 <Typography variant="body2" color="text.secondary">
-                  여러 파일을 한 번에 선택할 수 있습니다 (최대 파일 크기: 100MB)
+                  여러 파일을 한 번에 선택할 수 있습니다 (최대 파일 크기: 2GB)
                 </Typography>
               </Box>
             )}
@@ -373,7 +379,8 @@ export default function FileUploadDialog({
                           />
                           {uploadProgress[fileData.id]?.status === 'uploading' && (
                             <LinearProgress 
-                              variant="indeterminate" 
+                              variant={uploadProgress[fileData.id].progress > 0 ? 'determinate' : 'indeterminate'}
+                              value={uploadProgress[fileData.id].progress}
                               sx={{ mt: 1, width: '100%', maxWidth: 300 }} 
                             />
                           )}
@@ -151,19 +151,34 @@ export default function STTConfigDialog({
               </Typography>
               <Box sx={{ display: 'flex', flexDirection: 'column', gap: 2 }}>
                 <FormControl fullWidth>
-                  <InputLabel>모델 타입</InputLabel>
+                  <InputLabel>STT 엔진</InputLabel>
                   <Select
-                    value={sttConfig.model_type}
-                    label="모델 타입"
-                    onChange={(e) => setSttConfig({ ...sttConfig, model_type: e.target.value })}
+                    value={sttConfig.engine || 'returnzero'}
+                    label="STT 엔진"
+                    onChange={(e) => setSttConfig({ ...sttConfig, engine: e.target.value })}
                     sx={{ borderRadius: 2 }}
                   >
-                    <MenuItem value="sommers">Sommers (리턴제로 기본)</MenuItem>
-                    <MenuItem value="whisper">Whisper</MenuItem>
+                    <MenuItem value="returnzero">리턴제로</MenuItem>
+                    <MenuItem value="local">로컬 Whisper (서버 CPU, 화자 분리 미지원)</MenuItem>
                   </Select>
                 </FormControl>
+
+                {sttConfig.engine !== 'local' && (
+                  <FormControl fullWidth>
+                    <InputLabel>모델 타입</InputLabel>
+                    <Select
+                      value={sttConfig.model_type}
+                      label="모델 타입"
+                      onChange={(e) => setSttConfig({ ...sttConfig, model_type: e.target.value })}
+                      sx={{ borderRadius: 2 }}
+                    >
+                      <MenuItem value="sommers">Sommers (리턴제로 기본)</MenuItem>
+                      <MenuItem value="whisper">Whisper</MenuItem>
+                    </Select>
+                  </FormControl>
+                )}
                 
-                {sttConfig.model_type === 'whisper' && (
+                {(sttConfig.engine === 'local' || sttConfig.model_type === 'whisper') && (
                   <>
                     <FormControl fullWidth>
                       <InputLabel>언어</InputLabel>
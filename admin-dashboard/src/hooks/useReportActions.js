@@ -1,9 +1,24 @@
 import { useRouter } from 'next/router';
 import toast from 'react-hot-toast';
+import { uploadFileDirect } from '../utils/directUpload';
 
 // API 요청은 Next.js 프록시(/api)를 통해 처리
 const API_BASE_URL = '/api';
 
+// STT 스케줄러 대기 정보 안내 문구 (대기 중이 아니면 빈 문자열)
+const formatQueueInfo = (queue) => {
+  if (!queue || queue.state !== 'queued') return '';
+  const minutes = Math.max(1, Math.round(queue.wait_seconds / 60));
+  return ` (대기 ${queue.position}번째, 약 ${minutes}분 후 시작)`;
+};
+
+// 대기열이 가득 찬 경우(429) 서버 메시지 사용
+const queueErrorMessage = async (response, fallback) => {
+  if (response.status !== 429) return fallback;
+  const error = await response.json().catch(() => ({}));
+  return error.detail || fallback;
+};
+
 export const useReportActions = (reportId, fetchReportDetail, startSTTPolling) => {
   const router = useRouter();
 
@@ -104,23 +119,10 @@ export const useReportActions = (reportId, fetchReportDetail, startSTTPolling) =
 
 
 
-  // 파일 업로드
-  const uploadFile = async (file, displayName, showToast = true, skipRefresh = false) => {
+  // 파일 업로드 (S3 직접 업로드)
+  const uploadFile = async (file, displayName, showToast = true, skipRefresh = false, onProgress = null) => {
     try {
-      const formData = new FormData();
-      formData.append('file', file);
-      formData.append('report_id', reportId);
-      
-      if (displayName && displayName.trim()) {
-        formData.append('display_name', displayName.trim());
-      }
-      
-      const response = await fetch(`${API_BASE_URL}/audio-files`, {
-        method: 'POST',
-        body: formData
-      });
-      
-      if (!response.ok) throw new Error('파일 업로드에 실패했습니다.');
+      await uploadFileDirect(file, reportId, displayName, onProgress);
       
       if (showToast) {
         toast.success('파일이 성공적으로 업로드되었습니다.');
@@ -147,9 +149,12 @@ export const useReportActions = (reportId, fetchReportDetail, startSTTPolling) =
         method: 'POST'
       });
       
-      if (!response.ok) throw new Error('STT 처리를 시작할 수 없습니다.');
+      if (!response.ok) {
+        throw new Error(await queueErrorMessage(response, 'STT 처리를 시작할 수 없습니다.'));
+      }
       
-      toast.success('STT 처리가 시작되었습니다. 자동으로 상태를 확인합니다.');
+      const data = await response.json();
+      toast.success(`STT 처리가 시작되었습니다${formatQueueInfo(data.queue)}. 자동으로 상태를 확인합니다.`);
       await fetchReportDetail();
       startSTTPolling();
       return true;
@@ -160,16 +165,23 @@ export const useReportActions = (reportId, fetchReportDetail, startSTTPolling) =
   };
 
   // STT 결과 수정
-  const updateSTT = async (fileId, content) => {
+  const updateSTT = async (fileId, content, version) => {
     try {
       const formData = new FormData();
       formData.append('content', content);
+      // 편집을 시작한 시점의 버전 (다른 편집이 먼저 저장되었으면 409)
+      if (version !== null && version !== undefined) {
+        formData.append('version', version);
+      }
       
       const response = await fetch(`${API_BASE_URL}/audio-files/${fileId}/transcript`, {
         method: 'PUT',
         body: formData
       });
       
+      if (response.status === 409) {
+        throw new Error('다른 편집이 먼저 저장되었습니다. STT 결과를 다시 불러와 주세요.');
+      }
       if (!response.ok) throw new Error('STT 결과 수정에 실패했습니다.');
       
       toast.success('STT 결과가 수정되었습니다.');
@@ -212,9 +224,12 @@ export const useReportActions = (reportId, fetchReportDetail, startSTTPolling) =
         method: 'POST'
       });
       
-      if (!response.ok) throw new Error('STT 재시작에 실패했습니다.');
+      if (!response.ok) {
+        throw new Error(await queueErrorMessage(response, 'STT 재시작에 실패했습니다.'));
+      }
       
-      toast.success('STT 처리가 새로운 설정으로 재시작되었습니다.');
+      const data = await response.json();
+      toast.success(`STT 처리가 새로운 설정으로 재시작되었습니다${formatQueueInfo(data.queue)}.`);
       await fetchReportDetail();
       startSTTPolling();
       return true;
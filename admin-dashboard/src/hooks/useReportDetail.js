@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 import toast from 'react-hot-toast';
 
 // API 요청은 Next.js 프록시(/api)를 통해 처리
@@ -24,10 +24,10 @@ export const useReportDetail = (reportId) => {
   // 선택된 파일
   const [selectedAudioFile, setSelectedAudioFile] = useState(null);
   
-  // STT 폴링 상태
-  const [pollingIntervalId, setPollingIntervalId] = useState(null);
+  // STT 상태 스트림 (SSE)
+  const eventSourceRef = useRef(null);
   const [isPolling, setIsPolling] = useState(false);
-  const [notifiedFiles, setNotifiedFiles] = useState(new Set());
+  const notifiedFilesRef = useRef(new Set());
 
   // 다이얼로그 열기/닫기 함수
   const openDialog = useCallback((dialogName) => {
@@ -75,94 +75,86 @@ export const useReportDetail = (reportId) => {
     }
   }, [reportId]);
 
-  // STT 폴링 중단
+  // 상태 변경 시 Transcript 등 전체 정보를 로딩 표시 없이 다시 조회
+  const refreshReportQuietly = useCallback(async () => {
+    try {
+      const response = await fetch(`${API_BASE_URL}/reports/${reportId}`);
+      if (!response.ok) return;
+      const data = await response.json();
+      setReport(data);
+    } catch (err) {
+      console.error('보고서 갱신 실패:', err);
+    }
+  }, [reportId]);
+
+  // STT 상태 스트림 중단
   const stopSTTPolling = useCallback(() => {
-    if (pollingIntervalId) {
-      clearInterval(pollingIntervalId);
-      setPollingIntervalId(null);
+    if (eventSourceRef.current) {
+      eventSourceRef.current.close();
+      eventSourceRef.current = null;
     }
     setIsPolling(false);
-    setNotifiedFiles(new Set());
-  }, [pollingIntervalId]);
+    notifiedFilesRef.current = new Set();
+  }, []);
 
-  // STT 폴링 시작
-  const startSTTPolling = useCallback(() => {
-    if (isPolling || pollingIntervalId) return;
-    
-    setIsPolling(true);
-    const intervalId = setInterval(async () => {
-      try {
-        const response = await fetch(`${API_BASE_URL}/reports/${reportId}`);
-        if (!response.ok) return;
-        
-        const data = await response.json();
-        const audioFiles = data.audio_files || [];
+  // STT 상태 변경 반영 및 완료/실패 알림
+  const applySTTStatuses = useCallback((statuses) => {
+    setReport(prevReport => {
+      if (!prevReport) return prevReport;
+      
+      const audioFiles = (prevReport.audio_files || []).map(file => {
+        const update = statuses.find(s => s.id === file.id);
+        if (!update || update.stt_status === file.stt_status) {
+          return update ? { ...file, ...update } : file;
+        }
         
-        setReport(prevReport => {
-          const prevAudioFiles = prevReport?.audio_files || [];
-          
-          // STT 완료/실패 알림 처리
-          const newlyCompletedFiles = audioFiles.filter(file => {
-            const prevFile = prevAudioFiles.find(pf => pf.id === file.id);
-            return prevFile && 
-                   (prevFile.stt_status === 'processing' || prevFile.stt_status === 'pending') && 
-                   file.stt_status === 'completed' &&
-                   !notifiedFiles.has(`${file.id}-completed`);
-          });
-          
-          const newlyFailedFiles = audioFiles.filter(file => {
-            const prevFile = prevAudioFiles.find(pf => pf.id === file.id);
-            return prevFile && 
-                   (prevFile.stt_status === 'processing' || prevFile.stt_status === 'pending') && 
-                   file.stt_status === 'failed' &&
-                   !notifiedFiles.has(`${file.id}-failed`);
-          });
-          
-          // 알림 처리
-          if (newlyCompletedFiles.length > 0) {
-            newlyCompletedFiles.forEach(file => {
-              toast.success(`"${file.display_name || file.filename}" STT 처리가 완료되었습니다.`);
-            });
-            setNotifiedFiles(prev => {
-              const newSet = new Set(prev);
-              newlyCompletedFiles.forEach(file => newSet.add(`${file.id}-completed`));
-              return newSet;
-            });
-          }
-          
-          if (newlyFailedFiles.length > 0) {
-            newlyFailedFiles.forEach(file => {
-              toast.error(`"${file.display_name || file.filename}" STT 처리가 실패했습니다.`);
-            });
-            setNotifiedFiles(prev => {
-              const newSet = new Set(prev);
-              newlyFailedFiles.forEach(file => newSet.add(`${file.id}-failed`));
-              return newSet;
-            });
+        const wasRunning = file.stt_status === 'processing' || file.stt_status === 'pending';
+        const key = `${file.id}-${update.stt_status}`;
+        if (wasRunning && !notifiedFilesRef.current.has(key)) {
+          if (update.stt_status === 'completed') {
+            toast.success(`"${file.display_name || file.filename}" STT 처리가 완료되었습니다.`);
+            notifiedFilesRef.current.add(key);
+            // 완료된 파일의 Transcript를 반영하기 위해 전체 정보 갱신
+            setTimeout(refreshReportQuietly, 0);
+          } else if (update.stt_status === 'failed') {
+            toast.error(`"${file.display_name || file.filename}" STT 처리가 실패했습니다.`);
+            notifiedFilesRef.current.add(key);
           }
-          
-          return { ...prevReport, audio_files: audioFiles };
-        });
-        
-        // 진행 중인 STT가 없으면 폴링 중단
-        const hasProcessingSTT = audioFiles.some(file => 
-          file.stt_status === 'processing' || file.stt_status === 'pending'
-        );
-        
-        console.log(`🔍 STT 상태 체크: 진행중인 파일 ${hasProcessingSTT ? '있음' : '없음'} (총 ${audioFiles.length}개 파일)`);
-        
-        if (!hasProcessingSTT) {
-          console.log('⏹️ 진행중인 STT가 없어서 폴링을 중단합니다.');
-          stopSTTPolling();
         }
-        
-      } catch (error) {
-        console.error('STT 상태 폴링 오류:', error);
+        return { ...file, ...update };
+      });
+      
+      // 진행 중인 STT가 없으면 스트림 중단
+      const hasProcessingSTT = audioFiles.some(file => file.stt_status === 'processing');
+      if (!hasProcessingSTT) {
+        console.log('⏹️ 진행중인 STT가 없어서 상태 스트림을 닫습니다.');
+        setTimeout(stopSTTPolling, 0);
       }
-    }, 3000);
+      
+      return { ...prevReport, audio_files: audioFiles };
+    });
+  }, [stopSTTPolling, refreshReportQuietly]);
+
+  // STT 상태 스트림 시작 (Server-Sent Events)
+  const startSTTPolling = useCallback(() => {
+    if (!reportId || eventSourceRef.current) return;
+    
+    setIsPolling(true);
+    const eventSource = new EventSource(`${API_BASE_URL}/reports/${reportId}/events`);
+    
+    eventSource.addEventListener('snapshot', (event) => {
+      applySTTStatuses(JSON.parse(event.data));
+    });
+    eventSource.addEventListener('stt_status', (event) => {
+      applySTTStatuses([JSON.parse(event.data)]);
+    });
+    eventSource.onerror = () => {
+      // 연결이 끊기면 EventSource가 자동으로 재연결하고 snapshot을 다시 받음
+      console.warn('STT 상태 스트림 연결 오류, 재연결 대기 중');
+    };
     
-    setPollingIntervalId(intervalId);
-  }, [reportId, isPolling, pollingIntervalId, notifiedFiles, stopSTTPolling]);
+    eventSourceRef.current = eventSource;
+  }, [reportId, applySTTStatuses]);
 
   // STT 상태 확인 및 폴링 관리는 이제 useEffect에서 직접 처리
 
@@ -174,7 +166,7 @@ export const useReportDetail = (reportId) => {
     }
   }, [reportId, fetchReportDetail, fetchAnalysisStatus]);
   
-  // 보고서 데이터 로드 후 STT 상태 확인 (조건부 폴링)
+  // 보고서 데이터 로드 후 STT 상태 확인 (진행 중일 때만 스트림 연결)
   useEffect(() => {
     console.log('📋 STT 폴링 상태 체크:', {
       reportId,
@@ -205,7 +197,7 @@ export const useReportDetail = (reportId) => {
 
   // 기존 폴링 관리 로직은 위의 useEffect로 대체됨
 
-  // 컴포넌트 언마운트 시 폴링 정리
+  // 컴포넌트 언마운트 시 스트림 정리
   useEffect(() => {
     return () => {
       stopSTTPolling();
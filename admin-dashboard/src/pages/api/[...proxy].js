@@ -7,6 +7,7 @@ import axios from 'axios';
 export const config = {
   api: {
     bodyParser: false, // formidable을 사용하기 위해 비활성화
+    externalResolver: true, // SSE 스트림은 핸들러 반환 후에도 응답이 계속됨
   },
 };
 
@@ -31,6 +32,8 @@ export default async function handler(req, res) {
       url: targetUrl,
       headers: {},
       timeout: 30000, // 기본 30초
+      // 조건부 GET의 304 응답도 정상 응답으로 전달
+      validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
     };
     
     // Content-Type에 따른 body 처리
@@ -42,6 +45,7 @@ export default async function handler(req, res) {
       
       const form = formidable({
         maxFileSize: 100 * 1024 * 1024, // 100MB
+        maxTotalFileSize: 1024 * 1024 * 1024, // 1GB (일괄 업로드)
         keepExtensions: true,
         allowEmptyFiles: false,
       });
@@ -92,7 +96,7 @@ export default async function handler(req, res) {
       // 파일 업로드용 타임아웃과 크기 제한 증가
       axiosConfig.timeout = 300000; // 5분
       axiosConfig.maxContentLength = 100 * 1024 * 1024; // 100MB
-      axiosConfig.maxBodyLength = 100 * 1024 * 1024; // 100MB
+      axiosConfig.maxBodyLength = 1024 * 1024 * 1024; // 1GB (일괄 업로드)
       
     } else if (req.method !== 'GET' && req.method !== 'HEAD') {
       // JSON 데이터 처리
@@ -142,6 +146,30 @@ export default async function handler(req, res) {
     
     console.log(`🚀 요청 전송: ${axiosConfig.method.toUpperCase()} ${targetUrl}`);
     
+    // Server-Sent Events는 버퍼링 없이 스트림으로 그대로 전달
+    if ((req.headers.accept || '').includes('text/event-stream')) {
+      const controller = new AbortController();
+      req.on('close', () => controller.abort());
+      
+      const stream = await axios({
+        ...axiosConfig,
+        responseType: 'stream',
+        timeout: 0,
+        signal: controller.signal,
+        validateStatus: () => true, // 에러 응답도 본문 그대로 전달
+      });
+      
+      res.writeHead(stream.status, {
+        'Content-Type': stream.headers['content-type'] || 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'Connection': 'keep-alive',
+        'X-Accel-Buffering': 'no',
+      });
+      stream.data.on('error', () => res.end());
+      stream.data.pipe(res);
+      return;
+    }
+    
     // 백엔드로 요청 전달
     const response = await axios(axiosConfig);
     
@@ -160,8 +188,13 @@ export default async function handler(req, res) {
     }
     
     // 응답 헤더 복사 (CORS 관련 헤더 제외)
+    // axios가 압축을 풀어서 받으므로 인코딩/길이 헤더는 전달하지 않음
     Object.keys(response.headers).forEach(key => {
-      if (!key.toLowerCase().startsWith('access-control-')) {
+      const lowerKey = key.toLowerCase();
+      if (
+        !lowerKey.startsWith('access-control-') &&
+        !['content-encoding', 'content-length', 'transfer-encoding'].includes(lowerKey)
+      ) {
         res.setHeader(key, response.headers[key]);
       }
     });
@@ -173,8 +206,8 @@ export default async function handler(req, res) {
     if (response.status >= 300 && response.status < 400) {
       // 리다이렉트 응답은 그대로 전달
       res.end();
-    } else if (response.status === 204) {
-      // 204는 body 없음
+    } else if (response.status === 204 || response.status === 304) {
+      // 204/304는 body 없음
       res.end();
     } else {
       // 일반 응답은 JSON으로 변환
@@ -182,6 +215,11 @@ export default async function handler(req, res) {
     }
     
   } catch (error) {
+    // 브라우저가 SSE 연결을 닫아 요청을 취소한 경우
+    if (axios.isCancel(error)) {
+      return;
+    }
+    
     console.error('🚨 API 프록시 에러:', error);
     
     // 임시 파일 정리 (에러 발생 시에도)
@@ -118,6 +118,7 @@ export default function ReportDetailPage() {
 
   // STT 설정 상태 추가
   const [sttConfig, setSttConfig] = useState({
+    engine: 'returnzero',
     model_type: 'sommers',
     language: 'ko',
     domain: 'GENERAL',
@@ -139,6 +140,7 @@ export default function ReportDetailPage() {
   // STT 편집 상태 추가
   const [sttTranscript, setSttTranscript] = useState('');
   const [originalSttContent, setOriginalSttContent] = useState('');
+  const [sttVersion, setSttVersion] = useState(null);
   const [showSpeakerNamesInEdit, setShowSpeakerNamesInEdit] = useState(true);
   const [hasSpeakerNames, setHasSpeakerNames] = useState(false);
 
@@ -180,6 +182,7 @@ export default function ReportDetailPage() {
     setIsBatchMode(true);
     // 기본 설정으로 초기화
     setSttConfig({
+      engine: 'returnzero',
       model_type: 'sommers',
       language: 'ko',
       domain: 'GENERAL',
@@ -504,6 +507,7 @@ export default function ReportDetailPage() {
       // 원본 내용 저장
       setOriginalSttContent(content);
       setSttTranscript(content);
+      setSttVersion(data.version ?? null);
       setShowSpeakerNamesInEdit(true);
       
       openDialog('sttEdit');
@@ -529,6 +533,7 @@ export default function ReportDetailPage() {
       console.error('STT 설정 로드 실패:', err);
       // 기본값으로 설정
       setSttConfig({
+        engine: 'returnzero',
         model_type: 'sommers',
         language: 'ko',
         domain: 'GENERAL',
@@ -671,7 +676,7 @@ export default function ReportDetailPage() {
     if (!selectedAudioFile) return;
     
     setSttLoading(true);
-    const success = await actions.updateSTT(selectedAudioFile.id, sttTranscript);
+    const success = await actions.updateSTT(selectedAudioFile.id, sttTranscript, sttVersion);
     setSttLoading(false);
     
     if (success) {
@@ -679,6 +684,7 @@ export default function ReportDetailPage() {
       // 상태 초기화
       setSttTranscript('');
       setOriginalSttContent('');
+      setSttVersion(null);
       setShowSpeakerNamesInEdit(true);
       setHasSpeakerNames(false);
     }
@@ -0,0 +1,217 @@
+/**
+ * S3 직접 업로드 유틸리티
+ *
+ * API 서버에서 업로드 세션을 만들고 파일 조각(파트)을 S3에 직접 PUT한 뒤
+ * 완료 요청으로 AudioFile을 생성합니다. 오디오 데이터는 Next.js 프록시와 API 서버를 거치지 않습니다.
+ * (S3 버킷 CORS에 PUT 허용과 ETag 헤더 노출이 필요합니다 - api-server/scripts/configure_s3_cors.py)
+ *
+ * 세션 ID는 localStorage에 보관하므로, 연결이 끊기거나 창을 닫은 뒤 같은 파일을 다시 올리면
+ * S3에 이미 올라간 파트는 건너뛰고 남은 파트만 전송합니다. 파트마다 SHA-256 체크섬을 보내
+ * S3가 손상된 파트를 거부하도록 합니다.
+ */
+
+const API_BASE_URL = '/api';
+
+// 동시에 업로드할 파트 수
+const PART_CONCURRENCY = 4;
+// 파트별 재시도 횟수와 첫 재시도 대기 시간 (지수 백오프)
+const PART_RETRIES = 3;
+const PART_RETRY_DELAY = 1000;
+
+const SESSION_STORAGE_PREFIX = 'hello-sally:upload-session:';
+
+const readError = async (response, fallback) => {
+  const error = await response.json().catch(() => ({}));
+  const err = new Error(error.detail || fallback);
+  err.status = response.status;
+  return err;
+};
+
+const postJSON = (url, body) => fetch(url, {
+  method: 'POST',
+  headers: { 'Content-Type': 'application/json' },
+  body: JSON.stringify(body)
+});
+
+// 같은 보고서에 같은 파일(이름/크기/수정 시각)을 다시 올릴 때 세션을 찾기 위한 키
+const sessionStorageKey = (file, reportId) =>
+  `${SESSION_STORAGE_PREFIX}${reportId}:${file.name}:${file.size}:${file.lastModified}`;
+
+const loadSessionId = (key) => {
+  try {
+    return window.localStorage.getItem(key);
+  } catch (e) {
+    return null;
+  }
+};
+
+const saveSessionId = (key, sessionId) => {
+  try {
+    if (sessionId) {
+      window.localStorage.setItem(key, String(sessionId));
+    } else {
+      window.localStorage.removeItem(key);
+    }
+  } catch (e) {
+    // 저장소를 쓸 수 없으면 이어 올리기 없이 진행
+  }
+};
+
+// 체크섬 계산은 보안 컨텍스트(HTTPS, localhost)에서만 가능
+const canChecksum = () =>
+  typeof window !== 'undefined' && window.crypto && window.crypto.subtle;
+
+const sha256Base64 = async (blob) => {
+  const digest = await window.crypto.subtle.digest('SHA-256', await blob.arrayBuffer());
+  let binary = '';
+  new Uint8Array(digest).forEach((byte) => { binary += String.fromCharCode(byte); });
+  return window.btoa(binary);
+};
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+const putPart = (url, headers, blob, onChunkProgress) => new Promise((resolve, reject) => {
+  // fetch는 업로드 진행률을 제공하지 않으므로 XMLHttpRequest 사용
+  const xhr = new XMLHttpRequest();
+  xhr.open('PUT', url);
+  Object.entries(headers || {}).forEach(([name, value]) => xhr.setRequestHeader(name, value));
+  xhr.upload.onprogress = (e) => onChunkProgress(e.loaded);
+  xhr.onload = () => {
+    if (xhr.status >= 200 && xhr.status < 300 && xhr.getResponseHeader('ETag')) {
+      resolve();
+    } else {
+      reject(new Error(`파트 업로드 실패 (HTTP ${xhr.status})`));
+    }
+  };
+  xhr.onerror = () => reject(new Error('파트 업로드 중 네트워크 오류가 발생했습니다.'));
+  xhr.send(blob);
+});
+
+// 기존 세션을 이어서 쓸 수 있으면 상태를, 아니면 null 반환
+const resumeSession = async (sessionId) => {
+  const response = await fetch(`${API_BASE_URL}/audio-files/uploads/${sessionId}`);
+  if (!response.ok) return null;
+  const session = await response.json();
+  return ['uploading', 'completed'].includes(session.status) ? session : null;
+};
+
+const createSession = async (file, reportId, displayName, useChecksum) => {
+  const response = await postJSON(`${API_BASE_URL}/audio-files/uploads`, {
+    report_id: Number(reportId),
+    filename: file.name,
+    file_size: file.size,
+    content_type: file.type || null,
+    display_name: displayName && displayName.trim() ? displayName.trim() : null,
+    checksum_algorithm: useChecksum ? 'SHA256' : null
+  });
+  if (!response.ok) {
+    throw await readError(response, '업로드 세션을 만들 수 없습니다.');
+  }
+  const session = await response.json();
+  return {
+    ...session,
+    status: 'uploading',
+    file_size: file.size,
+    uploaded_parts: [],
+    missing_parts: Array.from({ length: session.part_count }, (_, i) => i + 1)
+  };
+};
+
+const requestPartUrl = async (session, partNumber, blob) => {
+  const part = { part_number: partNumber };
+  if (session.checksum_algorithm) {
+    part.checksum_sha256 = await sha256Base64(blob);
+  }
+  const response = await postJSON(
+    `${API_BASE_URL}/audio-files/uploads/${session.session_id}/parts`,
+    { parts: [part] }
+  );
+  if (!response.ok) {
+    throw await readError(response, '파트 업로드 URL을 발급받을 수 없습니다.');
+  }
+  const { parts } = await response.json();
+  return parts[0];
+};
+
+const uploadPartWithRetry = async (session, file, partNumber, onChunkProgress) => {
+  const start = (partNumber - 1) * session.part_size;
+  const blob = file.slice(start, Math.min(start + session.part_size, file.size));
+
+  for (let attempt = 0; ; attempt++) {
+    try {
+      // URL은 만료될 수 있으므로 시도마다 새로 발급
+      const { url, headers } = await requestPartUrl(session, partNumber, blob);
+      await putPart(url, headers, blob, onChunkProgress);
+      return;
+    } catch (err) {
+      onChunkProgress(0);
+      if (attempt >= PART_RETRIES || (err.status && err.status < 500)) throw err;
+      await sleep(PART_RETRY_DELAY * 2 ** attempt);
+    }
+  }
+};
+
+/**
+ * 파일 하나를 S3에 직접 업로드합니다. (중단된 업로드가 있으면 이어서 업로드)
+ *
+ * @param {File} file 업로드할 파일
+ * @param {number} reportId 보고서 ID
+ * @param {string} displayName 표시용 파일명 (선택)
+ * @param {function} onProgress 진행률 콜백 (0~100)
+ * @returns {Promise<object>} 생성된 AudioFile 정보
+ */
+export const uploadFileDirect = async (file, reportId, displayName, onProgress) => {
+  const storageKey = sessionStorageKey(file, reportId);
+  const storedSessionId = loadSessionId(storageKey);
+
+  let session = storedSessionId ? await resumeSession(storedSessionId) : null;
+  if (!session) {
+    session = await createSession(file, reportId, displayName, canChecksum());
+    saveSessionId(storageKey, session.session_id);
+  } else if (session.status === 'uploading' && session.checksum_algorithm && !canChecksum()) {
+    throw new Error('이 환경에서는 체크섬을 계산할 수 없어 업로드를 이어갈 수 없습니다.');
+  }
+
+  if (session.status === 'uploading') {
+    // 이미 올라간 파트는 진행률에 포함하고 빠진 파트만 전송
+    const loaded = {};
+    (session.uploaded_parts || []).forEach((part) => { loaded[part.part_number] = part.size; });
+    const reportProgress = () => {
+      if (!onProgress) return;
+      const total = Object.values(loaded).reduce((sum, bytes) => sum + bytes, 0);
+      onProgress(Math.min(100, Math.round((total / file.size) * 100)));
+    };
+    reportProgress();
+
+    const queue = [...session.missing_parts];
+    const worker = async () => {
+      while (queue.length > 0) {
+        const partNumber = queue.shift();
+        await uploadPartWithRetry(session, file, partNumber, (bytes) => {
+          loaded[partNumber] = bytes;
+          reportProgress();
+        });
+      }
+    };
+    // 실패해도 세션은 남겨 두어 다시 시도하면 이어서 업로드
+    await Promise.all(
+      Array.from({ length: Math.min(PART_CONCURRENCY, queue.length) }, worker)
+    );
+  }
+
+  // 파트 목록 없이 완료 요청 → 서버가 S3에 올라간 파트로 조립
+  const completeResponse = await postJSON(
+    `${API_BASE_URL}/audio-files/uploads/${session.session_id}/complete`,
+    {}
+  );
+  if (!completeResponse.ok) {
+    const err = await readError(completeResponse, '업로드 완료 처리에 실패했습니다.');
+    if (err.status === 409 || err.status === 410) {
+      // 취소/만료된 세션은 다음 시도에서 새로 시작
+      saveSessionId(storageKey, null);
+    }
+    throw err;
+  }
+  saveSessionId(storageKey, null);
+  return completeResponse.json();
+};
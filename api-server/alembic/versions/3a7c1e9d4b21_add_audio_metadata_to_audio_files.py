@@ -0,0 +1,36 @@
+"""add_audio_metadata_to_audio_files
+
+Revision ID: 3a7c1e9d4b21
+Revises: remove_published_reports
+Create Date: 2026-10-19 09:12:31.418204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a7c1e9d4b21'
+down_revision = 'remove_published_reports'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('audio_files', sa.Column('duration_ms', sa.Integer(), nullable=True))
+    op.add_column('audio_files', sa.Column('codec', sa.String(length=50), nullable=True))
+    op.add_column('audio_files', sa.Column('sample_rate', sa.Integer(), nullable=True))
+    op.add_column('audio_files', sa.Column('channels', sa.Integer(), nullable=True))
+    op.add_column('audio_files', sa.Column('bit_rate', sa.Integer(), nullable=True))
+    op.add_column('audio_files', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_audio_files_content_hash'), 'audio_files', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_audio_files_content_hash'), table_name='audio_files')
+    op.drop_column('audio_files', 'content_hash')
+    op.drop_column('audio_files', 'bit_rate')
+    op.drop_column('audio_files', 'channels')
+    op.drop_column('audio_files', 'sample_rate')
+    op.drop_column('audio_files', 'codec')
+    op.drop_column('audio_files', 'duration_ms')
@@ -0,0 +1,27 @@
+"""add_checksum_algorithm_to_upload_sessions
+
+Revision ID: 3f9c7a1e5d20
+Revises: d84a2f6c1b37
+Create Date: 2026-10-19 17:52:38.104297
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9c7a1e5d20'
+down_revision = 'd84a2f6c1b37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('upload_sessions', sa.Column('checksum_algorithm', sa.String(length=20), nullable=True))
+    # 만료 세션 정리 시 상태/생성 시각으로 조회
+    op.create_index('ix_upload_sessions_status_created_at', 'upload_sessions', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_upload_sessions_status_created_at', table_name='upload_sessions')
+    op.drop_column('upload_sessions', 'checksum_algorithm')
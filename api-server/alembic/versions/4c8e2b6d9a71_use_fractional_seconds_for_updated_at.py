@@ -0,0 +1,40 @@
+"""use_fractional_seconds_for_updated_at
+
+Revision ID: 4c8e2b6d9a71
+Revises: e27a9c4f6b18
+Create Date: 2026-10-19 23:05:31.527184
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision = '4c8e2b6d9a71'
+down_revision = 'e27a9c4f6b18'
+branch_labels = None
+depends_on = None
+
+# 조회 응답 ETag 계산에 쓰는 updated_at 컬럼 (같은 초 안의 변경도 구분되도록 마이크로초까지 저장)
+TABLES = ['reports', 'audio_files', 'transcripts', 'stt_configs', 'ai_prompts_for_report']
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table, 'updated_at',
+            existing_type=sa.DateTime(),
+            type_=mysql.DATETIME(fsp=6),
+            existing_nullable=True
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table, 'updated_at',
+            existing_type=mysql.DATETIME(fsp=6),
+            type_=sa.DateTime(),
+            existing_nullable=True
+        )
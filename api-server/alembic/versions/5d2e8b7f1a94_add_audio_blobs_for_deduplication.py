@@ -0,0 +1,39 @@
+"""add_audio_blobs_for_deduplication
+
+Revision ID: 5d2e8b7f1a94
+Revises: c81f5a2e6d03
+Create Date: 2026-10-19 11:27:05.306518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2e8b7f1a94'
+down_revision = 'c81f5a2e6d03'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('audio_blobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('s3_url', sa.String(length=500), nullable=False),
+    sa.Column('file_size', sa.Integer(), nullable=True),
+    sa.Column('ref_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('content_hash')
+    )
+    op.create_index(op.f('ix_audio_blobs_id'), 'audio_blobs', ['id'], unique=False)
+    op.add_column('audio_files', sa.Column('blob_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('fk_audio_files_blob_id', 'audio_files', 'audio_blobs', ['blob_id'], ['id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_audio_files_blob_id', 'audio_files', type_='foreignkey')
+    op.drop_column('audio_files', 'blob_id')
+    op.drop_index(op.f('ix_audio_blobs_id'), table_name='audio_blobs')
+    op.drop_table('audio_blobs')
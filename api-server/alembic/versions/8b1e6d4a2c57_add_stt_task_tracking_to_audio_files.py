@@ -0,0 +1,35 @@
+"""add_stt_task_tracking_to_audio_files
+
+Revision ID: 8b1e6d4a2c57
+Revises: 3f9c7a1e5d20
+Create Date: 2026-10-19 19:41:07.518342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b1e6d4a2c57'
+down_revision = '3f9c7a1e5d20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('audio_files', sa.Column('stt_task_id', sa.String(length=100), nullable=True))
+    op.add_column('audio_files', sa.Column('stt_segment_tasks', sa.JSON(), nullable=True))
+    op.add_column('audio_files', sa.Column('stt_submitted_at', sa.DateTime(), nullable=True))
+    op.add_column('audio_files', sa.Column('stt_config_hash', sa.String(length=64), nullable=True))
+    op.add_column('audio_files', sa.Column('stt_heartbeat_at', sa.DateTime(), nullable=True))
+    # 재시작 후 주인 없는 processing 파일 조회용
+    op.create_index('ix_audio_files_stt_status_heartbeat', 'audio_files', ['stt_status', 'stt_heartbeat_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audio_files_stt_status_heartbeat', table_name='audio_files')
+    op.drop_column('audio_files', 'stt_heartbeat_at')
+    op.drop_column('audio_files', 'stt_config_hash')
+    op.drop_column('audio_files', 'stt_submitted_at')
+    op.drop_column('audio_files', 'stt_segment_tasks')
+    op.drop_column('audio_files', 'stt_task_id')
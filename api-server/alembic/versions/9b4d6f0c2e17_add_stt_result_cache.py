@@ -0,0 +1,39 @@
+"""add_stt_result_cache
+
+Revision ID: 9b4d6f0c2e17
+Revises: 5d2e8b7f1a94
+Create Date: 2026-10-19 13:41:18.592370
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b4d6f0c2e17'
+down_revision = '5d2e8b7f1a94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('stt_result_cache',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('cache_key', sa.String(length=64), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('provider_config', sa.JSON(), nullable=False),
+    sa.Column('raw_result', sa.JSON(), nullable=False),
+    sa.Column('hit_count', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('last_used_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('cache_key')
+    )
+    op.create_index(op.f('ix_stt_result_cache_id'), 'stt_result_cache', ['id'], unique=False)
+    op.create_index(op.f('ix_stt_result_cache_content_hash'), 'stt_result_cache', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_stt_result_cache_content_hash'), table_name='stt_result_cache')
+    op.drop_index(op.f('ix_stt_result_cache_id'), table_name='stt_result_cache')
+    op.drop_table('stt_result_cache')
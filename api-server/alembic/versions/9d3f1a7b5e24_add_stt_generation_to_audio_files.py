@@ -0,0 +1,24 @@
+"""add_stt_generation_to_audio_files
+
+Revision ID: 9d3f1a7b5e24
+Revises: 4c8e2b6d9a71
+Create Date: 2026-10-19 23:41:09.318562
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d3f1a7b5e24'
+down_revision = '4c8e2b6d9a71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('audio_files', sa.Column('stt_generation', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('audio_files', 'stt_generation')
@@ -0,0 +1,28 @@
+"""add_updated_at_to_audio_files
+
+Revision ID: a4e7c9d2f318
+Revises: 9b4d6f0c2e17
+Create Date: 2026-10-19 14:21:08.415327
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4e7c9d2f318'
+down_revision = '9b4d6f0c2e17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('audio_files', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    # 기존 행은 마지막으로 알 수 있는 변경 시각으로 채움
+    op.execute(
+        "UPDATE audio_files SET updated_at = COALESCE(stt_processed_at, uploaded_at)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('audio_files', 'updated_at')
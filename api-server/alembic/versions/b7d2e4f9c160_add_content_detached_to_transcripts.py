@@ -0,0 +1,26 @@
+"""add_content_detached_to_transcripts
+
+Revision ID: b7d2e4f9c160
+Revises: f1c5a7e39b04
+Create Date: 2026-10-19 16:20:45.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2e4f9c160'
+down_revision = 'f1c5a7e39b04'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('transcripts', sa.Column('content_detached', sa.Boolean(), server_default='0', nullable=False))
+    # 지금까지의 편집은 모두 본문 전체 편집
+    op.execute("UPDATE transcripts SET content_detached = 1 WHERE is_edited = 1")
+
+
+def downgrade() -> None:
+    op.drop_column('transcripts', 'content_detached')
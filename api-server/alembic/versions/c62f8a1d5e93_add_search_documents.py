@@ -0,0 +1,56 @@
+"""add_search_documents
+
+Revision ID: c62f8a1d5e93
+Revises: b7d2e4f9c160
+Create Date: 2026-10-19 16:57:30.248519
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c62f8a1d5e93'
+down_revision = 'b7d2e4f9c160'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('search_documents',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('source_type', sa.String(length=20), nullable=False),
+    sa.Column('report_id', sa.Integer(), nullable=False),
+    sa.Column('audio_file_id', sa.Integer(), nullable=True),
+    sa.Column('transcript_id', sa.Integer(), nullable=True),
+    sa.Column('report_data_id', sa.Integer(), nullable=True),
+    sa.Column('position', sa.Integer(), nullable=True),
+    sa.Column('field', sa.String(length=255), nullable=True),
+    sa.Column('speaker', sa.String(length=50), nullable=True),
+    sa.Column('start_at', sa.Integer(), nullable=True),
+    sa.Column('end_at', sa.Integer(), nullable=True),
+    sa.Column('body', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['report_id'], ['reports.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['audio_file_id'], ['audio_files.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['transcript_id'], ['transcripts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['report_data_id'], ['report_data.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_search_documents_id'), 'search_documents', ['id'], unique=False)
+    op.create_index(op.f('ix_search_documents_report_id'), 'search_documents', ['report_id'], unique=False)
+    op.create_index(op.f('ix_search_documents_transcript_id'), 'search_documents', ['transcript_id'], unique=False)
+    op.create_index(op.f('ix_search_documents_report_data_id'), 'search_documents', ['report_data_id'], unique=False)
+    # 한국어 검색을 위한 ngram 파서 FULLTEXT 인덱스 (토큰 크기는 ngram_token_size, 기본 2)
+    op.execute(
+        "CREATE FULLTEXT INDEX ft_search_documents_body "
+        "ON search_documents (body) WITH PARSER ngram"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ft_search_documents_body', table_name='search_documents')
+    op.drop_index(op.f('ix_search_documents_report_data_id'), table_name='search_documents')
+    op.drop_index(op.f('ix_search_documents_transcript_id'), table_name='search_documents')
+    op.drop_index(op.f('ix_search_documents_report_id'), table_name='search_documents')
+    op.drop_index(op.f('ix_search_documents_id'), table_name='search_documents')
+    op.drop_table('search_documents')
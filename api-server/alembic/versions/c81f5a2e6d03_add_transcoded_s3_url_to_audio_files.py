@@ -0,0 +1,24 @@
+"""add_transcoded_s3_url_to_audio_files
+
+Revision ID: c81f5a2e6d03
+Revises: 3a7c1e9d4b21
+Create Date: 2026-10-19 10:03:52.771940
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c81f5a2e6d03'
+down_revision = '3a7c1e9d4b21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('audio_files', sa.Column('transcoded_s3_url', sa.String(length=500), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('audio_files', 'transcoded_s3_url')
@@ -0,0 +1,44 @@
+"""add_upload_sessions
+
+Revision ID: d84a2f6c1b37
+Revises: c62f8a1d5e93
+Create Date: 2026-10-19 17:24:11.530862
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd84a2f6c1b37'
+down_revision = 'c62f8a1d5e93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('upload_sessions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('report_id', sa.Integer(), nullable=False),
+    sa.Column('audio_file_id', sa.Integer(), nullable=True),
+    sa.Column('filename', sa.String(length=255), nullable=False),
+    sa.Column('display_name', sa.String(length=255), nullable=True),
+    sa.Column('content_type', sa.String(length=100), nullable=True),
+    sa.Column('file_size', sa.Integer(), nullable=False),
+    sa.Column('s3_key', sa.String(length=500), nullable=False),
+    sa.Column('s3_upload_id', sa.String(length=255), nullable=False),
+    sa.Column('part_size', sa.Integer(), nullable=False),
+    sa.Column('part_count', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['report_id'], ['reports.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['audio_file_id'], ['audio_files.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_upload_sessions_id'), 'upload_sessions', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_upload_sessions_id'), table_name='upload_sessions')
+    op.drop_table('upload_sessions')
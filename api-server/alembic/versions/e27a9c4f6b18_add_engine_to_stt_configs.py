@@ -0,0 +1,25 @@
+"""add_engine_to_stt_configs
+
+Revision ID: e27a9c4f6b18
+Revises: 8b1e6d4a2c57
+Create Date: 2026-10-19 21:12:45.206913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e27a9c4f6b18'
+down_revision = '8b1e6d4a2c57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 기존 설정은 리턴제로 엔진 사용
+    op.add_column('stt_configs', sa.Column('engine', sa.String(length=20), server_default='returnzero', nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('stt_configs', 'engine')
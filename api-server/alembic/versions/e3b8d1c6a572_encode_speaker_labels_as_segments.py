@@ -0,0 +1,64 @@
+"""encode_speaker_labels_as_segments
+
+Revision ID: e3b8d1c6a572
+Revises: a4e7c9d2f318
+Create Date: 2026-10-19 15:02:37.184906
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from app.services.transcript_codec import (
+    encode_speaker_labels, decode_speaker_labels
+)
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3b8d1c6a572'
+down_revision = 'a4e7c9d2f318'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 200
+
+
+def _convert(select_sql: str, update_sql: str, convert) -> None:
+    """id 순서로 배치 단위 변환 (긴 Transcript가 많아도 메모리 사용량 제한)"""
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(select_sql), {"last_id": last_id, "limit": BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            break
+        for row_id, value in rows:
+            bind.execute(sa.text(update_sql), {"id": row_id, "value": convert(value)})
+            last_id = row_id
+
+
+def upgrade() -> None:
+    op.add_column('transcripts', sa.Column('speaker_segments', mysql.LONGBLOB(), nullable=True))
+    _convert(
+        "SELECT id, speaker_labels FROM transcripts "
+        "WHERE id > :last_id AND speaker_labels IS NOT NULL ORDER BY id LIMIT :limit",
+        "UPDATE transcripts SET speaker_segments = :value WHERE id = :id",
+        lambda value: encode_speaker_labels(
+            json.loads(value) if isinstance(value, str) else value
+        ),
+    )
+    op.drop_column('transcripts', 'speaker_labels')
+
+
+def downgrade() -> None:
+    op.add_column('transcripts', sa.Column('speaker_labels', sa.JSON(), nullable=True))
+    _convert(
+        "SELECT id, speaker_segments FROM transcripts "
+        "WHERE id > :last_id AND speaker_segments IS NOT NULL ORDER BY id LIMIT :limit",
+        "UPDATE transcripts SET speaker_labels = :value WHERE id = :id",
+        lambda value: json.dumps(decode_speaker_labels(value), ensure_ascii=False),
+    )
+    op.drop_column('transcripts', 'speaker_segments')
@@ -0,0 +1,24 @@
+"""add_content_version_to_transcripts
+
+Revision ID: f1c5a7e39b04
+Revises: e3b8d1c6a572
+Create Date: 2026-10-19 15:48:12.630571
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1c5a7e39b04'
+down_revision = 'e3b8d1c6a572'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('transcripts', sa.Column('content_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('transcripts', 'content_version')
@@ -1,12 +1,21 @@
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Text, Boolean, ForeignKey, JSON, Float
+    Column, Integer, String, DateTime, Text, Boolean, ForeignKey, JSON, Float,
+    LargeBinary, Index
 )
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 import datetime
 
+from app.services.transcript_codec import (
+    encode_speaker_labels, decode_speaker_labels
+)
+
 Base = declarative_base()
 
+# 조회 응답 ETag 계산용 수정 시각 (같은 초 안의 여러 변경도 구분되도록 MySQL에서는 마이크로초까지 저장)
+PreciseDateTime = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")
+
 
 class Report(Base):
     __tablename__ = "reports"
@@ -17,7 +26,7 @@ class Report(Base):
     status = Column(String(50), default="draft")  # draft, analyzing, completed
     user_id = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    updated_at = Column(PreciseDateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
     
     # Relationships
     audio_files = relationship(
@@ -37,14 +46,38 @@ class AudioFile(Base):
     s3_url = Column(String(500), nullable=False)
     file_size = Column(Integer, nullable=True)
     duration = Column(Integer, nullable=True)  # 초 단위
+    
+    # 업로드 시점에 추출한 오디오 메타데이터
+    duration_ms = Column(Integer, nullable=True)  # 밀리초 단위 정확한 길이
+    codec = Column(String(50), nullable=True)  # ffprobe 코덱명 (mp3, aac, pcm_s16le 등)
+    sample_rate = Column(Integer, nullable=True)  # Hz
+    channels = Column(Integer, nullable=True)
+    bit_rate = Column(Integer, nullable=True)  # bps
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256
+    transcoded_s3_url = Column(String(500), nullable=True)  # STT용 16kHz 모노 파생 파일
+    blob_id = Column(Integer, ForeignKey("audio_blobs.id"), nullable=True)  # 중복 제거된 S3 원본
     upload_status = Column(String(50), default="uploaded")  # uploaded, processing, completed, failed
     uploaded_at = Column(DateTime, default=datetime.datetime.utcnow)
+    updated_at = Column(
+        PreciseDateTime, 
+        default=datetime.datetime.utcnow, 
+        onupdate=datetime.datetime.utcnow
+    )  # 조회 응답 ETag 계산용
     
     # STT 관련 필드
     stt_status = Column(String(50), default="pending")  # pending, processing, completed, failed
     stt_processed_at = Column(DateTime, nullable=True)
     stt_error_message = Column(Text, nullable=True)
     
+    # 진행 중인 리턴제로 작업 (재시작 후 같은 작업을 이어서 폴링하기 위해 저장, 완료/실패 시 비움)
+    stt_task_id = Column(String(100), nullable=True)
+    stt_segment_tasks = Column(JSON, nullable=True)  # 분할 처리 시 {"segments": [...], "tasks": {index: task_id}}
+    stt_submitted_at = Column(DateTime, nullable=True)
+    stt_config_hash = Column(String(64), nullable=True)  # 작업 전송 시 STT 설정 해시
+    stt_heartbeat_at = Column(DateTime, nullable=True)  # 작업을 가진 프로세스가 주기적으로 갱신
+    # STT를 시작/재시작할 때마다 증가 (이전 세대의 작업은 결과/상태를 저장하지 않음)
+    stt_generation = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Relationships
     report = relationship("Report", back_populates="audio_files")
     transcript = relationship(
@@ -55,29 +88,60 @@ class AudioFile(Base):
         "STTConfig", back_populates="audio_file", uselist=False, 
         cascade="all, delete-orphan"
     )
+    blob = relationship("AudioBlob", back_populates="audio_files")
+
+
+class AudioBlob(Base):
+    """내용 해시 기준으로 중복 제거된 S3 오디오 원본 (참조 카운트 관리)"""
+    __tablename__ = "audio_blobs"
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), nullable=False, unique=True)  # SHA-256
+    s3_url = Column(String(500), nullable=False)
+    file_size = Column(Integer, nullable=True)
+    ref_count = Column(Integer, nullable=False, default=1)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    
+    # Relationships
+    audio_files = relationship("AudioFile", back_populates="blob")
 
 
 class Transcript(Base):
     __tablename__ = "transcripts"
     id = Column(Integer, primary_key=True, index=True)
     audio_file_id = Column(Integer, ForeignKey("audio_files.id"), nullable=False)
-    content = Column(Text, nullable=False)
+    # 본문은 지연 로딩 (상태 확인 등 transcript 존재 여부만 필요할 때 본문을 읽지 않음)
+    content = deferred(Column(Text, nullable=False))
     confidence_score = Column(Integer, nullable=True)  # 0-100
     is_edited = Column(Boolean, default=False)
+    # 본문 전체를 직접 편집하여 content가 speaker_labels와 달라졌는지 여부
+    content_detached = Column(Boolean, nullable=False, default=False, server_default="0")
+    # 본문/발화가 바뀔 때마다 증가 (렌더링 캐시 키, 편집 낙관적 동시성 제어, 화자 이름 변경에는 증가하지 않음)
+    content_version = Column(Integer, nullable=False, default=0, server_default="0")
     
     # 화자 분리 관련 필드
-    speaker_labels = Column(JSON, nullable=True)  # 화자별 텍스트 세그먼트
+    # 화자별 텍스트 세그먼트 (열 단위 압축 인코딩, speaker_labels 속성으로 읽고 씀)
+    speaker_segments = deferred(Column(LargeBinary(length=(2 ** 32) - 1), nullable=True))
     speaker_names = Column(JSON, nullable=True)  # 화자 이름 매핑 {"speaker1": "부모", "speaker2": "아이"}
     
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(
-        DateTime, 
+        PreciseDateTime, 
         default=datetime.datetime.utcnow, 
         onupdate=datetime.datetime.utcnow
     )
     
     # Relationships
     audio_file = relationship("AudioFile", back_populates="transcript")
+    
+    @property
+    def speaker_labels(self):
+        """화자별 텍스트 세그먼트 [{"speaker", "text", "start_at", "end_at"}, ...]"""
+        return decode_speaker_labels(self.speaker_segments)
+    
+    @speaker_labels.setter
+    def speaker_labels(self, value):
+        self.speaker_segments = encode_speaker_labels(value)
+        self.content_version = (self.content_version or 0) + 1
 
 
 class AIPromptForReport(Base):
@@ -89,7 +153,7 @@ class AIPromptForReport(Base):
     is_default = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(
-        DateTime, 
+        PreciseDateTime, 
         default=datetime.datetime.utcnow, 
         onupdate=datetime.datetime.utcnow
     )
@@ -117,7 +181,8 @@ class STTConfig(Base):
     audio_file_id = Column(Integer, ForeignKey("audio_files.id"), nullable=False)
     
     # 모델 설정
-    model_type = Column(String(50), default="sommers")  # sommers, whisper
+    engine = Column(String(20), default="returnzero")  # returnzero, local (로컬 CPU faster-whisper)
+    model_type = Column(String(50), default="sommers")  # sommers, whisper (리턴제로 엔진일 때만)
     language = Column(String(10), default="ko")  # ko, detect, multi 등 (whisper 모델일 때만)
     language_candidates = Column(JSON, nullable=True)  # 언어 감지 후보군
     
@@ -137,10 +202,91 @@ class STTConfig(Base):
     
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(
-        DateTime, 
+        PreciseDateTime, 
         default=datetime.datetime.utcnow, 
         onupdate=datetime.datetime.utcnow
     )
     
     # Relationships
-    audio_file = relationship("AudioFile", back_populates="stt_config") 
\ No newline at end of file
+    audio_file = relationship("AudioFile", back_populates="stt_config") 
+
+class STTResultCache(Base):
+    """오디오 내용 해시 + 정규화된 STT 설정 기준 리턴제로 원본 결과 캐시"""
+    __tablename__ = "stt_result_cache"
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), nullable=False, unique=True)  # SHA-256
+    content_hash = Column(String(64), nullable=False, index=True)
+    provider_config = Column(JSON, nullable=False)  # 정규화된 STT 설정
+    raw_result = Column(JSON, nullable=False)  # 리턴제로 원본 응답
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    last_used_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+
+class UploadSession(Base):
+    """
+    브라우저에서 S3로 직접 업로드하는 멀티파트 업로드 세션
+
+    업로드된 파트는 S3가 보관하므로 연결이 끊겨도 같은 세션으로 남은 파트만 이어 올릴 수 있습니다.
+    완료되면 audio_file_id에 생성된 AudioFile이 연결됩니다.
+    """
+    __tablename__ = "upload_sessions"
+    id = Column(Integer, primary_key=True, index=True)
+    report_id = Column(
+        Integer, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False
+    )
+    audio_file_id = Column(
+        Integer, ForeignKey("audio_files.id", ondelete="SET NULL"), nullable=True
+    )
+    filename = Column(String(255), nullable=False)
+    display_name = Column(String(255), nullable=True)
+    content_type = Column(String(100), nullable=True)
+    file_size = Column(Integer, nullable=False)  # bytes (완료 시 S3 객체 크기와 비교)
+    s3_key = Column(String(500), nullable=False)
+    s3_upload_id = Column(String(255), nullable=False)  # S3 멀티파트 업로드 ID
+    part_size = Column(Integer, nullable=False)
+    part_count = Column(Integer, nullable=False)
+    checksum_algorithm = Column(String(20), nullable=True)  # SHA256이면 S3가 파트별 체크섬 검증
+    status = Column(String(20), nullable=False, default="uploading")  # uploading, completed, aborted
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        Index("ix_upload_sessions_status_created_at", "status", "created_at"),
+    )
+
+
+class SearchDocument(Base):
+    """
+    검색 색인 문서 (발화/본문 줄/AI 분석 필드 단위)
+
+    body에 ngram 파서 FULLTEXT 인덱스가 있으며, 원본 행이 삭제되면 함께 삭제됩니다.
+    """
+    __tablename__ = "search_documents"
+    id = Column(Integer, primary_key=True, index=True)
+    source_type = Column(String(20), nullable=False)  # utterance, line, analysis
+    report_id = Column(
+        Integer, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    audio_file_id = Column(
+        Integer, ForeignKey("audio_files.id", ondelete="CASCADE"), nullable=True
+    )
+    transcript_id = Column(
+        Integer, ForeignKey("transcripts.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+    report_data_id = Column(
+        Integer, ForeignKey("report_data.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+    position = Column(Integer, nullable=True)  # 발화 인덱스 또는 줄 번호
+    field = Column(String(255), nullable=True)  # AI 분석 결과 필드 경로
+    speaker = Column(String(50), nullable=True)
+    start_at = Column(Integer, nullable=True)  # 밀리초
+    end_at = Column(Integer, nullable=True)  # 밀리초
+    body = Column(Text, nullable=False)
+    
+    __table_args__ = (
+        Index(
+            "ft_search_documents_body", "body",
+            mysql_prefix="FULLTEXT", mysql_with_parser="ngram"
+        ),
+    )
@@ -1,9 +1,7 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 import os
 from dotenv import load_dotenv
-import time
-import logging
 
 # .env 파일에서 환경변수 로드
 load_dotenv()
@@ -11,6 +9,11 @@ load_dotenv()
 # 환경 설정 (development/production)
 ENV = os.getenv("ENV", "development")
 
+# 워커 프로세스별 커넥션 풀 설정 (gunicorn.conf.py에서 워커 수에 맞게 조정)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 초
+
 def get_db_url():
     if ENV == "production":
         # 운영 환경 - AWS RDS MySQL
@@ -31,32 +34,18 @@ def get_db_url():
         
         return f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
 
-# DB 연결 시도 (최대 5번, 각 시도 간 3초 대기)
-def create_db_engine(max_retries=5, retry_interval=3):
-    db_url = get_db_url()
-    retries = 0
-    
-    while retries < max_retries:
-        try:
-            print(f"DB 연결 시도 {retries+1}/{max_retries}: {db_url}")
-            engine = create_engine(db_url)
-            # 테스트 쿼리 실행 (SQLAlchemy 2.0+ 호환 방식)
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-                conn.commit()
-            print("DB 연결 성공!")
-            return engine
-        except Exception as e:
-            print(f"DB 연결 실패: {e}")
-            retries += 1
-            if retries < max_retries:
-                print(f"{retry_interval}초 후 재시도...")
-                time.sleep(retry_interval)
-    
-    # 최대 재시도 횟수 초과
-    raise Exception(f"DB 연결 실패: 최대 시도 횟수({max_retries})를 초과했습니다.")
+# DB 엔진 생성 (연결은 첫 요청 시 지연 생성, pool_pre_ping으로 끊긴 연결 재연결)
+# DB 대기/마이그레이션은 배포 시 scripts/migrate.py에서 1회 수행
+def create_db_engine():
+    return create_engine(
+        get_db_url(),
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True
+    )
 
-# 연결 시도
+# 엔진 생성
 engine = create_db_engine()
 
 # 세션 생성
@@ -1,12 +1,20 @@
+import os
 import logging
 import uvicorn
-from fastapi import FastAPI, Request, HTTPException
+from typing import Optional, Dict
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
+from brotli_asgi import BrotliMiddleware
 
-from app.routers import auth, audio_files, reports, ai_prompts_for_report
+from app.routers import (
+    auth, audio_files, reports, ai_prompts_for_report, search, admin
+)
 from app.db.models import Base
 from app.db.session import engine
+from app.services.stt_reconciler import start_stt_maintenance
+from app.services.batch_upload import BATCH_UPLOAD_MAX_TOTAL_SIZE
 
 # 로깅 설정 - 디버깅을 위해 DEBUG 레벨로 설정
 logging.basicConfig(
@@ -37,23 +45,65 @@ app.add_middleware(
 
 # 요청 크기 제한 미들웨어 추가
 class RequestSizeMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, max_size: int = 100 * 1024 * 1024):  # 100MB
+    """
+    Content-Length 기준 요청 본문 크기 제한 (경로별로 다른 제한을 둘 수 있음)
+    
+    미들웨어에서 발생한 HTTPException은 처리되지 않아 500이 되므로 413 응답을 직접 반환합니다.
+    """
+    def __init__(
+        self,
+        app,
+        max_size: int = 100 * 1024 * 1024,  # 100MB
+        path_limits: Optional[Dict[str, int]] = None
+    ):
         super().__init__(app)
         self.max_size = max_size
+        self.path_limits = path_limits or {}
 
     async def dispatch(self, request: Request, call_next):
         if request.method in ["POST", "PUT", "PATCH"]:
+            max_size = self.path_limits.get(request.url.path, self.max_size)
             content_length = request.headers.get("content-length")
-            if content_length and int(content_length) > self.max_size:
-                raise HTTPException(
-                    status_code=413, 
-                    detail="Request entity too large"
+            if content_length and int(content_length) > max_size:
+                return JSONResponse(
+                    status_code=413,
+                    content={
+                        "detail": f"Request entity too large (최대 {max_size // (1024 * 1024)}MB)"
+                    }
                 )
         
         response = await call_next(request)
         return response
 
-app.add_middleware(RequestSizeMiddleware)
+# 일괄 업로드는 여러 파일을 한 요청으로 받으므로 전체 크기 제한을 따로 적용
+app.add_middleware(
+    RequestSizeMiddleware,
+    path_limits={"/audio-files/batch": BATCH_UPLOAD_MAX_TOTAL_SIZE}
+)
+
+# 응답 압축 설정 (Accept-Encoding에 따라 brotli, 미지원 클라이언트는 gzip)
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))  # bytes
+
+
+class CompressionMiddleware:
+    """
+    일정 크기 이상의 응답을 brotli/gzip으로 압축
+    
+    압축 미들웨어는 스트림을 버퍼링하므로 SSE(/events) 응답은 압축하지 않습니다.
+    """
+    def __init__(self, app, minimum_size: int = COMPRESSION_MINIMUM_SIZE):
+        self.app = app
+        self.compressed_app = BrotliMiddleware(
+            app, minimum_size=minimum_size, gzip_fallback=True
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not scope["path"].endswith("/events"):
+            await self.compressed_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+app.add_middleware(CompressionMiddleware)
 
 # DB 테이블은 Alembic 마이그레이션으로 관리
 # Base.metadata.create_all(bind=engine)  # Alembic 사용으로 주석 처리
@@ -74,6 +124,22 @@ app.include_router(
     prefix="/ai-prompts-for-report",
     tags=["AI Prompts for Report"]
 )
+app.include_router(
+    search.router,
+    prefix="/search",
+    tags=["Search"]
+)
+app.include_router(
+    admin.router,
+    prefix="/admin",
+    tags=["Admin"]
+)
+
+@app.on_event("startup")
+def resume_stt_jobs():
+    # 재시작 전에 처리 중이던 STT 작업 재등록 및 heartbeat 갱신 시작
+    start_stt_maintenance()
+
 
 @app.get("/")
 def root():
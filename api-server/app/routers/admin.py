@@ -0,0 +1,80 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from app.schemas.audio_files import AdminBulkTranscribeRequest
+from app.services.stt_jobs import enqueue_stt_bulk
+from app.services.job_queue import stt_queue, local_stt_queue, analysis_queue
+from app.services.stt_reconciler import reconcile_orphaned_stt
+from app.services.provider_guard import PROVIDERS
+
+router = APIRouter()
+
+
+@router.post("/stt/transcribe")
+def bulk_transcribe(
+    request: AdminBulkTranscribeRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    여러 보고서의 대기/실패 상태 파일 STT 일괄 시작 (관리자용)
+    
+    대상 파일을 한 번에 골라 STT 설정을 일괄 반영하고, 일괄 작업 등급으로 스케줄러에 등록합니다.
+    대기열 자리가 부족하면 일부만 등록되며 capacity_limited가 true로 반환됩니다.
+    """
+    result = enqueue_stt_bulk(
+        db,
+        report_ids=request.report_ids,
+        statuses=request.statuses,
+        stt_config=request.stt_config,
+        limit=request.limit
+    )
+    
+    return {
+        "message": f"{result['count']}개 파일의 STT 처리가 시작되었습니다.",
+        **result,
+    }
+
+
+@router.get("/stt/queue")
+def get_stt_queue():
+    """현재 워커 프로세스의 STT 작업 큐 현황 (리턴제로 엔진)"""
+    return stt_queue.snapshot()
+
+
+@router.get("/stt/local/queue")
+def get_local_stt_queue():
+    """현재 워커 프로세스의 로컬 STT 엔진(faster-whisper) 작업 큐 현황"""
+    return local_stt_queue.snapshot()
+
+
+@router.post("/stt/reconcile")
+def reconcile_stt(db: Session = Depends(get_db)):
+    """
+    처리 중이던 프로세스가 사라진 STT 파일을 현재 워커 프로세스에 다시 등록 (관리자용)
+    
+    주기적으로 자동 실행되며, 이 엔드포인트는 즉시 한 번 더 실행합니다.
+    저장된 리턴제로 task_id가 있으면 재전송 없이 이어서 폴링합니다(resumed_polling).
+    """
+    result = reconcile_orphaned_stt(db)
+    return {
+        "message": f"{result['count']}개 파일의 STT 처리를 다시 등록했습니다.",
+        **result,
+    }
+
+
+@router.get("/analysis/queue")
+def get_analysis_queue():
+    """현재 워커 프로세스의 AI 분석 작업 큐 현황"""
+    return analysis_queue.snapshot()
+
+
+@router.get("/providers")
+def get_provider_metrics():
+    """
+    외부 API(리턴제로, OpenAI)별 차단기 상태와 호출 지표 (현재 워커 프로세스 기준)
+    
+    circuit: 상태(closed/open/half_open), 최근 실패 비율, 성공/실패/거부/차단 횟수
+    endpoints: 호출 수, 429 횟수, 재시도 수, 속도 제한으로 대기한 시간, 남은 토큰
+    """
+    return {name: provider.snapshot() for name, provider in PROVIDERS.items()}
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
@@ -9,6 +10,9 @@ from app.schemas.ai_prompts_for_report import (
     AIPromptForReportCreate, AIPromptForReportUpdate, 
     AIPromptForReportResponse, AIPromptForReportListResponse
 )
+from app.services.http_cache import (
+    build_etag, is_not_modified, set_cache_headers, not_modified_response
+)
 
 router = APIRouter()
 
@@ -36,6 +40,8 @@ def create_template(
 
 @router.get("", response_model=AIPromptForReportListResponse)
 def get_templates(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
     is_default: Optional[bool] = Query(None, description="기본 템플릿 필터"),
@@ -47,7 +53,17 @@ def get_templates(
     if is_default is not None:
         query = query.filter(AIPromptForReport.is_default == is_default)
     
-    total = query.count()
+    # 목록 버전 확인 (기본 템플릿 변경은 일괄 update로도 updated_at이 갱신됨)
+    total, max_id, last_updated = query.with_entities(
+        func.count(AIPromptForReport.id),
+        func.max(AIPromptForReport.id),
+        func.max(AIPromptForReport.updated_at),
+    ).one()
+    etag = build_etag("templates", page, size, is_default, total, max_id, last_updated)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_cache_headers(response, etag)
+    
     templates = query.order_by(AIPromptForReport.created_at.desc()).offset(
         (page - 1) * size
     ).limit(size).all()
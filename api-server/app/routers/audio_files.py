@@ -1,23 +1,109 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, status, Form
+from fastapi import (
+    APIRouter, UploadFile, File, HTTPException, Depends, status, Form, Query,
+    Request, Response
+)
 import os
+import json
+import logging
+import mimetypes
 from app.services.s3 import (
-    upload_file_to_s3,
     delete_file_from_s3,
     generate_presigned_url_for_download,
+    build_unique_key,
+    build_s3_direct_url,
+    create_multipart_upload,
+    generate_presigned_part_url,
+    complete_multipart_upload,
+    abort_multipart_upload,
+    list_uploaded_parts,
+    head_s3_object,
+)
+from app.services.dedup import (
+    acquire_blob,
+    release_blob,
+    delete_released_objects,
+    acquire_blobs,
+)
+from app.services.batch_upload import (
+    BATCH_UPLOAD_MAX_FILES,
+    BATCH_UPLOAD_MAX_FILE_SIZE,
+    probe_files,
+    upload_files,
+    delete_uploaded,
+)
+from app.services.stt_events import publish_stt_status
+from app.services.stt_jobs import (
+    STT_CONFIG_FIELDS,
+    build_stt_config_dict,
+    clear_stt_task,
+    start_stt_generation,
+    enqueue_stt,
+    get_stt_queue,
+    stt_job_key,
+)
+from app.services.job_queue import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_BULK,
+    stt_queue,
+    local_stt_queue,
+    summarize_tickets,
+)
+from app.services.transcript_codec import decode_speaker_labels_range
+from app.services.transcript_render import (
+    render_content, render_template, build_template
+)
+from app.services.http_cache import (
+    build_etag, is_not_modified, set_cache_headers, not_modified_response
+)
+from app.services.audio_utils import probe_audio_metadata, probe_remote_audio_metadata
+from app.services.direct_upload import (
+    DIRECT_UPLOAD_MAX_SIZE,
+    DIRECT_UPLOAD_URL_EXPIRES,
+    plan_parts,
+    summarize_parts,
+    finalize_direct_upload,
+)
+from app.db.models import AudioFile, Report, Transcript, STTConfig, UploadSession
+from app.schemas.audio_files import (
+    TranscriptPatch, UploadSessionCreate, UploadSessionComplete, UploadPartUrlsRequest
 )
-from app.services.stt import get_stt_service
-from app.services.audio_utils import get_audio_duration
-from app.db.models import AudioFile, Report, Transcript, STTConfig
+from app.services.search import index_safely, index_transcript
 from app.db.session import get_db
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Optional
 from datetime import datetime
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse
 from fastapi import BackgroundTasks
 
+logger = logging.getLogger(__name__)
+
 # 슬래시 리다이렉션을 방지하는 옵션 추가
 router = APIRouter(redirect_slashes=False)
 
+ALLOWED_EXTENSIONS = {".wav", ".mp3", ".m4a", ".ogg"}
+
+def build_upload_response(audio: AudioFile, s3_result: dict) -> dict:
+    """업로드된 AudioFile 응답 딕셔너리 생성"""
+    return {
+        "id": audio.id, 
+        "filename": audio.filename,
+        "display_name": audio.display_name,
+        "s3_url": s3_result["direct_url"],
+        "presigned_url": s3_result["presigned_url"],  # 사전 서명 URL 추가
+        "report_id": audio.report_id,
+        "uploaded_at": audio.uploaded_at,
+        "duration": audio.duration,
+        "duration_ms": audio.duration_ms,
+        "codec": audio.codec,
+        "sample_rate": audio.sample_rate,
+        "channels": audio.channels,
+        "bit_rate": audio.bit_rate,
+        "content_hash": audio.content_hash,
+        "file_size": audio.file_size,
+        "deduplicated": s3_result["deduplicated"],
+    }
+
 @router.get("/test")
 def test():
     return {"message": "audio files router is alive"}
@@ -29,10 +115,9 @@ def upload_audio(
     display_name: str = Form(None),
     db: Session = Depends(get_db)
 ):
-    # 파일 확장자 체크 (간단 예시: wav, mp3만 허용)
-    allowed_ext = {".wav", ".mp3", ".m4a", ".ogg"}
+    # 파일 확장자 체크
     _, ext = os.path.splitext(file.filename)
-    if ext.lower() not in allowed_ext:
+    if ext.lower() not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400, 
             detail="지원하지 않는 파일 형식입니다."
@@ -51,11 +136,18 @@ def upload_audio(
     file_size = file.file.tell()
     file.file.seek(0)  # 파일 시작으로 되돌리기
     
-    # 오디오 파일 길이 추출
-    duration = get_audio_duration(file.file, file.content_type)
+    # 오디오 메타데이터 추출 (길이, 코덱, 샘플레이트, 해시 등 - 업로드 시 1회)
+    metadata = probe_audio_metadata(file.file)
     
-    # S3 업로드
-    s3_result = upload_file_to_s3(file.file, file.filename, file.content_type)
+    # S3 업로드 (동일한 내용이 이미 있으면 기존 원본 재사용)
+    s3_result = acquire_blob(
+        db,
+        file.file,
+        file.filename,
+        file.content_type,
+        metadata["content_hash"],
+        file_size
+    )
     
     # display_name이 없으면 filename을 기본값으로 사용
     final_display_name = display_name if display_name else file.filename
@@ -66,40 +158,505 @@ def upload_audio(
         display_name=final_display_name,
         s3_url=s3_result["direct_url"],
         report_id=report_id,
-        duration=duration,
-        file_size=file_size
+        file_size=file_size,
+        blob=s3_result["blob"],
+        **metadata
     )
     db.add(audio)
     db.commit()
     db.refresh(audio)
 
     return {
-        "id": audio.id, 
-        "filename": audio.filename,
-        "display_name": audio.display_name,
-        "s3_url": s3_result["direct_url"],
-        "presigned_url": s3_result["presigned_url"],  # 사전 서명 URL 추가
-        "report_id": audio.report_id,
-        "uploaded_at": audio.uploaded_at,
-        "duration": audio.duration,
-        "file_size": audio.file_size,
+        **build_upload_response(audio, s3_result),
         "message": "S3 업로드 및 DB 저장 성공"
     }
 
-@router.get("", response_model=List[dict])
-def get_files(db: Session = Depends(get_db)):
+@router.post("/batch")
+def upload_audio_batch(
+    files: List[UploadFile] = File(...),
+    report_id: int = Form(...),
+    display_names: Optional[List[str]] = Form(None),
+    auto_transcribe: bool = Form(False),
+    stt_config: Optional[str] = Form(None, description="모든 파일에 적용할 STT 설정 (JSON)"),
+    db: Session = Depends(get_db)
+):
+    """
+    여러 음성 파일을 한 보고서에 일괄 업로드
+    
+    최대 BATCH_UPLOAD_MAX_FILES개, 파일당 BATCH_UPLOAD_MAX_FILE_SIZE, 요청 전체 BATCH_UPLOAD_MAX_TOTAL_SIZE까지
+    받으며, 넘으면 413을 반환합니다.
+    
+    메타데이터 추출과 S3 업로드를 동시에 수행하고 모든 AudioFile을 한 트랜잭션으로 저장합니다.
+    하나라도 실패하면 전체가 저장되지 않습니다. auto_transcribe가 true면 업로드 직후
+    같은 STT 설정으로 모든 파일의 STT 처리를 시작합니다.
+    """
+    if len(files) > BATCH_UPLOAD_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {BATCH_UPLOAD_MAX_FILES}개 파일까지 업로드할 수 있습니다."
+        )
+    if display_names and len(display_names) != len(files):
+        raise HTTPException(
+            status_code=400,
+            detail="display_names 개수가 파일 개수와 다릅니다."
+        )
+    
+    unsupported = [
+        file.filename for file in files
+        if os.path.splitext(file.filename)[1].lower() not in ALLOWED_EXTENSIONS
+    ]
+    if unsupported:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 파일 형식입니다: {', '.join(unsupported)}"
+        )
+    
+    shared_config = None
+    if stt_config:
+        try:
+            config_data = json.loads(stt_config)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="stt_config가 올바른 JSON이 아닙니다.")
+        if not isinstance(config_data, dict):
+            raise HTTPException(status_code=400, detail="stt_config는 JSON 객체여야 합니다.")
+        shared_config = {k: v for k, v in config_data.items() if k in STT_CONFIG_FIELDS}
+    
+    # 업로드 전에 STT 대기열 자리 확인 (일괄 작업 등급, 설정의 엔진별 대기열)
+    if auto_transcribe:
+        get_stt_queue(shared_config).ensure_capacity(PRIORITY_BULK, len(files))
+    
+    # 보고서 ID 유효성 검사 (배치 전체에 한 번)
+    report = db.query(Report).filter(Report.id == report_id).first()
+    if not report:
+        raise HTTPException(
+            status_code=404, 
+            detail="지정된 보고서를 찾을 수 없습니다."
+        )
+    
+    file_sizes = []
+    for file in files:
+        file.file.seek(0, 2)
+        file_sizes.append(file.file.tell())
+        file.file.seek(0)
+    oversized = [
+        file.filename for file, file_size in zip(files, file_sizes)
+        if file_size > BATCH_UPLOAD_MAX_FILE_SIZE
+    ]
+    if oversized:
+        raise HTTPException(
+            status_code=413,
+            detail=(
+                f"파일당 최대 {BATCH_UPLOAD_MAX_FILE_SIZE // (1024 * 1024)}MB까지 업로드할 수 있습니다: "
+                f"{', '.join(oversized)}"
+            )
+        )
+    
+    # 오디오 메타데이터 추출 (병렬)
+    metadata_list = probe_files([file.file for file in files])
+    
+    # S3 원본 확보 (배치 안/기존 원본 중복 제거 후 동시 업로드)
+    s3_results = acquire_blobs(db, [
+        {
+            "file_obj": file.file,
+            "filename": file.filename,
+            "content_type": file.content_type,
+            "content_hash": metadata["content_hash"],
+            "file_size": file_size,
+        }
+        for file, metadata, file_size in zip(files, metadata_list, file_sizes)
+    ], upload_files)
+    uploaded_urls = [
+        result["direct_url"] for result in s3_results if not result["deduplicated"]
+    ]
+    
+    try:
+        audios = []
+        for index, (file, metadata, file_size, s3_result) in enumerate(
+            zip(files, metadata_list, file_sizes, s3_results)
+        ):
+            audio = AudioFile(
+                filename=file.filename,
+                display_name=(display_names[index] if display_names else None) or file.filename,
+                s3_url=s3_result["direct_url"],
+                report_id=report_id,
+                file_size=file_size,
+                blob=s3_result["blob"],
+                **metadata
+            )
+            db.add(audio)
+            audios.append(audio)
+        
+        if auto_transcribe:
+            db.flush()
+            for audio in audios:
+                if shared_config is not None:
+                    db.add(STTConfig(audio_file_id=audio.id, **shared_config))
+                audio.stt_status = "processing"
+        
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        delete_uploaded(uploaded_urls)
+        raise HTTPException(status_code=500, detail=f"일괄 업로드 저장 실패: {str(e)}")
+    
+    tickets = []
+    if auto_transcribe:
+        for audio in audios:
+            db.refresh(audio)
+            publish_stt_status(report_id, audio)
+            tickets.append(enqueue_stt(
+                audio, build_stt_config_dict(audio), priority=PRIORITY_BULK
+            ))
+    
+    return {
+        "report_id": report_id,
+        "count": len(audios),
+        "files": [
+            build_upload_response(audio, s3_result)
+            for audio, s3_result in zip(audios, s3_results)
+        ],
+        "stt_started": auto_transcribe,
+        "queue": summarize_tickets(tickets) if auto_transcribe else None,
+        "message": f"{len(audios)}개 파일 업로드 및 DB 저장 성공"
+    }
+
+@router.post("/uploads")
+def create_upload_session(
+    upload: UploadSessionCreate,
+    db: Session = Depends(get_db)
+):
+    """
+    S3 직접 업로드 세션 생성
+    
+    S3 멀티파트 업로드를 시작하고 파트별 Pre-signed URL을 반환합니다. 클라이언트는 각 파트를
+    해당 URL로 PUT한 뒤 응답의 ETag 헤더를 모아 완료 요청을 보냅니다. 오디오 데이터는 API 서버를 거치지 않습니다.
+    """
+    _, ext = os.path.splitext(upload.filename)
+    if ext.lower() not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400, 
+            detail="지원하지 않는 파일 형식입니다."
+        )
+    if upload.file_size > DIRECT_UPLOAD_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"파일 크기는 최대 {DIRECT_UPLOAD_MAX_SIZE // (1024 * 1024)}MB까지 업로드할 수 있습니다."
+        )
+    
+    report = db.query(Report).filter(Report.id == upload.report_id).first()
+    if not report:
+        raise HTTPException(
+            status_code=404, 
+            detail="지정된 보고서를 찾을 수 없습니다."
+        )
+    
+    content_type = (
+        upload.content_type
+        or mimetypes.guess_type(upload.filename)[0]
+        or "application/octet-stream"
+    )
+    key = build_unique_key(upload.filename)
+    part_size, part_count = plan_parts(upload.file_size)
+    upload_id = create_multipart_upload(key, content_type, upload.checksum_algorithm)
+    
+    session = UploadSession(
+        report_id=upload.report_id,
+        filename=upload.filename,
+        display_name=upload.display_name,
+        content_type=content_type,
+        file_size=upload.file_size,
+        s3_key=key,
+        s3_upload_id=upload_id,
+        part_size=part_size,
+        part_count=part_count,
+        checksum_algorithm=upload.checksum_algorithm,
+        status="uploading"
+    )
+    db.add(session)
+    db.commit()
+    db.refresh(session)
+    
+    # 체크섬 세션은 파트 내용의 체크섬이 서명에 들어가므로 URL을 파트별로 따로 발급
+    parts = [] if upload.checksum_algorithm else [
+        {
+            "part_number": part_number,
+            "url": generate_presigned_part_url(
+                key, upload_id, part_number, DIRECT_UPLOAD_URL_EXPIRES
+            ),
+        }
+        for part_number in range(1, part_count + 1)
+    ]
+    
+    return {
+        "session_id": session.id,
+        "part_size": part_size,
+        "part_count": part_count,
+        "checksum_algorithm": upload.checksum_algorithm,
+        "expires_in": DIRECT_UPLOAD_URL_EXPIRES,
+        "parts": parts,
+    }
+
+
+def get_upload_session_or_404(db: Session, session_id: int) -> UploadSession:
+    session = db.query(UploadSession).filter(UploadSession.id == session_id).first()
+    if not session:
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+    return session
+
+
+@router.get("/uploads/{session_id}")
+def get_upload_session(session_id: int, db: Session = Depends(get_db)):
+    """
+    업로드 세션 상태 조회 (이어 올리기용)
+    
+    S3에 이미 올라간 파트와 빠진 파트, 다시 보내기 시작할 위치(next_offset)를 반환합니다.
+    """
+    session = get_upload_session_or_404(db, session_id)
+    
+    result = {
+        "session_id": session.id,
+        "status": session.status,
+        "report_id": session.report_id,
+        "filename": session.filename,
+        "file_size": session.file_size,
+        "part_size": session.part_size,
+        "part_count": session.part_count,
+        "checksum_algorithm": session.checksum_algorithm,
+        "audio_file_id": session.audio_file_id,
+        "created_at": session.created_at,
+    }
+    if session.status == "uploading":
+        result.update(summarize_parts(
+            session, list_uploaded_parts(session.s3_key, session.s3_upload_id)
+        ))
+    return result
+
+
+@router.post("/uploads/{session_id}/parts")
+def get_upload_part_urls(
+    session_id: int,
+    part_request: UploadPartUrlsRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    파트별 업로드 URL 발급 (이어 올리기, 만료된 URL 재발급, 체크섬 세션용)
+    
+    체크섬 세션에서는 파트 내용의 SHA-256(base64)이 필수이며, 클라이언트는 같은 값을
+    x-amz-checksum-sha256 헤더로 보내야 합니다. 내용이 다르면 S3가 파트를 거부합니다.
+    """
+    session = get_upload_session_or_404(db, session_id)
+    if session.status != "uploading":
+        raise HTTPException(
+            status_code=409,
+            detail=f"업로드 세션이 {session.status} 상태입니다."
+        )
+    
+    parts = []
+    for part in part_request.parts:
+        if part.part_number > session.part_count:
+            raise HTTPException(
+                status_code=400,
+                detail=f"파트 번호가 파트 수({session.part_count})를 넘습니다: {part.part_number}"
+            )
+        if session.checksum_algorithm and not part.checksum_sha256:
+            raise HTTPException(
+                status_code=400,
+                detail=f"체크섬 세션은 파트 체크섬이 필요합니다: {part.part_number}"
+            )
+        headers = (
+            {"x-amz-checksum-sha256": part.checksum_sha256}
+            if session.checksum_algorithm else {}
+        )
+        parts.append({
+            "part_number": part.part_number,
+            "url": generate_presigned_part_url(
+                session.s3_key,
+                session.s3_upload_id,
+                part.part_number,
+                DIRECT_UPLOAD_URL_EXPIRES,
+                checksum_sha256=part.checksum_sha256 if session.checksum_algorithm else None
+            ),
+            "headers": headers,
+        })
+    
+    return {
+        "session_id": session.id,
+        "expires_in": DIRECT_UPLOAD_URL_EXPIRES,
+        "parts": parts,
+    }
+
+
+@router.post("/uploads/{session_id}/complete")
+def complete_upload_session(
+    session_id: int,
+    completion: UploadSessionComplete,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """
+    S3 직접 업로드 완료 처리
+    
+    파트를 하나의 객체로 합친 뒤 HEAD로 크기를 확인하고, ffprobe가 Range 요청으로 필요한 구간만 읽어
+    메타데이터를 추출한 다음 AudioFile을 생성합니다. 내용 해시(중복 제거)는 응답 후 백그라운드에서 계산합니다.
+    """
+    session = db.query(UploadSession).filter(
+        UploadSession.id == session_id
+    ).with_for_update().first()
+    if not session:
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+    
+    s3_url = build_s3_direct_url(session.s3_key)
+    if session.status == "completed" and session.audio_file_id:
+        # 완료 응답을 받지 못한 클라이언트의 재요청은 같은 결과 반환
+        audio = db.query(AudioFile).filter(AudioFile.id == session.audio_file_id).first()
+        if audio:
+            return {
+                **build_upload_response(audio, {
+                    "direct_url": audio.s3_url,
+                    "presigned_url": generate_presigned_url_for_download(
+                        audio.s3_url, expires_in=3600, as_attachment=False
+                    ),
+                    "deduplicated": audio.s3_url != s3_url,
+                }),
+                "session_id": session.id,
+                "message": "이미 완료된 업로드입니다."
+            }
+    if session.status != "uploading":
+        raise HTTPException(
+            status_code=409,
+            detail=f"업로드 세션이 {session.status} 상태입니다."
+        )
+    
+    if completion.parts is None or session.checksum_algorithm:
+        # S3에 올라간 파트로 서버에서 조립 (체크섬 세션은 파트 체크섬도 함께 전달해야 함)
+        summary = summarize_parts(
+            session, list_uploaded_parts(session.s3_key, session.s3_upload_id)
+        )
+        if summary["missing_parts"]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"아직 업로드되지 않은 파트가 있습니다: {summary['missing_parts'][:20]}"
+            )
+        uploaded = summary["uploaded_parts"]
+        if completion.parts is not None:
+            client_etags = {part.part_number: part.etag for part in completion.parts}
+            if any(client_etags.get(part["part_number"]) != part["etag"] for part in uploaded):
+                raise HTTPException(status_code=400, detail="파트 ETag가 S3에 올라간 파트와 다릅니다.")
+        complete_parts = []
+        for part in uploaded:
+            complete_part = {"PartNumber": part["part_number"], "ETag": part["etag"]}
+            if part["checksum_sha256"]:
+                complete_part["ChecksumSHA256"] = part["checksum_sha256"]
+            complete_parts.append(complete_part)
+    else:
+        part_numbers = [part.part_number for part in completion.parts]
+        if sorted(set(part_numbers)) != list(range(1, session.part_count + 1)):
+            raise HTTPException(
+                status_code=400,
+                detail=f"파트 목록이 올바르지 않습니다. (필요한 파트 수: {session.part_count})"
+            )
+        complete_parts = [
+            {"PartNumber": part.part_number, "ETag": part.etag}
+            for part in sorted(completion.parts, key=lambda part: part.part_number)
+        ]
+    
+    complete_multipart_upload(session.s3_key, session.s3_upload_id, complete_parts)
+    
+    # 업로드된 객체 검증 (선언한 크기와 다르면 폐기)
+    head = head_s3_object(session.s3_key)
+    if head["ContentLength"] != session.file_size:
+        delete_file_from_s3(s3_url)
+        session.status = "aborted"
+        db.commit()
+        raise HTTPException(
+            status_code=400,
+            detail=f"업로드된 파일 크기({head['ContentLength']})가 선언한 크기({session.file_size})와 다릅니다."
+        )
+    
+    presigned_url = generate_presigned_url_for_download(
+        s3_url, expires_in=3600, as_attachment=False
+    )
+    metadata = probe_remote_audio_metadata(presigned_url)
+    
+    audio = AudioFile(
+        filename=session.filename,
+        display_name=session.display_name or session.filename,
+        s3_url=s3_url,
+        report_id=session.report_id,
+        file_size=session.file_size,
+        **metadata
+    )
+    db.add(audio)
+    db.flush()
+    session.status = "completed"
+    session.audio_file_id = audio.id
+    session.completed_at = datetime.utcnow()
+    db.commit()
+    db.refresh(audio)
+    
+    background_tasks.add_task(finalize_direct_upload, audio.id)
+    
+    return {
+        **build_upload_response(audio, {
+            "direct_url": s3_url,
+            "presigned_url": presigned_url,
+            "deduplicated": False,
+        }),
+        "session_id": session.id,
+        "message": "S3 직접 업로드 및 DB 저장 성공"
+    }
+
+
+@router.delete("/uploads/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+def abort_upload_session(session_id: int, db: Session = Depends(get_db)):
+    """S3 직접 업로드 취소 (업로드된 파트 삭제)"""
+    session = db.query(UploadSession).filter(
+        UploadSession.id == session_id
+    ).with_for_update().first()
+    if not session:
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+    
+    if session.status == "uploading":
+        abort_multipart_upload(session.s3_key, session.s3_upload_id)
+        session.status = "aborted"
+        db.commit()
+    
+    return None
+
+@router.get("", response_model=List[dict], response_class=ORJSONResponse)
+def get_files(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
     """
     업로드된 모든 음성 파일 목록 조회
     """
-    files = db.query(AudioFile).order_by(AudioFile.uploaded_at.desc()).all()
+    # 목록 전체의 버전 (파일/Transcript의 추가·수정·삭제 반영)
+    file_version = db.query(
+        func.count(AudioFile.id),
+        func.max(AudioFile.id),
+        func.max(AudioFile.updated_at),
+    ).one()
+    transcript_version = db.query(
+        func.count(Transcript.id),
+        func.max(Transcript.updated_at),
+        func.coalesce(func.sum(Transcript.content_version), 0),
+    ).one()
+    etag = build_etag("audio-files", *file_version, *transcript_version)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_cache_headers(response, etag)
+    
+    files = db.query(AudioFile).options(
+        selectinload(AudioFile.transcript).undefer(Transcript.content)
+    ).order_by(AudioFile.uploaded_at.desc()).all()
     
     # SQLAlchemy 모델을 dict 변환 (STT 상태 포함)
     result = []
     for file in files:
-        # Transcript 내용 가져오기
-        transcript_content = ""
-        if file.transcript:
-            transcript_content = file.transcript.content
+        # Transcript 내용 가져오기 (화자 이름 적용)
+        transcript_content = render_content(file.transcript)
         
         result.append({
             "id": file.id,
@@ -112,6 +669,11 @@ def get_files(db: Session = Depends(get_db)):
             "stt_processed_at": file.stt_processed_at.isoformat() if file.stt_processed_at else None,
             "stt_error_message": file.stt_error_message,
             "duration": file.duration,
+            "duration_ms": file.duration_ms,
+            "codec": file.codec,
+            "sample_rate": file.sample_rate,
+            "channels": file.channels,
+            "bit_rate": file.bit_rate,
             "file_size": file.file_size
         })
     
@@ -175,6 +737,27 @@ def get_download_url(file_id: int, db: Session = Depends(get_db)):
             detail=f"다운로드 URL 생성 실패: {str(e)}"
         )
 
+@router.get("/{file_id}/preview-url")
+def get_preview_url(file_id: int, db: Session = Depends(get_db)):
+    """
+    재생 미리보기용 사전 서명 URL 반환 (트랜스코딩된 경량 파일 우선)
+    """
+    file = db.query(AudioFile).filter(AudioFile.id == file_id).first()
+    if not file:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    
+    preview_source = file.transcoded_s3_url or file.s3_url
+    presigned_url = generate_presigned_url_for_download(
+        preview_source,
+        expires_in=600,
+        as_attachment=False
+    )
+    
+    return {
+        "preview_url": presigned_url,
+        "is_transcoded": file.transcoded_s3_url is not None
+    }
+
 @router.delete("/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_file(file_id: int, db: Session = Depends(get_db)):
     """
@@ -186,27 +769,30 @@ def delete_file(file_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
     
     try:
-        # S3에서 파일 삭제 (S3 URL 사용)
-        delete_file_from_s3(file.s3_url)
+        # S3 원본 참조 해제 (마지막 참조일 때만 원본/트랜스코딩 파생 파일 삭제)
+        released_urls = release_blob(db, file)
         
         # DB에서 파일 정보 삭제
         db.delete(file)
         db.commit()
-        
-        return None  # 204 응답은 본문이 없음
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"파일 삭제 실패: {str(e)}")
+    
+    # 커밋된 뒤에 S3 객체 삭제
+    delete_released_objects(released_urls)
+    return None  # 204 응답은 본문이 없음
 
 
 @router.post("/{file_id}/transcribe")
 def transcribe_audio(
     file_id: int, 
-    background_tasks: BackgroundTasks, 
     db: Session = Depends(get_db)
 ):
     """
-    음성 파일 STT 처리 시작 (백그라운드 작업)
+    음성 파일 STT 처리 시작 (STT 스케줄러에서 처리)
+    
+    응답의 queue에 대기 순번과 예상 시작/완료 시간(초)이 포함됩니다.
     """
     # DB에서 파일 정보 조회
     file = db.query(AudioFile).filter(AudioFile.id == file_id).first()
@@ -221,71 +807,102 @@ def transcribe_audio(
         }
     
     # STT 설정 가져오기 (없으면 기본값 사용)
-    stt_config = file.stt_config
-    if not stt_config:
-        stt_config = {
-            "model_type": "sommers",
-            "language": "ko",
-            "language_candidates": None,
-            "speaker_diarization": False,
-            "spk_count": 2,
-            "profanity_filter": False,
-            "use_disfluency_filter": True,
-            "use_paragraph_splitter": True,
-            "paragraph_max_length": 50,
-            "domain": "GENERAL",
-            "keywords": None
-        }
-    else:
-        # STTConfig 객체를 딕셔너리로 변환
-        stt_config = {
-            "model_type": stt_config.model_type,
-            "language": stt_config.language,
-            "language_candidates": stt_config.language_candidates,
-            "speaker_diarization": stt_config.speaker_diarization,
-            "spk_count": stt_config.spk_count,
-            "profanity_filter": stt_config.profanity_filter,
-            "use_disfluency_filter": stt_config.use_disfluency_filter,
-            "use_paragraph_splitter": stt_config.use_paragraph_splitter,
-            "paragraph_max_length": stt_config.paragraph_max_length,
-            "domain": stt_config.domain,
-            "keywords": stt_config.keywords
-        }
+    stt_config = build_stt_config_dict(file)
+    
+    # 대기열이 가득 차 있으면 상태를 바꾸지 않고 429 반환 (설정의 엔진별 대기열)
+    get_stt_queue(stt_config).ensure_capacity(PRIORITY_INTERACTIVE)
     
     # STT 상태를 processing으로 변경
     file.stt_status = "processing"
+    file.stt_heartbeat_at = datetime.utcnow()
+    clear_stt_task(file)
+    generation = start_stt_generation(db, file)
     db.commit()
+    publish_stt_status(file.report_id, file)
     
-    # 백그라운드에서 STT 처리 시작 (설정 포함)
-    background_tasks.add_task(
-        process_stt_background, 
-        file_id, 
-        file.s3_url, 
-        stt_config
-    )
+    # STT 스케줄러에 등록 (설정 포함)
+    ticket = enqueue_stt(file, stt_config, generation=generation)
     
     return {
         "message": "STT 처리가 시작되었습니다.",
         "file_id": file_id,
         "status": "processing",
-        "config": stt_config
+        "config": stt_config,
+        "queue": ticket
     }
 
 
-@router.get("/{file_id}/transcript")
-def get_transcript(file_id: int, db: Session = Depends(get_db)):
+@router.get("/{file_id}/queue")
+def get_stt_queue_position(file_id: int, db: Session = Depends(get_db)):
+    """
+    STT 작업 대기 순번과 예상 시작/완료 시간 조회
+    
+    스케줄러는 워커 프로세스마다 따로 있으므로, 다른 프로세스에 등록된 작업이면
+    처리 중이어도 queue가 null로 반환됩니다.
+    """
+    file = db.query(AudioFile.id, AudioFile.stt_status).filter(AudioFile.id == file_id).first()
+    if not file:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    
+    return {
+        "file_id": file_id,
+        "status": file.stt_status,
+        "queue": stt_queue.ticket(stt_job_key(file_id)) or local_stt_queue.ticket(stt_job_key(file_id)),
+    }
+
+
+@router.get("/{file_id}/transcript", response_class=ORJSONResponse)
+def get_transcript(
+    file_id: int,
+    request: Request,
+    response: Response,
+    offset: Optional[int] = Query(None, ge=0, description="발화 시작 위치 (speaker_labels 인덱스)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="가져올 발화 수"),
+    db: Session = Depends(get_db)
+):
     """
     STT 처리 결과 조회
+    
+    offset/limit을 지정하면 전체 텍스트 대신 화자별 발화(speaker_labels)를 구간 단위로 반환합니다.
     """
+    # Transcript 본문을 읽기 전에 버전만 조회
+    version = db.query(
+        AudioFile.updated_at,
+        Transcript.id,
+        Transcript.updated_at,
+        Transcript.content_version,
+    ).outerjoin(
+        Transcript, Transcript.audio_file_id == AudioFile.id
+    ).filter(AudioFile.id == file_id).first()
+    if not version:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    
+    last_modified = max(
+        (value for value in (version[0], version[2]) if value is not None),
+        default=None
+    )
+    etag = build_etag("transcript", file_id, offset, limit, *version)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified=last_modified)
+    set_cache_headers(response, etag, last_modified)
+    
     # DB에서 파일 정보 조회
     file = db.query(AudioFile).filter(AudioFile.id == file_id).first()
     if not file:
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
     
-    # Transcript 내용 가져오기
-    transcript_content = ""
-    if file.transcript:
-        transcript_content = file.transcript.content
+    if offset is not None or limit is not None:
+        return {
+            "file_id": file_id,
+            "filename": file.filename,
+            "stt_status": file.stt_status or "pending",
+            "stt_processed_at": file.stt_processed_at,
+            "stt_error_message": file.stt_error_message,
+            **get_utterance_page(db, file_id, offset or 0, limit or 100),
+        }
+    
+    # Transcript 내용 가져오기 (화자 이름 적용)
+    transcript_content = render_content(file.transcript)
     
     return {
         "file_id": file_id,
@@ -293,99 +910,174 @@ def get_transcript(file_id: int, db: Session = Depends(get_db)):
         "stt_status": file.stt_status or "pending",
         "stt_transcript": transcript_content,
         "stt_processed_at": file.stt_processed_at,
-        "stt_error_message": file.stt_error_message
+        "stt_error_message": file.stt_error_message,
+        "version": file.transcript.content_version if file.transcript else None
     }
 
 
-def process_stt_background(file_id: int, s3_url: str, stt_config: dict):
+def get_utterance_page(db: Session, file_id: int, offset: int, limit: int) -> dict:
     """
-    백그라운드에서 STT 처리를 수행하는 함수
+    speaker_labels의 일부 구간만 복원하여 조회
+    
+    압축된 열 단위 세그먼트에서 요청한 구간의 발화 dict만 만들어 반환합니다.
     """
-    from app.db.session import SessionLocal
+    row = db.query(
+        Transcript.speaker_names,
+        Transcript.speaker_segments,
+        Transcript.content_version,
+    ).filter(Transcript.audio_file_id == file_id).first()
     
-    db = SessionLocal()
-    try:
-        # STT 서비스 인스턴스 생성
-        stt_service = get_stt_service()
-        
-        # STT 처리 실행
-        result = stt_service.transcribe_file(s3_url, stt_config)
-        
-        # DB 업데이트
-        file = db.query(AudioFile).filter(AudioFile.id == file_id).first()
-        if file:
-            file.stt_status = "completed"
-            file.stt_processed_at = datetime.utcnow()
-            
-            # Transcript 생성 또는 업데이트 (화자 정보 포함)
-            transcript_content = result.get("transcript", "")
-            speaker_labels = result.get("speaker_labels")
-            speaker_names = result.get("speaker_names")
-            
-            if file.transcript:
-                file.transcript.content = transcript_content
-                file.transcript.speaker_labels = speaker_labels
-                file.transcript.speaker_names = speaker_names
-                file.transcript.updated_at = datetime.utcnow()
-            else:
-                transcript = Transcript(
-                    audio_file_id=file_id,
-                    content=transcript_content,
-                    speaker_labels=speaker_labels,
-                    speaker_names=speaker_names,
-                    is_edited=False
-                )
-                db.add(transcript)
-            
-            db.commit()
-            
-    except Exception as e:
-        # 에러 발생 시 DB 업데이트
-        file = db.query(AudioFile).filter(AudioFile.id == file_id).first()
-        if file:
-            file.stt_status = "failed"
-            file.stt_error_message = str(e)
-            db.commit()
-    finally:
-        db.close()
+    utterances, total = decode_speaker_labels_range(
+        row.speaker_segments if row else None, offset, limit
+    )
+    return {
+        "utterances": utterances,
+        "speaker_names": (row.speaker_names if row else None) or {},
+        "offset": offset,
+        "limit": limit,
+        "total_utterances": total,
+        "has_more": offset + limit < total,
+        "version": row.content_version if row else None,
+    }
+
 
 @router.put("/{file_id}/transcript")
 def update_transcript(
     file_id: int,
     content: str = Form(...),
+    version: Optional[int] = Form(None),
     db: Session = Depends(get_db)
 ):
-    """STT 결과 텍스트 편집"""
+    """
+    STT 결과 텍스트 편집
+    
+    version을 보내면 현재 content_version과 다를 때 다른 편집이 먼저 저장된 것이므로 409를 반환합니다.
+    """
     # DB에서 파일 정보 조회
     file = db.query(AudioFile).filter(AudioFile.id == file_id).first()
     if not file:
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
     
+    # 동시 편집 시 버전 확인과 저장 사이에 끼어들지 못하도록 행 잠금
+    transcript = db.query(Transcript).filter(
+        Transcript.audio_file_id == file_id
+    ).with_for_update().first()
+    current_version = transcript.content_version if transcript else None
+    if version is not None and version != current_version:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "다른 편집이 먼저 저장되었습니다. 최신 내용을 다시 불러와 주세요.",
+                "current_version": current_version
+            }
+        )
+    
     # Transcript가 없으면 생성
-    if not file.transcript:
+    if not transcript:
         transcript = Transcript(
             audio_file_id=file_id,
             content=content,
-            is_edited=True
+            is_edited=True,
+            content_detached=True,
+            content_version=0
         )
         db.add(transcript)
     else:
         # 기존 Transcript 업데이트
-        file.transcript.content = content
-        file.transcript.is_edited = True
-        file.transcript.updated_at = datetime.utcnow()
+        transcript.content = content
+        transcript.is_edited = True
+        transcript.content_detached = True
+        transcript.content_version += 1
+        transcript.updated_at = datetime.utcnow()
     
+    index_safely(db, index_transcript, transcript, file.report_id)
     db.commit()
     
     return {
         "message": "STT 결과가 업데이트되었습니다.",
         "file_id": file_id,
         "content": content,
-        "is_edited": True
+        "is_edited": True,
+        "version": transcript.content_version
     }
 
 
-@router.get("/{file_id}/transcript/edit")
+@router.patch("/{file_id}/transcript")
+def patch_transcript(
+    file_id: int,
+    patch: TranscriptPatch,
+    db: Session = Depends(get_db)
+):
+    """
+    발화 단위 STT 결과 편집
+    
+    변경된 발화(인덱스, 텍스트, 화자)만 받아 speaker_labels와 본문에 함께 반영합니다.
+    요청의 version이 현재 content_version과 다르면 다른 편집이 먼저 저장된 것이므로 409를 반환합니다.
+    본문 전체를 직접 편집한(PUT) Transcript는 발화로 본문을 다시 만들면 편집 내용이 사라지므로 409를 반환합니다.
+    """
+    # 동시 편집 시 버전 확인과 저장 사이에 끼어들지 못하도록 행 잠금
+    transcript = db.query(Transcript).filter(
+        Transcript.audio_file_id == file_id
+    ).with_for_update().first()
+    if not transcript:
+        raise HTTPException(status_code=404, detail="STT 결과를 찾을 수 없습니다.")
+    
+    if transcript.content_version != patch.version:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "다른 편집이 먼저 저장되었습니다. 최신 내용을 다시 불러와 주세요.",
+                "current_version": transcript.content_version
+            }
+        )
+    
+    if transcript.content_detached:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "본문 전체가 직접 편집된 STT 결과는 발화 단위로 편집할 수 없습니다.",
+                "current_version": transcript.content_version
+            }
+        )
+    
+    speaker_labels = transcript.speaker_labels
+    if not speaker_labels:
+        raise HTTPException(status_code=404, detail="화자 분리 정보가 없습니다.")
+    
+    for edit in patch.edits:
+        if edit.index >= len(speaker_labels):
+            raise HTTPException(
+                status_code=400,
+                detail=f"발화 인덱스가 범위를 벗어났습니다: {edit.index} (전체 {len(speaker_labels)}개)"
+            )
+        label = dict(speaker_labels[edit.index])
+        if edit.text is not None:
+            label["text"] = edit.text
+        if edit.speaker is not None:
+            label["speaker"] = edit.speaker
+        speaker_labels[edit.index] = label
+    
+    # 발화와 본문을 함께 갱신 (본문은 화자 키 기준, 화자 이름은 조회 시 적용)
+    transcript.speaker_labels = speaker_labels
+    transcript.content = render_template(build_template(speaker_labels), None)
+    transcript.is_edited = True
+    transcript.updated_at = datetime.utcnow()
+    index_safely(db, index_transcript, transcript, transcript.audio_file.report_id)
+    db.commit()
+    
+    return {
+        "message": "STT 결과가 업데이트되었습니다.",
+        "file_id": file_id,
+        "version": transcript.content_version,
+        "edited_count": len(patch.edits),
+        "utterances": [
+            {"index": edit.index, **speaker_labels[edit.index]}
+            for edit in patch.edits
+        ]
+    }
+
+
+@router.get("/{file_id}/transcript/edit", response_class=ORJSONResponse)
 def get_transcript_for_edit(file_id: int, db: Session = Depends(get_db)):
     """STT 결과 편집을 위한 데이터 조회"""
     # DB에서 파일 정보 조회
@@ -395,10 +1087,12 @@ def get_transcript_for_edit(file_id: int, db: Session = Depends(get_db)):
     
     transcript_content = ""
     is_edited = False
+    version = None
     
     if file.transcript:
-        transcript_content = file.transcript.content
+        transcript_content = render_content(file.transcript)
         is_edited = file.transcript.is_edited
+        version = file.transcript.content_version
     
     return {
         "file_id": file_id,
@@ -406,6 +1100,7 @@ def get_transcript_for_edit(file_id: int, db: Session = Depends(get_db)):
         "stt_status": file.stt_status,
         "transcript_content": transcript_content,
         "is_edited": is_edited,
+        "version": version,
         "stt_processed_at": file.stt_processed_at
     }
 
@@ -421,6 +1116,7 @@ def get_stt_config(file_id: int, db: Session = Depends(get_db)):
     # STT 설정이 없으면 기본값 반환
     if not file.stt_config:
         return {
+            "engine": "returnzero",
             "model_type": "sommers",
             "language": "ko",
             "language_candidates": None,
@@ -450,12 +1146,7 @@ def create_stt_config(
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
     
     # 유효한 필드만 필터링
-    valid_fields = {
-        'model_type', 'language', 'language_candidates', 'speaker_diarization', 
-        'spk_count', 'profanity_filter', 'use_disfluency_filter', 
-        'use_paragraph_splitter', 'paragraph_max_length', 'domain', 'keywords'
-    }
-    filtered_config = {k: v for k, v in config_data.items() if k in valid_fields}
+    filtered_config = {k: v for k, v in config_data.items() if k in STT_CONFIG_FIELDS}
     
     # 기존 설정이 있으면 업데이트
     if file.stt_config:
@@ -492,12 +1183,7 @@ def update_stt_config(
         raise HTTPException(status_code=404, detail="STT 설정을 찾을 수 없습니다.")
     
     # 유효한 필드만 필터링
-    valid_fields = {
-        'model_type', 'language', 'language_candidates', 'speaker_diarization', 
-        'spk_count', 'profanity_filter', 'use_disfluency_filter', 
-        'use_paragraph_splitter', 'paragraph_max_length', 'domain', 'keywords'
-    }
-    filtered_config = {k: v for k, v in config_data.items() if k in valid_fields}
+    filtered_config = {k: v for k, v in config_data.items() if k in STT_CONFIG_FIELDS}
     
     # 설정 업데이트
     for key, value in filtered_config.items():
@@ -524,25 +1210,10 @@ def update_speaker_labels(
     if not file.transcript:
         raise HTTPException(status_code=404, detail="STT 결과를 찾을 수 없습니다.")
     
-    # 화자 이름 업데이트
+    # 화자 이름만 업데이트 (본문은 조회 시점에 화자 이름을 적용하여 렌더링)
     file.transcript.speaker_names = speaker_names
     file.transcript.updated_at = datetime.utcnow()
     
-    # 화자 이름이 변경된 경우 텍스트도 업데이트
-    if file.transcript.speaker_labels and speaker_names:
-        updated_content_parts = []
-        for label in file.transcript.speaker_labels:
-            speaker = label.get("speaker", "")
-            text = label.get("text", "")
-            if speaker and text:
-                # 새로운 화자 이름으로 교체
-                new_speaker_name = speaker_names.get(speaker, speaker)
-                updated_content_parts.append(f"{new_speaker_name}: {text}")
-            elif text:
-                updated_content_parts.append(text)
-        
-        file.transcript.content = "\n".join(updated_content_parts)
-    
     db.commit()
     
     return {
@@ -567,78 +1238,55 @@ def get_speaker_labels(file_id: int, db: Session = Depends(get_db)):
         "file_id": file_id,
         "speaker_labels": file.transcript.speaker_labels,
         "speaker_names": file.transcript.speaker_names or {},
-        "transcript_content": file.transcript.content
+        "transcript_content": render_content(file.transcript),
+        "version": file.transcript.content_version
     }
 
 @router.post("/{file_id}/transcribe/restart")
 def restart_stt_processing(
     file_id: int, 
-    background_tasks: BackgroundTasks, 
+    force: bool = Query(False, description="캐시를 무시하고 STT를 다시 요청"),
     db: Session = Depends(get_db)
 ):
     """
     STT 처리 재시작 (기존 결과 초기화 후 새로운 설정으로 재처리)
+    
+    리턴제로 결과에 영향을 주는 설정이 그대로면 캐시된 결과로 즉시 완료됩니다.
+    처리 중이거나 재시도 대기 중인 이전 작업은 새 작업으로 대체되며, 이미 실행 중인 작업의 결과는 저장되지 않습니다.
     """
-    # DB에서 파일 정보 조회
-    file = db.query(AudioFile).filter(AudioFile.id == file_id).first()
+    # DB에서 파일 정보 조회 (이전 작업이 결과를 저장하는 중이면 끝날 때까지 대기)
+    file = db.query(AudioFile).filter(AudioFile.id == file_id).with_for_update().first()
     if not file:
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
     
+    # STT 설정 가져오기 (없으면 기본값 사용)
+    stt_config = build_stt_config_dict(file)
+    
+    get_stt_queue(stt_config).ensure_capacity(PRIORITY_INTERACTIVE)
+    
     # 기존 Transcript 삭제
     if file.transcript:
         db.delete(file.transcript)
     
-    # STT 설정 가져오기 (없으면 기본값 사용)
-    stt_config = file.stt_config
-    if not stt_config:
-        stt_config = {
-            "model_type": "sommers",
-            "language": "ko",
-            "language_candidates": None,
-            "speaker_diarization": False,
-            "spk_count": 2,
-            "profanity_filter": False,
-            "use_disfluency_filter": True,
-            "use_paragraph_splitter": True,
-            "paragraph_max_length": 50,
-            "domain": "GENERAL",
-            "keywords": None
-        }
-    else:
-        # STTConfig 객체를 딕셔너리로 변환
-        stt_config = {
-            "model_type": stt_config.model_type,
-            "language": stt_config.language,
-            "language_candidates": stt_config.language_candidates,
-            "speaker_diarization": stt_config.speaker_diarization,
-            "spk_count": stt_config.spk_count,
-            "profanity_filter": stt_config.profanity_filter,
-            "use_disfluency_filter": stt_config.use_disfluency_filter,
-            "use_paragraph_splitter": stt_config.use_paragraph_splitter,
-            "paragraph_max_length": stt_config.paragraph_max_length,
-            "domain": stt_config.domain,
-            "keywords": stt_config.keywords
-        }
-    
     # STT 상태를 processing으로 변경
     file.stt_status = "processing"
     file.stt_processed_at = None
     file.stt_error_message = None
+    file.stt_heartbeat_at = datetime.utcnow()
+    clear_stt_task(file)
+    generation = start_stt_generation(db, file)
     db.commit()
+    publish_stt_status(file.report_id, file)
     
-    # 백그라운드에서 STT 처리 시작 (설정 포함)
-    background_tasks.add_task(
-        process_stt_background, 
-        file_id, 
-        file.s3_url, 
-        stt_config
-    )
+    # STT 스케줄러에 등록 (설정 포함, 이전 작업은 대체)
+    ticket = enqueue_stt(file, stt_config, use_cache=not force, generation=generation)
     
     return {
         "message": "STT 처리가 새로운 설정으로 재시작되었습니다.",
         "file_id": file_id,
         "status": "processing",
-        "config": stt_config
+        "config": stt_config,
+        "queue": ticket
     }
 
 @router.post("/{file_id}/transcript/speakers/preview")
@@ -665,25 +1313,16 @@ def preview_speaker_labels(
         )
     
     # 화자 라벨이 없으면 에러
-    if not file.transcript.speaker_labels:
+    if file.transcript.speaker_segments is None:
         raise HTTPException(
             status_code=404, 
             detail="화자 분리 정보가 없습니다."
         )
     
-    # 미리보기 텍스트 생성
-    preview_content_parts = []
-    for label in file.transcript.speaker_labels:
-        speaker = label.get("speaker", "")
-        text = label.get("text", "")
-        if speaker and text:
-            # 새로운 화자 이름으로 교체
-            new_speaker_name = speaker_names.get(speaker, speaker)
-            preview_content_parts.append(f"{new_speaker_name}: {text}")
-        elif text:
-            preview_content_parts.append(text)
-    
-    preview_content = "\n".join(preview_content_parts)
+    # 캐시된 템플릿에 새 화자 이름을 적용한 미리보기 (편집된 본문이 아닌 STT 발화 기준)
+    preview_content = render_content(
+        file.transcript, speaker_names=speaker_names, ignore_edits=True
+    )
     
     return {
         "file_id": file_id,
@@ -1,25 +1,49 @@
 from fastapi import (
-    APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+    APIRouter, Depends, HTTPException, status, Query, Request,
+    Response
 )
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse, ORJSONResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
 from datetime import datetime
+import asyncio
+import json
 import logging
 
 from app.db.session import get_db
 from app.db.models import (
-    Report, AudioFile, Transcript, ReportData
+    Report, AudioFile, Transcript, ReportData, STTConfig
 )
 from app.schemas.reports import (
     ReportCreate, ReportUpdate, ReportResponse, 
     ReportDetailResponse, ReportListResponse, ReportStatus,
     AIAnalysisRequest
 )
+from app.schemas.audio_files import BulkTranscribeRequest
 from app.services.ai_analysis import ai_analysis_service
+from app.services.provider_guard import ProviderUnavailableError
+from app.services.dedup import release_blob, delete_released_objects
+from app.services.transcript_render import render_content
+from app.services.http_cache import (
+    build_etag, is_not_modified, set_cache_headers, not_modified_response
+)
+from app.services.stt_events import (
+    subscribe, unsubscribe, load_stt_statuses
+)
+from app.services.stt_jobs import enqueue_stt_bulk
+from app.services.job_queue import (
+    Job, PRIORITY_INTERACTIVE, analysis_queue, audio_seconds
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# SSE 연결에서 DB 상태를 다시 확인하는 주기 (초)
+# 다른 워커 프로세스에서 발생한 상태 변경도 이 주기 안에 전달됨
+STT_EVENTS_RECHECK_INTERVAL = 5
+
 
 @router.post("", response_model=ReportResponse, status_code=status.HTTP_201_CREATED)
 def create_report(
@@ -74,26 +98,269 @@ def get_reports(
     )
 
 
-@router.get("/{report_id}", response_model=ReportDetailResponse)
-def get_report(report_id: int, db: Session = Depends(get_db)):
+def get_report_version(db: Session, report_id: int):
+    """
+    보고서 상세 응답의 버전 정보 조회 (본문을 읽지 않는 집계 쿼리)
+    
+    파일/Transcript/STT 설정/분석 결과의 추가·수정·삭제가 모두 반영되도록 개수, 최대 ID, 최종 수정 시각을 사용합니다.
+    같은 시각에 여러 번 수정되어도 구분되도록 Transcript는 content_version 합계도 포함합니다.
+    """
+    file_stats = db.query(
+        func.count(AudioFile.id),
+        func.max(AudioFile.id),
+        func.max(AudioFile.updated_at),
+    ).filter(AudioFile.report_id == report_id).subquery()
+    transcript_stats = db.query(
+        func.count(Transcript.id),
+        func.max(Transcript.updated_at),
+        func.coalesce(func.sum(Transcript.content_version), 0),
+    ).join(AudioFile, Transcript.audio_file_id == AudioFile.id).filter(
+        AudioFile.report_id == report_id
+    ).subquery()
+    stt_config_stats = db.query(
+        func.count(STTConfig.id),
+        func.max(STTConfig.updated_at),
+    ).join(AudioFile, STTConfig.audio_file_id == AudioFile.id).filter(
+        AudioFile.report_id == report_id
+    ).subquery()
+    analysis_stats = db.query(
+        func.count(ReportData.id),
+        func.max(ReportData.id),
+    ).filter(ReportData.report_id == report_id).subquery()
+    
+    return db.query(
+        Report.updated_at,
+        file_stats,
+        transcript_stats,
+        stt_config_stats,
+        analysis_stats,
+    ).filter(Report.id == report_id).first()
+
+
+@router.get(
+    "/{report_id}",
+    response_model=ReportDetailResponse,
+    response_class=ORJSONResponse
+)
+def get_report(
+    report_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
     """보고서 상세 조회 (관계 데이터 포함)"""
-    report = db.query(Report).filter(Report.id == report_id).first()
+    version = get_report_version(db, report_id)
+    if not version:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="보고서를 찾을 수 없습니다."
+        )
+    
+    etag = build_etag("report", report_id, *version)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_cache_headers(response, etag)
+    
+    # 파일/Transcript 본문/STT 설정을 파일 수와 무관하게 고정된 쿼리 수로 로드
+    report = db.query(Report).options(
+        selectinload(Report.audio_files)
+        .selectinload(AudioFile.transcript)
+        .undefer(Transcript.content),
+        selectinload(Report.audio_files).selectinload(AudioFile.stt_config),
+        selectinload(Report.report_data),
+    ).filter(Report.id == report_id).first()
     if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="보고서를 찾을 수 없습니다."
         )
     
-    # AudioFile 객체에 stt_transcript 필드 추가
+    # AudioFile 객체에 stt_transcript 필드 추가 (화자 이름 적용)
     for audio_file in report.audio_files:
-        if audio_file.transcript:
-            audio_file.stt_transcript = audio_file.transcript.content
-        else:
-            audio_file.stt_transcript = ""
+        audio_file.stt_transcript = render_content(audio_file.transcript)
     
     return report
 
 
+def _report_exists(report_id: int) -> bool:
+    from app.db.session import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        return db.query(Report.id).filter(Report.id == report_id).first() is not None
+    finally:
+        db.close()
+
+
+def _load_stt_statuses(report_id: int):
+    """SSE 스트림용 STT 상태 조회 (스트림이 요청 세션보다 오래 살아 있으므로 별도 세션 사용)"""
+    from app.db.session import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        return load_stt_statuses(db, report_id)
+    finally:
+        db.close()
+
+
+def _format_sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.get("/{report_id}/events")
+async def stream_report_events(report_id: int, request: Request):
+    """
+    보고서의 STT 상태 변경을 Server-Sent Events로 전달
+    
+    연결 시 전체 상태(snapshot)를 보낸 뒤, 상태가 바뀐 파일만 stt_status 이벤트로 보냅니다.
+    """
+    exists = await run_in_threadpool(_report_exists, report_id)
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="보고서를 찾을 수 없습니다."
+        )
+    
+    async def event_stream():
+        queue = subscribe(report_id)
+        try:
+            statuses = await run_in_threadpool(_load_stt_statuses, report_id)
+            yield _format_sse("snapshot", list(statuses.values()))
+            
+            while not await request.is_disconnected():
+                try:
+                    changed = [await asyncio.wait_for(
+                        queue.get(), timeout=STT_EVENTS_RECHECK_INTERVAL
+                    )]
+                except asyncio.TimeoutError:
+                    # 다른 워커에서 처리된 변경을 반영하기 위해 DB 상태와 비교
+                    latest = await run_in_threadpool(_load_stt_statuses, report_id)
+                    changed = [
+                        event for file_id, event in latest.items()
+                        if statuses.get(file_id) != event
+                    ]
+                    if not changed:
+                        yield ": keep-alive\n\n"
+                        continue
+                
+                for event in changed:
+                    if statuses.get(event["id"]) == event:
+                        continue
+                    statuses[event["id"]] = event
+                    yield _format_sse("stt_status", event)
+        finally:
+            unsubscribe(report_id, queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+@router.get("/{report_id}/status")
+def get_report_status(
+    report_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
+    """
+    보고서 처리 상태 요약 조회 (폴링용 경량 엔드포인트)
+    
+    Transcript/분석 데이터 없이 보고서 상태와 파일별 STT 상태만 하나의 쿼리로 조회합니다.
+    파일 ID 목록이 잘리지 않도록 (GROUP_CONCAT 길이 제한) 파일별 행을 받아 개수는 여기서 집계합니다.
+    변경이 없으면 If-None-Match에 대해 304를 반환합니다.
+    """
+    rows = db.query(
+        Report.status,
+        Report.updated_at,
+        AudioFile.id.label("file_id"),
+        func.coalesce(AudioFile.stt_status, "pending").label("stt_status"),
+        AudioFile.stt_processed_at,
+    ).outerjoin(
+        AudioFile, AudioFile.report_id == Report.id
+    ).filter(
+        Report.id == report_id
+    ).all()
+    
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="보고서를 찾을 수 없습니다."
+        )
+    
+    stt_counts = {}
+    files = []
+    last_processed_at = None
+    for row in rows:
+        if row.file_id is None:
+            continue  # 파일이 없는 보고서 (outer join의 빈 행)
+        stt_counts[row.stt_status] = stt_counts.get(row.stt_status, 0) + 1
+        files.append({"id": row.file_id, "stt_status": row.stt_status})
+        if row.stt_processed_at and (
+            last_processed_at is None or row.stt_processed_at > last_processed_at
+        ):
+            last_processed_at = row.stt_processed_at
+    files.sort(key=lambda f: f["id"])
+    
+    report_status = rows[0].status
+    etag = build_etag(report_id, report_status, rows[0].updated_at, files, last_processed_at)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    
+    set_cache_headers(response, etag)
+    return {
+        "report_id": report_id,
+        "status": report_status,
+        "updated_at": rows[0].updated_at,
+        "total_files": len(files),
+        "stt_counts": stt_counts,
+        "is_processing": stt_counts.get("processing", 0) > 0,
+        "last_processed_at": last_processed_at,
+        "files": files,
+    }
+
+
+@router.post("/{report_id}/transcribe-all")
+def transcribe_all(
+    report_id: int,
+    request: Optional[BulkTranscribeRequest] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    보고서의 대기/실패 상태 파일 STT 일괄 시작
+    
+    일괄 작업 등급으로 등록되어 단건 STT 요청보다 뒤에 처리되며, 보고서별로 공정하게 나눠 처리되므로
+    파일이 많은 보고서가 다른 보고서의 STT를 막지 않습니다. 대기열 자리만큼만 등록됩니다.
+    """
+    if not db.query(Report.id).filter(Report.id == report_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="보고서를 찾을 수 없습니다."
+        )
+    
+    request = request or BulkTranscribeRequest()
+    result = enqueue_stt_bulk(
+        db,
+        report_ids=[report_id],
+        statuses=request.statuses,
+        stt_config=request.stt_config
+    )
+    
+    return {
+        "message": f"{result['count']}개 파일의 STT 처리가 시작되었습니다.",
+        "report_id": report_id,
+        "count": result["count"],
+        "file_ids": result["file_ids"],
+        "queue": result["queue"],
+        "capacity_limited": result["capacity_limited"],
+    }
+
+
 @router.put("/{report_id}", response_model=ReportResponse)
 def update_report(
     report_id: int,
@@ -130,9 +397,17 @@ def delete_report(report_id: int, db: Session = Depends(get_db)):
             detail="보고서를 찾을 수 없습니다."
         )
     
+    # 음성 파일의 S3 원본 참조 해제 (다른 보고서와 공유 중이면 유지)
+    released_urls = []
+    for audio_file in report.audio_files:
+        released_urls.extend(release_blob(db, audio_file))
+    
     db.delete(report)
     db.commit()
     
+    # 커밋된 뒤에 S3 객체 삭제
+    delete_released_objects(released_urls)
+    
     return None
 
 
@@ -198,22 +473,44 @@ def preview_ai_analysis(
         )
 
 
-@router.get("/{report_id}/ai-analysis/latest")
-def get_latest_analysis(report_id: int, db: Session = Depends(get_db)):
+@router.get("/{report_id}/ai-analysis/latest", response_class=ORJSONResponse)
+def get_latest_analysis(
+    report_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
     """최신 AI 분석 결과 조회"""
     # 보고서 존재 확인
-    report = db.query(Report).filter(Report.id == report_id).first()
+    report = db.query(Report.id).filter(Report.id == report_id).first()
     if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="보고서를 찾을 수 없습니다."
         )
     
-    # 최신 분석 결과 조회
-    latest_analysis = db.query(ReportData).filter(
+    # 최신 분석 결과의 버전만 먼저 조회 (analysis_data JSON 제외)
+    latest_version = db.query(
+        ReportData.id, ReportData.generated_at
+    ).filter(
         ReportData.report_id == report_id
     ).order_by(ReportData.generated_at.desc()).first()
     
+    last_modified = latest_version.generated_at if latest_version else None
+    etag = build_etag(
+        "latest-analysis", report_id,
+        latest_version.id if latest_version else None, last_modified
+    )
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified=last_modified)
+    set_cache_headers(response, etag, last_modified)
+    
+    latest_analysis = None
+    if latest_version:
+        latest_analysis = db.query(ReportData).filter(
+            ReportData.id == latest_version.id
+        ).first()
+    
     if not latest_analysis:
         return {
             "report_id": report_id,
@@ -234,10 +531,14 @@ def get_latest_analysis(report_id: int, db: Session = Depends(get_db)):
 def analyze_report(
     report_id: int,
     request: AIAnalysisRequest,
-    background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db)
 ):
-    """보고서 AI 분석 시작"""
+    """
+    보고서 AI 분석 시작 (분석 스케줄러에서 처리)
+    
+    대화 길이(STT 완료 파일의 오디오 길이 합)가 짧은 분석이 먼저 실행되며,
+    응답의 queue에 대기 순번과 예상 시작/완료 시간(초)이 포함됩니다.
+    """
     # 보고서 존재 확인
     report = db.query(Report).filter(Report.id == report_id).first()
     if not report:
@@ -246,6 +547,17 @@ def analyze_report(
             detail="보고서를 찾을 수 없습니다."
         )
     
+    # 이미 대기/실행 중인 분석이 있으면 다시 등록하지 않음
+    job_key = analysis_job_key(report_id)
+    ticket = analysis_queue.ticket(job_key)
+    if ticket:
+        return {
+            "message": "AI 분석이 이미 진행 중입니다.",
+            "report_id": report_id,
+            "status": report.status,
+            "queue": ticket
+        }
+    
     # 음성 파일과 STT 결과 확인
     audio_files = db.query(AudioFile).filter(
         AudioFile.report_id == report_id
@@ -257,14 +569,16 @@ def analyze_report(
             detail="분석할 음성 파일이 없습니다."
         )
     
-    # STT 완료된 파일 확인
+    # STT 완료된 파일 확인 (오디오 길이 합을 분석 작업량으로 사용)
     completed_stt = 0
+    conversation_seconds = 0.0
     for audio_file in audio_files:
         transcript = db.query(Transcript).filter(
             Transcript.audio_file_id == audio_file.id
         ).first()
         if transcript and transcript.content:
             completed_stt += 1
+            conversation_seconds += audio_seconds(audio_file)
     
     if completed_stt == 0:
         raise HTTPException(
@@ -272,29 +586,35 @@ def analyze_report(
             detail="STT 처리가 완료된 파일이 없습니다."
         )
     
+    # 대기열이 가득 차 있으면 상태를 바꾸지 않고 429 반환
+    analysis_queue.ensure_capacity(PRIORITY_INTERACTIVE)
+    
     # 상태를 analyzing로 변경
     report.status = ReportStatus.ANALYZING
     db.commit()
     
-    # 백그라운드에서 분석 실행
-    if background_tasks:
-        background_tasks.add_task(
-            run_analysis_background,
-            report_id,
-            request.ai_prompt_id,
-            request.model
+    # 분석 스케줄러에 등록
+    ticket = analysis_queue.submit([
+        Job(
+            job_key, report_id, run_analysis_background,
+            args=(report_id, request.ai_prompt_id, request.model),
+            priority=PRIORITY_INTERACTIVE,
+            cost=conversation_seconds,
+            tenant_id=report.user_id
         )
+    ])[job_key]
     
     return {
         "message": "AI 분석이 시작되었습니다.",
         "report_id": report_id,
-        "status": "analyzing"
+        "status": "analyzing",
+        "queue": ticket
     }
 
 
 @router.get("/{report_id}/analysis-status")
 def get_analysis_status(report_id: int, db: Session = Depends(get_db)):
-    """AI 분석 상태 조회"""
+    """AI 분석 상태 조회 (이 워커 프로세스에서 대기/실행 중이면 queue 포함)"""
     status_info = ai_analysis_service.get_analysis_status(report_id)
     
     if "error" in status_info:
@@ -303,7 +623,12 @@ def get_analysis_status(report_id: int, db: Session = Depends(get_db)):
             detail=status_info["error"]
         )
     
-    return status_info
+    return {**status_info, "queue": analysis_queue.ticket(analysis_job_key(report_id))}
+
+
+def analysis_job_key(report_id: int) -> str:
+    """분석 스케줄러 작업 key"""
+    return f"analysis:{report_id}"
 
 
 def run_analysis_background(
@@ -331,6 +656,9 @@ def run_analysis_background(
         
         return result
         
+    except ProviderUnavailableError:
+        # OpenAI 차단기가 열려 있음 - analyzing 상태로 두고 분석 스케줄러가 나중에 다시 실행
+        raise
     except Exception as e:
         # 오류 발생 시 상태를 draft로 되돌림
         report = db.query(Report).filter(Report.id == report_id).first()
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.db.session import get_db
+from app.services.search import search
+
+router = APIRouter()
+
+
+@router.get("", response_class=ORJSONResponse)
+def search_documents(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (공백으로 구분한 단어는 모두 포함)"),
+    type: Optional[str] = Query(
+        None, pattern="^(utterance|line|analysis)$",
+        description="검색 대상 (utterance: 발화, line: 편집된 본문 줄, analysis: AI 분석 결과)"
+    ),
+    report_id: Optional[int] = Query(None, description="보고서 ID로 범위 제한"),
+    limit: int = Query(20, ge=1, le=100, description="결과 수"),
+    offset: int = Query(0, ge=0, le=10000, description="시작 위치"),
+    db: Session = Depends(get_db)
+):
+    """녹음 발화, 편집된 Transcript, AI 분석 결과 전문 검색 (일치 구간 하이라이트 포함)"""
+    return search(
+        db, q,
+        source_type=type,
+        report_id=report_id,
+        limit=limit,
+        offset=offset
+    )
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List, Literal, Dict, Any
 from datetime import datetime
 
 
@@ -7,6 +7,11 @@ class AudioFileBase(BaseModel):
     filename: str = Field(..., description="파일명")
     file_size: Optional[int] = Field(None, description="파일 크기 (bytes)")
     duration: Optional[int] = Field(None, description="재생 시간 (초)")
+    duration_ms: Optional[int] = Field(None, description="재생 시간 (밀리초)")
+    codec: Optional[str] = Field(None, description="오디오 코덱")
+    sample_rate: Optional[int] = Field(None, description="샘플레이트 (Hz)")
+    channels: Optional[int] = Field(None, description="채널 수")
+    bit_rate: Optional[int] = Field(None, description="비트레이트 (bps)")
 
 
 class AudioFileCreate(AudioFileBase):
@@ -28,6 +33,7 @@ class AudioFileResponse(AudioFileBase):
     uploaded_at: datetime
     stt_processed_at: Optional[datetime] = None
     stt_error_message: Optional[str] = None
+    content_hash: Optional[str] = None
     
     class Config:
         from_attributes = True
@@ -37,4 +43,61 @@ class AudioFileListResponse(BaseModel):
     audio_files: list[AudioFileResponse]
     total: int
     page: int
-    size: int 
\ No newline at end of file
+    size: int 
+
+class UtteranceEdit(BaseModel):
+    index: int = Field(..., ge=0, description="발화 인덱스 (speaker_labels 기준)")
+    text: Optional[str] = Field(None, description="새 발화 텍스트")
+    speaker: Optional[str] = Field(
+        None, max_length=50, pattern=r"^speaker\d+$", description="새 화자 키 (예: speaker1)"
+    )
+
+
+class TranscriptPatch(BaseModel):
+    version: int = Field(..., description="편집을 시작한 시점의 content_version")
+    edits: List[UtteranceEdit] = Field(..., min_length=1, max_length=500, description="발화 단위 변경 목록")
+
+
+class UploadSessionCreate(BaseModel):
+    report_id: int = Field(..., description="보고서 ID")
+    filename: str = Field(..., max_length=200, description="원본 파일명")
+    file_size: int = Field(..., gt=0, description="파일 크기 (bytes)")
+    content_type: Optional[str] = Field(None, description="파일 MIME 타입")
+    display_name: Optional[str] = Field(None, description="표시용 파일명")
+    checksum_algorithm: Optional[Literal["SHA256"]] = Field(
+        None, description="파트별 체크섬 검증 (지정하면 파트 URL을 체크섬과 함께 따로 발급받아야 함)"
+    )
+
+
+class UploadedPart(BaseModel):
+    part_number: int = Field(..., ge=1, le=10000, description="파트 번호 (1부터)")
+    etag: str = Field(..., description="파트 업로드 응답의 ETag 헤더")
+
+
+class PartUrlRequest(BaseModel):
+    part_number: int = Field(..., ge=1, le=10000, description="파트 번호 (1부터)")
+    checksum_sha256: Optional[str] = Field(None, description="파트 내용의 SHA-256 (base64)")
+
+
+class UploadPartUrlsRequest(BaseModel):
+    parts: List[PartUrlRequest] = Field(..., min_length=1, max_length=100, description="URL을 발급받을 파트 목록")
+
+
+class UploadSessionComplete(BaseModel):
+    parts: Optional[List[UploadedPart]] = Field(
+        None, min_length=1, description="업로드된 파트 목록 (생략하면 S3에 올라간 파트로 서버에서 조립)"
+    )
+
+
+class BulkTranscribeRequest(BaseModel):
+    statuses: List[Literal["pending", "failed"]] = Field(
+        default=["pending", "failed"], min_length=1, description="STT를 시작할 파일 상태"
+    )
+    stt_config: Optional[Dict[str, Any]] = Field(
+        None, description="모든 대상 파일에 적용할 STT 설정 (생략하면 파일별 기존 설정 사용)"
+    )
+
+
+class AdminBulkTranscribeRequest(BulkTranscribeRequest):
+    report_ids: Optional[List[int]] = Field(None, description="대상 보고서 (생략하면 전체)")
+    limit: Optional[int] = Field(None, ge=1, le=5000, description="최대 등록 파일 수")
@@ -63,7 +63,8 @@ class TranscriptResponse(TranscriptBase):
 
 # STT 설정 스키마
 class STTConfigBase(BaseModel):
-    model_type: str = "sommers"  # sommers, whisper
+    engine: str = "returnzero"  # returnzero, local (로컬 CPU faster-whisper)
+    model_type: str = "sommers"  # sommers, whisper (리턴제로 엔진일 때만)
     language: str = "ko"  # ko, detect, multi 등 (whisper 모델일 때만)
     language_candidates: Optional[List[str]] = Field(
         None, 
@@ -86,6 +87,7 @@ class STTConfigCreate(STTConfigBase):
 
 
 class STTConfigUpdate(BaseModel):
+    engine: Optional[str] = None
     model_type: Optional[str] = None
     language: Optional[str] = None
     language_candidates: Optional[List[str]] = None
@@ -115,6 +117,11 @@ class AudioFileBase(BaseModel):
     display_name: Optional[str] = None  # 사용자가 입력한 표시용 파일명
     file_size: Optional[int] = None
     duration: Optional[int] = None
+    duration_ms: Optional[int] = None
+    codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    bit_rate: Optional[int] = None
 
 
 class AudioFileResponse(AudioFileBase):
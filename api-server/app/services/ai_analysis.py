@@ -6,12 +6,19 @@ from typing import Dict, Any, List, Optional
 from openai import OpenAI
 from app.db.models import Report, AudioFile, Transcript, AIPromptForReport, ReportData
 from app.db.session import SessionLocal
+from app.services.transcript_render import render_content
+from app.services.search import index_safely, index_report_data
+from app.services.provider_guard import ProviderUnavailableError, openai_provider
 
 logger = logging.getLogger(__name__)
 
+# OpenAI 호출의 공급자 장애(429, 5xx, 연결 실패) 재시도 횟수
+OPENAI_RETRIES = int(os.getenv("OPENAI_RETRIES", "3"))
+
 class AIAnalysisService:
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # 재시도는 openai_provider(속도 제한/차단기)에서 처리하므로 SDK 자체 재시도는 끔
+        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0)
         self.default_model = "gpt-4o-mini"
         # 지원되는 OpenAI 모델 목록
         self.supported_models = [
@@ -91,7 +98,7 @@ class AIAnalysisService:
                         "filename": (
                             audio_file.display_name or audio_file.filename
                         ),
-                        "content": audio_file.transcript.content,
+                        "content": render_content(audio_file.transcript),
                         "speaker_labels": audio_file.transcript.speaker_labels,
                         "speaker_names": audio_file.transcript.speaker_names
                     })
@@ -226,6 +233,7 @@ class AIAnalysisService:
                 analysis_data=analysis_result
             )
             db.add(report_data)
+            index_safely(db, index_report_data, report_data)
             
             # 보고서 상태 업데이트
             conversation_data["report"].status = "completed"
@@ -258,7 +266,10 @@ class AIAnalysisService:
         try:
             # ai-research 예제와 동일한 방식: user role 단일 메시지, max_tokens 제거
             # JSON 모드 사용으로 순수 JSON 응답 보장
-            response = self.client.chat.completions.create(
+            response = openai_provider.call_with_retry(
+                "chat",
+                self.client.chat.completions.create,
+                retries=OPENAI_RETRIES,
                 model=model,
                 messages=[
                     {"role": "user", "content": interpolated_prompt}
@@ -323,6 +334,9 @@ class AIAnalysisService:
                     }
                 }
                 
+        except ProviderUnavailableError:
+            # 차단기가 열려 호출하지 않음 - 분석 스케줄러가 나중에 다시 실행
+            raise
         except Exception as e:
             logger.error(f"OpenAI API 호출 중 오류: {str(e)}")
             raise ValueError(f"AI 분석 중 오류가 발생했습니다: {str(e)}")
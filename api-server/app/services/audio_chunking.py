@@ -0,0 +1,255 @@
+import os
+import re
+import subprocess
+import logging
+from collections import defaultdict
+from typing import Optional, Dict, Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 긴 녹음 분할 STT 설정
+CHUNK_ENABLED = os.getenv("STT_CHUNK_ENABLED", "false").lower() == "true"
+CHUNK_MIN_DURATION = int(os.getenv("STT_CHUNK_MIN_DURATION", "1800"))  # 초, 이보다 길면 분할
+CHUNK_TARGET_LENGTH = int(os.getenv("STT_CHUNK_TARGET_LENGTH", "600"))  # 초, 세그먼트 목표 길이
+CHUNK_OVERLAP = int(os.getenv("STT_CHUNK_OVERLAP", "15"))  # 초, 세그먼트 앞뒤 겹침
+CHUNK_MAX_PARALLEL = int(os.getenv("STT_CHUNK_MAX_PARALLEL", "4"))
+
+# 분할 지점 탐색 설정 (목표 지점 ± 탐색 범위 안의 무음 구간 사용)
+CHUNK_SEARCH_WINDOW = 60  # 초
+# 목표 길이가 탐색 범위보다 짧으면 분할 지점이 이전 지점 앞으로 갈 수 있으므로 최소값으로 보정
+MIN_CHUNK_TARGET_LENGTH = CHUNK_SEARCH_WINDOW * 2
+if CHUNK_TARGET_LENGTH < MIN_CHUNK_TARGET_LENGTH:
+    logger.warning(
+        f"STT_CHUNK_TARGET_LENGTH({CHUNK_TARGET_LENGTH}초)가 너무 짧아 "
+        f"{MIN_CHUNK_TARGET_LENGTH}초로 보정합니다."
+    )
+    CHUNK_TARGET_LENGTH = MIN_CHUNK_TARGET_LENGTH
+SILENCE_NOISE_LEVEL = "-35dB"
+SILENCE_MIN_DURATION = 0.5  # 초
+
+# 세그먼트는 STT에 적합한 16kHz 모노 FLAC으로 잘라냄
+CHUNK_EXTENSION = ".flac"
+CHUNK_MIME_TYPE = "audio/flac"
+
+_SILENCE_START_RE = re.compile(r"silence_start:\s*([0-9.]+)")
+_SILENCE_END_RE = re.compile(r"silence_end:\s*([0-9.]+)")
+
+
+def should_chunk(duration_ms: Optional[int]) -> bool:
+    """분할 STT 대상 여부 (설정 활성화 + 최소 길이 초과)"""
+    return bool(
+        CHUNK_ENABLED
+        and duration_ms
+        and duration_ms > CHUNK_MIN_DURATION * 1000
+    )
+
+
+def detect_silences(file_path: str) -> List[Tuple[int, int]]:
+    """
+    ffmpeg silencedetect로 무음 구간을 찾아 (시작ms, 종료ms) 목록으로 반환
+    """
+    cmd = [
+        'ffmpeg',
+        '-nostdin',
+        '-v', 'info',
+        '-i', file_path,
+        '-af', f'silencedetect=noise={SILENCE_NOISE_LEVEL}:d={SILENCE_MIN_DURATION}',
+        '-f', 'null',
+        '-'
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+    if result.returncode != 0:
+        logger.warning(f"무음 구간 탐지 실패: {result.stderr[-500:]}")
+        return []
+
+    silences = []
+    silence_start = None
+    for line in result.stderr.splitlines():
+        start_match = _SILENCE_START_RE.search(line)
+        if start_match:
+            silence_start = float(start_match.group(1))
+            continue
+        end_match = _SILENCE_END_RE.search(line)
+        if end_match and silence_start is not None:
+            silence_end = float(end_match.group(1))
+            silences.append(
+                (int(silence_start * 1000), int(silence_end * 1000))
+            )
+            silence_start = None
+
+    return silences
+
+
+def plan_segments(
+    duration_ms: int,
+    silences: List[Tuple[int, int]]
+) -> List[Dict[str, int]]:
+    """
+    목표 길이 근처의 무음 구간 중앙에서 분할 지점을 정하고 세그먼트 목록 생성
+
+    각 세그먼트는 실제로 잘라낼 범위(start_ms~end_ms, 앞뒤로 겹침 포함)와
+    결과를 채택할 담당 범위(own_start_ms~own_end_ms)를 가집니다.
+    """
+    target_ms = CHUNK_TARGET_LENGTH * 1000
+    window_ms = CHUNK_SEARCH_WINDOW * 1000
+    overlap_ms = CHUNK_OVERLAP * 1000
+    midpoints = [(start + end) // 2 for start, end in silences]
+
+    cut_points = [0]
+    position = 0
+    # 마지막 세그먼트가 너무 짧아지지 않도록 1.5배 이상 남았을 때만 분할
+    while duration_ms - position > target_ms * 1.5:
+        target = position + target_ms
+        # 세그먼트가 목표 길이의 절반보다 짧아지지 않도록 이전 분할 지점 근처의 무음은 제외
+        candidates = [
+            mid for mid in midpoints
+            if max(target - window_ms, position + target_ms // 2) <= mid <= target + window_ms
+        ]
+        cut = min(candidates, key=lambda mid: abs(mid - target)) if candidates else target
+        cut_points.append(cut)
+        position = cut
+    cut_points.append(duration_ms)
+
+    segments = []
+    for own_start, own_end in zip(cut_points, cut_points[1:]):
+        segments.append({
+            "start_ms": max(0, own_start - overlap_ms),
+            "end_ms": min(duration_ms, own_end + overlap_ms),
+            "own_start_ms": own_start,
+            "own_end_ms": own_end,
+        })
+    return segments
+
+
+def cut_segment(
+    file_path: str,
+    segment: Dict[str, int],
+    output_dir: str,
+    index: int
+) -> str:
+    """세그먼트 범위를 16kHz 모노 FLAC 파일로 잘라내고 경로 반환"""
+    output_path = os.path.join(output_dir, f"segment_{index:04d}{CHUNK_EXTENSION}")
+    cmd = [
+        'ffmpeg',
+        '-nostdin',
+        '-y',
+        '-v', 'error',
+        '-ss', f"{segment['start_ms'] / 1000:.3f}",
+        '-t', f"{(segment['end_ms'] - segment['start_ms']) / 1000:.3f}",
+        '-i', file_path,
+        '-vn',
+        '-ac', '1',
+        '-ar', '16000',
+        '-c:a', 'flac',
+        output_path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+    if result.returncode != 0:
+        raise Exception(f"세그먼트 분할 실패: {result.stderr.strip()}")
+    return output_path
+
+
+def _reconcile_speakers(
+    utterances: List[Dict[str, Any]],
+    previous: List[Dict[str, Any]],
+    known_speakers: List[int]
+) -> Dict[Any, int]:
+    """
+    세그먼트별로 독립적인 화자 번호를 전체 화자 번호로 매핑
+
+    겹침 구간에서 이전 세그먼트 발화와 시간이 가장 많이 겹치는 화자끼리
+    매칭하고, 근거가 없는 화자는 아직 사용되지 않은 기존 화자 → 새 화자 순으로 배정합니다.
+    """
+    scores = defaultdict(int)
+    for utterance in utterances:
+        for prev in previous:
+            if prev.get("spk") is None or prev.get("spk") == "":
+                continue
+            overlap = (
+                min(utterance["end_at"], prev["end_at"])
+                - max(utterance["start_at"], prev["start_at"])
+            )
+            if overlap > 0:
+                scores[(utterance["spk"], prev["spk"])] += overlap
+
+    mapping = {}
+    used = set()
+    for (local, global_spk), _ in sorted(
+        scores.items(), key=lambda item: item[1], reverse=True
+    ):
+        if local not in mapping and global_spk not in used:
+            mapping[local] = global_spk
+            used.add(global_spk)
+
+    local_speakers = []
+    for utterance in utterances:
+        if utterance["spk"] not in local_speakers:
+            local_speakers.append(utterance["spk"])
+
+    for local in local_speakers:
+        if local in mapping:
+            continue
+        unused = [spk for spk in known_speakers if spk not in used]
+        if unused:
+            mapping[local] = unused[0]
+        else:
+            mapping[local] = len(known_speakers)
+            known_speakers.append(mapping[local])
+        used.add(mapping[local])
+
+    return mapping
+
+
+def stitch_segment_results(
+    segments: List[Dict[str, int]],
+    segment_results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    세그먼트별 리턴제로 결과를 원본 타임라인의 단일 결과로 합침
+
+    발화 시작 시각을 세그먼트 오프셋만큼 보정하고, 겹침 구간의 중복 발화는
+    시작 시각이 담당 범위에 속하는 세그먼트의 것만 채택합니다.
+    반환값은 리턴제로 응답과 같은 형태({"results": {"utterances": [...]}})입니다.
+    """
+    merged = []
+    previous = []
+    known_speakers = []
+
+    for segment, result in zip(segments, segment_results):
+        utterances = []
+        for utterance in result.get("results", {}).get("utterances", []):
+            start_at = utterance.get("start_at", 0) + segment["start_ms"]
+            utterances.append({
+                **utterance,
+                "start_at": start_at,
+                "end_at": start_at + utterance.get("duration", 0),
+            })
+
+        speaker_utterances = [
+            u for u in utterances
+            if u.get("spk") is not None and u.get("spk") != ""
+        ]
+        if speaker_utterances:
+            # 겹치는 시간이 있는 이전 세그먼트 발화만 비교 대상
+            mapping = _reconcile_speakers(
+                speaker_utterances,
+                [u for u in previous if u["end_at"] > segment["start_ms"]],
+                known_speakers
+            )
+            for utterance in speaker_utterances:
+                utterance["spk"] = mapping[utterance["spk"]]
+
+        for utterance in utterances:
+            if segment["own_start_ms"] <= utterance["start_at"] < segment["own_end_ms"]:
+                merged.append(
+                    {k: v for k, v in utterance.items() if k != "end_at"}
+                )
+
+        previous = utterances
+
+    merged.sort(key=lambda u: u["start_at"])
+    return {
+        "status": "completed",
+        "results": {"utterances": merged},
+        "segments": segments,
+    }
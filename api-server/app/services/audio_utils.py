@@ -2,7 +2,26 @@ import tempfile
 import os
 import subprocess
 import json
-from typing import Optional
+import hashlib
+from typing import Optional, Dict, Any
+
+# 해시 계산/임시 파일 복사 시 사용하는 청크 크기
+HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Pre-signed URL로 원격 파일을 분석할 때의 ffprobe 제한 시간 (초)
+REMOTE_PROBE_TIMEOUT = 30
+
+# ffprobe 코덱명 → (MIME 타입, 확장자) 매핑
+CODEC_MIME_TYPES = {
+    'mp3': ('audio/mpeg', '.mp3'),
+    'aac': ('audio/mp4', '.m4a'),
+    'alac': ('audio/mp4', '.m4a'),
+    'flac': ('audio/flac', '.flac'),
+    'vorbis': ('audio/ogg', '.ogg'),
+    'opus': ('audio/ogg', '.ogg'),
+    'amr_nb': ('audio/amr', '.amr'),
+    'amr_wb': ('audio/amr', '.amr'),
+}
 
 
 def get_audio_duration(file_obj, content_type: str) -> Optional[int]:
@@ -59,6 +78,143 @@ def get_audio_duration(file_obj, content_type: str) -> Optional[int]:
         file_obj.seek(current_pos)
 
 
+def probe_audio_metadata(file_obj) -> Dict[str, Any]:
+    """
+    업로드 시점에 한 번만 오디오 파일을 분석하여 메타데이터를 반환합니다.
+    임시 파일로 복사하면서 SHA-256 해시를 함께 계산하고, ffprobe로
+    코덱/샘플레이트/채널/비트레이트/길이(ms)를 추출합니다.
+    
+    Args:
+        file_obj: 파일 객체
+        
+    Returns:
+        메타데이터 딕셔너리 (추출 실패한 항목은 None)
+    """
+    metadata = {
+        "duration": None,
+        "duration_ms": None,
+        "codec": None,
+        "sample_rate": None,
+        "channels": None,
+        "bit_rate": None,
+        "content_hash": None,
+    }
+    
+    current_pos = file_obj.tell()
+    temp_file_path = None
+    try:
+        file_obj.seek(0)
+        hasher = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file_path = temp_file.name
+            while True:
+                chunk = file_obj.read(HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                temp_file.write(chunk)
+        metadata["content_hash"] = hasher.hexdigest()
+        
+        metadata.update(_probe_with_ffprobe(temp_file_path))
+        print(f"🎵 오디오 메타데이터 추출 완료: {metadata}")
+        return metadata
+    
+    except Exception as e:
+        print(f"❌ 오디오 메타데이터 추출 실패: {e}")
+        return metadata
+    finally:
+        if temp_file_path:
+            try:
+                os.unlink(temp_file_path)
+            except OSError as e:
+                print(f"⚠️ 임시 파일 삭제 실패: {e}")
+        file_obj.seek(current_pos)
+
+
+def probe_remote_audio_metadata(url: str) -> Dict[str, Any]:
+    """
+    S3에 직접 업로드된 파일의 메타데이터를 Pre-signed URL로 추출합니다.
+    ffprobe가 필요한 구간만 HTTP Range 요청으로 읽으므로 파일 전체를 내려받지 않습니다.
+    내용 해시는 전체를 읽어야 하므로 여기서는 구하지 않습니다(None).
+    """
+    metadata = {
+        "duration": None,
+        "duration_ms": None,
+        "codec": None,
+        "sample_rate": None,
+        "channels": None,
+        "bit_rate": None,
+        "content_hash": None,
+    }
+    try:
+        metadata.update(_probe_with_ffprobe(url, timeout=REMOTE_PROBE_TIMEOUT))
+        print(f"🎵 원격 오디오 메타데이터 추출 완료: {metadata}")
+    except Exception as e:
+        print(f"❌ 원격 오디오 메타데이터 추출 실패: {e}")
+    return metadata
+
+
+def _probe_with_ffprobe(file_path: str, timeout: int = 10) -> Dict[str, Any]:
+    """
+    ffprobe의 format/stream 정보에서 첫 번째 오디오 스트림의 메타데이터를 추출합니다.
+    (file_path에는 로컬 경로 또는 HTTP(S) URL을 사용할 수 있습니다)
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'quiet',
+        '-print_format', 'json',
+        '-show_format',
+        '-show_streams',
+        '-select_streams', 'a:0',
+        file_path
+    ]
+    
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        print("❌ ffprobe 타임아웃")
+        return {}
+    
+    if result.returncode != 0:
+        print(f"❌ ffprobe 실패: {result.stderr}")
+        return {}
+    
+    data = json.loads(result.stdout)
+    fmt = data.get('format', {})
+    streams = data.get('streams') or [{}]
+    stream = streams[0]
+    
+    metadata = {}
+    duration = stream.get('duration') or fmt.get('duration')
+    if duration is not None:
+        duration = float(duration)
+        metadata["duration"] = int(round(duration))
+        metadata["duration_ms"] = int(round(duration * 1000))
+    
+    metadata["codec"] = stream.get('codec_name')
+    if stream.get('sample_rate'):
+        metadata["sample_rate"] = int(stream['sample_rate'])
+    if stream.get('channels'):
+        metadata["channels"] = int(stream['channels'])
+    bit_rate = stream.get('bit_rate') or fmt.get('bit_rate')
+    if bit_rate:
+        metadata["bit_rate"] = int(bit_rate)
+    
+    return metadata
+
+
+def get_mime_type_for_codec(codec: Optional[str]) -> Optional[tuple]:
+    """
+    ffprobe 코덱명에 해당하는 (MIME 타입, 확장자)를 반환합니다.
+    PCM 계열은 모두 WAV로 취급하며, 알 수 없는 코덱은 None을 반환합니다.
+    """
+    if not codec:
+        return None
+    if codec.startswith('pcm_'):
+        return ('audio/wav', '.wav')
+    return CODEC_MIME_TYPES.get(codec)
+
+
 def _get_duration_with_ffprobe(file_path: str) -> Optional[int]:
     """
     ffprobe를 사용하여 오디오 파일의 길이를 추출합니다.
@@ -0,0 +1,71 @@
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple
+
+from fastapi import HTTPException
+
+from app.services.s3 import upload_file_to_s3, delete_file_from_s3
+from app.services.audio_utils import probe_audio_metadata
+
+logger = logging.getLogger(__name__)
+
+# 배치 업로드 설정
+BATCH_UPLOAD_MAX_FILES = int(os.getenv("BATCH_UPLOAD_MAX_FILES", "50"))
+BATCH_UPLOAD_CONCURRENCY = int(os.getenv("BATCH_UPLOAD_CONCURRENCY", "4"))
+# 파일당 최대 크기와 요청 본문 전체 최대 크기 (bytes, 전체 기본값은 파일당 최대 크기 × 최대 파일 수)
+BATCH_UPLOAD_MAX_FILE_SIZE = int(os.getenv("BATCH_UPLOAD_MAX_FILE_SIZE", str(100 * 1024 * 1024)))
+BATCH_UPLOAD_MAX_TOTAL_SIZE = int(os.getenv(
+    "BATCH_UPLOAD_MAX_TOTAL_SIZE", str(BATCH_UPLOAD_MAX_FILE_SIZE * BATCH_UPLOAD_MAX_FILES)
+))
+
+# S3 업로드/ffprobe 동시 실행 수를 제한하는 워커 풀 (요청 간 공유)
+_batch_pool = ThreadPoolExecutor(
+    max_workers=BATCH_UPLOAD_CONCURRENCY,
+    thread_name_prefix="batch-upload"
+)
+
+
+def probe_files(file_objs: list) -> List[Dict[str, Any]]:
+    """여러 파일의 오디오 메타데이터를 병렬로 추출 (입력 순서 유지)"""
+    return list(_batch_pool.map(probe_audio_metadata, file_objs))
+
+
+def upload_files(uploads: List[Tuple[Any, str, str]]) -> List[Dict[str, Any]]:
+    """
+    여러 파일을 S3에 동시에 업로드 (입력 순서 유지)
+
+    하나라도 실패하면 이미 올라간 객체를 삭제하고 첫 번째 오류를 다시 발생시킵니다.
+
+    Args:
+        uploads: (file_obj, filename, content_type) 목록
+    """
+    futures = [
+        _batch_pool.submit(upload_file_to_s3, file_obj, filename, content_type)
+        for file_obj, filename, content_type in uploads
+    ]
+
+    results = []
+    error = None
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            error = error or e
+
+    if error:
+        delete_uploaded([result["direct_url"] for result in results])
+        if isinstance(error, HTTPException):
+            raise error
+        raise HTTPException(status_code=500, detail=f"S3 업로드 실패: {str(error)}")
+
+    return results
+
+
+def delete_uploaded(s3_urls: List[str]) -> None:
+    """배치 저장 실패 시 새로 업로드한 S3 객체 정리 (삭제 실패는 로그만 남김)"""
+    for s3_url in s3_urls:
+        try:
+            delete_file_from_s3(s3_url)
+        except Exception as e:
+            logger.warning(f"배치 업로드 정리 중 S3 객체 삭제 실패: {s3_url} ({e})")
@@ -0,0 +1,285 @@
+import logging
+from typing import Optional, Dict, Any, List
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.models import AudioBlob, AudioFile
+from app.services.s3 import (
+    upload_file_to_s3,
+    delete_file_from_s3,
+    generate_presigned_url_for_download,
+)
+from app.services.transcode import build_transcoded_urls
+
+logger = logging.getLogger(__name__)
+
+
+def acquire_blob(
+    db: Session,
+    file_obj,
+    filename: str,
+    content_type: str,
+    content_hash: Optional[str],
+    file_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    내용 해시로 기존 S3 원본을 찾아 재사용하거나 새로 업로드
+
+    기존 원본이 있으면 참조 카운트만 증가시키고 업로드를 생략합니다.
+    커밋은 호출 측에서 AudioFile 저장과 함께 수행합니다.
+
+    Returns:
+        upload_file_to_s3와 같은 형태의 딕셔너리 + blob, deduplicated
+    """
+    if not content_hash:
+        # 해시를 구하지 못한 경우 중복 제거 없이 업로드
+        s3_result = upload_file_to_s3(file_obj, filename, content_type)
+        return {**s3_result, "blob": None, "deduplicated": False}
+
+    blob = _increment_existing_blob(db, content_hash)
+    if blob:
+        logger.info(f"동일한 오디오 원본 재사용: {content_hash[:12]} (참조 {blob.ref_count})")
+        return {
+            "direct_url": blob.s3_url,
+            "presigned_url": generate_presigned_url_for_download(
+                blob.s3_url, expires_in=3600, as_attachment=False
+            ),
+            "blob": blob,
+            "deduplicated": True,
+        }
+
+    s3_result = upload_file_to_s3(file_obj, filename, content_type)
+    return _register_uploaded_blob(db, content_hash, s3_result, file_size)
+
+
+def _register_uploaded_blob(
+    db: Session,
+    content_hash: str,
+    s3_result: Dict[str, Any],
+    file_size: Optional[int],
+    ref_count: int = 1
+) -> Dict[str, Any]:
+    """
+    새로 업로드한 S3 객체를 원본(AudioBlob)으로 등록
+
+    동시 업로드 경합으로 같은 해시가 먼저 등록되어 있으면 방금 올린 객체를 지우고 기존 원본을 사용합니다.
+    """
+    try:
+        # 동시 업로드 경합 시 UNIQUE 제약 위반만 롤백되도록 SAVEPOINT 사용
+        with db.begin_nested():
+            blob = AudioBlob(
+                content_hash=content_hash,
+                s3_url=s3_result["direct_url"],
+                file_size=file_size,
+                ref_count=ref_count
+            )
+            db.add(blob)
+    except IntegrityError:
+        # 다른 요청이 먼저 등록한 원본을 사용하고 방금 올린 객체는 삭제
+        delete_file_from_s3(s3_result["direct_url"])
+        blob = _increment_existing_blob(db, content_hash, ref_count)
+        return {
+            "direct_url": blob.s3_url,
+            "presigned_url": generate_presigned_url_for_download(
+                blob.s3_url, expires_in=3600, as_attachment=False
+            ),
+            "blob": blob,
+            "deduplicated": True,
+        }
+
+    return {**s3_result, "blob": blob, "deduplicated": False}
+
+
+def acquire_blobs(
+    db: Session,
+    items: List[Dict[str, Any]],
+    uploader
+) -> List[Dict[str, Any]]:
+    """
+    여러 파일의 S3 원본을 한 번에 확보 (배치 업로드용)
+
+    같은 해시는 배치 안에서도 한 번만 업로드하고, 기존 원본이 있으면 참조 카운트만 증가시킵니다.
+    업로드는 uploader로 동시에 수행하며 DB 작업은 모두 호출 스레드에서 처리합니다.
+    커밋은 호출 측에서 AudioFile 저장과 함께 수행합니다.
+
+    Args:
+        items: file_obj, filename, content_type, content_hash, file_size를 가진 딕셔너리 목록
+        uploader: upload_file_to_s3 인자 목록 → upload_file_to_s3 결과 목록 (입력 순서 유지)
+
+    Returns:
+        items와 같은 순서의 acquire_blob 결과 목록
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+
+    # 해시별로 묶어 기존 원본 재사용 (해시가 없는 파일은 각각 업로드)
+    groups: Dict[str, List[int]] = {}
+    pending = []  # (대표 인덱스, 같은 해시 인덱스 목록)
+    for index, item in enumerate(items):
+        content_hash = item.get("content_hash")
+        if not content_hash:
+            pending.append((index, [index]))
+        else:
+            groups.setdefault(content_hash, []).append(index)
+
+    for content_hash, indexes in groups.items():
+        blob = _increment_existing_blob(db, content_hash, len(indexes))
+        if not blob:
+            pending.append((indexes[0], indexes))
+            continue
+        logger.info(f"동일한 오디오 원본 재사용: {content_hash[:12]} (참조 {blob.ref_count})")
+        presigned_url = generate_presigned_url_for_download(
+            blob.s3_url, expires_in=3600, as_attachment=False
+        )
+        for index in indexes:
+            results[index] = {
+                "direct_url": blob.s3_url,
+                "presigned_url": presigned_url,
+                "blob": blob,
+                "deduplicated": True,
+            }
+
+    uploads = uploader([
+        (items[index]["file_obj"], items[index]["filename"], items[index]["content_type"])
+        for index, _ in pending
+    ])
+
+    for (index, indexes), s3_result in zip(pending, uploads):
+        item = items[index]
+        if not item.get("content_hash"):
+            results[index] = {**s3_result, "blob": None, "deduplicated": False}
+            continue
+        result = _register_uploaded_blob(
+            db, item["content_hash"], s3_result, item.get("file_size"), len(indexes)
+        )
+        results[index] = result
+        # 배치 안의 중복 파일은 대표 파일이 올린 원본을 함께 참조
+        for duplicate in indexes[1:]:
+            results[duplicate] = {**result, "deduplicated": True}
+
+    return results
+
+
+def adopt_uploaded_object(
+    db: Session,
+    audio_file: AudioFile,
+    content_hash: str
+) -> Optional[str]:
+    """
+    해시 없이 등록된 직접 업로드 파일을 중복 제거 대상으로 편입
+
+    같은 해시의 원본이 이미 있으면 그 원본을 참조하도록 바꾸고, 없으면 업로드된 객체를 새 원본으로 등록합니다.
+    커밋은 호출 측에서 수행합니다.
+
+    Returns:
+        커밋 후 삭제해야 하는 중복 S3 객체 URL (없으면 None)
+    """
+    audio_file.content_hash = content_hash
+    blob = _increment_existing_blob(db, content_hash)
+    if blob:
+        logger.info(f"직접 업로드 파일을 기존 원본으로 대체: {content_hash[:12]} (참조 {blob.ref_count})")
+        duplicate_url = audio_file.s3_url
+        audio_file.blob = blob
+        audio_file.s3_url = blob.s3_url
+        return duplicate_url
+
+    result = _register_uploaded_blob(
+        db, content_hash, {"direct_url": audio_file.s3_url}, audio_file.file_size
+    )
+    audio_file.blob = result["blob"]
+    audio_file.s3_url = result["direct_url"]
+    return None
+
+
+def _increment_existing_blob(
+    db: Session,
+    content_hash: str,
+    count: int = 1
+) -> Optional[AudioBlob]:
+    """해시에 해당하는 원본의 참조 카운트를 count만큼 증가시키고 반환 (행 잠금)"""
+    blob = db.query(AudioBlob).filter(
+        AudioBlob.content_hash == content_hash
+    ).with_for_update().first()
+    if blob:
+        blob.ref_count += count
+    return blob
+
+
+def release_blob(db: Session, audio_file: AudioFile) -> List[str]:
+    """
+    AudioFile이 참조하던 S3 원본의 참조를 해제
+
+    마지막 참조일 때만 원본 행을 삭제하고, 원본과 트랜스코딩 파생 파일 URL을 반환합니다.
+    파생 파일은 원본 키로 정해지므로 삭제되는 AudioFile이 트랜스코딩하지 않았어도 함께 지웁니다.
+    S3 객체는 호출 측에서 커밋한 뒤 delete_released_objects로 삭제해야 합니다.
+    (커밋 전에 지우면 롤백 시 원본 행이 삭제된 객체를 가리키게 됨)
+    중복 제거 도입 이전에 업로드된 파일(blob 없음)은 항상 단독 소유로 간주합니다.
+
+    Returns:
+        커밋 후 삭제해야 하는 S3 객체 URL 목록 (다른 파일이 아직 참조 중이면 빈 목록)
+    """
+    if audio_file.blob_id is None:
+        s3_url = audio_file.s3_url
+    else:
+        blob = db.query(AudioBlob).filter(
+            AudioBlob.id == audio_file.blob_id
+        ).with_for_update().first()
+        if not blob:
+            return []
+
+        blob.ref_count -= 1
+        if blob.ref_count > 0:
+            logger.info(f"오디오 원본 참조 해제: {blob.content_hash[:12]} (남은 참조 {blob.ref_count})")
+            return []
+
+        s3_url = blob.s3_url
+        audio_file.blob_id = None
+        db.flush()
+        db.delete(blob)
+
+    urls = [s3_url, *build_transcoded_urls(s3_url)]
+    if audio_file.transcoded_s3_url and audio_file.transcoded_s3_url not in urls:
+        urls.append(audio_file.transcoded_s3_url)
+    return urls
+
+
+def delete_released_objects(urls: List[str]) -> None:
+    """release_blob이 반환한 S3 객체 삭제 (커밋 후 호출, 실패해도 요청은 실패시키지 않음)"""
+    for url in urls:
+        try:
+            delete_file_from_s3(url)
+        except Exception as e:
+            logger.warning(f"해제된 S3 객체 삭제 실패: {url} ({e})")
+
+
+def find_reusable_transcript(
+    db: Session,
+    audio_file: AudioFile,
+    stt_config: Dict[str, Any],
+    config_builder
+):
+    """
+    같은 내용(해시)과 같은 STT 설정으로 이미 완료된 다른 파일의 Transcript 검색
+
+    사용자가 편집한 결과는 재사용하지 않습니다.
+
+    Args:
+        config_builder: AudioFile → STT 설정 딕셔너리 변환 함수
+    """
+    if not audio_file.content_hash:
+        return None
+
+    candidates = db.query(AudioFile).filter(
+        AudioFile.content_hash == audio_file.content_hash,
+        AudioFile.id != audio_file.id,
+        AudioFile.stt_status == "completed"
+    ).order_by(AudioFile.stt_processed_at.desc()).all()
+
+    for candidate in candidates:
+        transcript = candidate.transcript
+        if not transcript or transcript.is_edited:
+            continue
+        if config_builder(candidate) == stt_config:
+            return transcript
+
+    return None
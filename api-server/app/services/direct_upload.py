@@ -0,0 +1,118 @@
+import os
+import math
+import hashlib
+import logging
+from typing import Tuple, List, Dict, Any
+
+from app.services.s3 import iter_s3_object, delete_file_from_s3
+from app.services.audio_utils import HASH_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+# 직접 업로드 설정
+DIRECT_UPLOAD_PART_SIZE = int(os.getenv("DIRECT_UPLOAD_PART_SIZE", str(8 * 1024 * 1024)))  # bytes
+DIRECT_UPLOAD_MAX_SIZE = int(os.getenv("DIRECT_UPLOAD_MAX_SIZE", str(2000 * 1024 * 1024)))  # bytes
+DIRECT_UPLOAD_URL_EXPIRES = int(os.getenv("DIRECT_UPLOAD_URL_EXPIRES", "3600"))  # 초
+# 완료되지 않은 업로드 세션 보관 기간 (이후 scripts/cleanup_upload_sessions.py로 정리)
+DIRECT_UPLOAD_SESSION_TTL_HOURS = int(os.getenv("DIRECT_UPLOAD_SESSION_TTL_HOURS", "72"))
+
+# S3 멀티파트 업로드 제약 (마지막 파트를 제외한 최소 파트 크기, 최대 파트 수)
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+S3_MAX_PARTS = 10000
+
+
+def plan_parts(file_size: int) -> Tuple[int, int]:
+    """
+    파일 크기에 맞는 (파트 크기, 파트 수) 결정
+
+    기본 파트 크기를 쓰되 S3 최대 파트 수를 넘지 않도록 필요하면 파트 크기를 늘립니다.
+    """
+    part_size = max(DIRECT_UPLOAD_PART_SIZE, S3_MIN_PART_SIZE)
+    part_size = max(part_size, math.ceil(file_size / S3_MAX_PARTS))
+    return part_size, max(1, math.ceil(file_size / part_size))
+
+
+def expected_part_size(session, part_number: int) -> int:
+    """파트 번호별 크기 (마지막 파트만 나머지 크기)"""
+    if part_number < session.part_count:
+        return session.part_size
+    return session.file_size - session.part_size * (session.part_count - 1)
+
+
+def summarize_parts(session, uploaded_parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    S3에 올라간 파트 목록으로 이어 올리기 상태 계산
+
+    크기가 예상과 다른 파트(중간에 끊긴 업로드 등)는 올라가지 않은 것으로 취급합니다.
+
+    Returns:
+        uploaded_parts, missing_parts, uploaded_bytes, next_offset(처음으로 빠진 파트의 시작 바이트)
+    """
+    valid = {
+        part["PartNumber"]: part
+        for part in uploaded_parts
+        if 1 <= part["PartNumber"] <= session.part_count
+        and part["Size"] == expected_part_size(session, part["PartNumber"])
+    }
+    missing = [
+        part_number for part_number in range(1, session.part_count + 1)
+        if part_number not in valid
+    ]
+    return {
+        "uploaded_parts": [
+            {
+                "part_number": part_number,
+                "size": part["Size"],
+                "etag": part["ETag"],
+                "checksum_sha256": part.get("ChecksumSHA256"),
+            }
+            for part_number, part in sorted(valid.items())
+        ],
+        "missing_parts": missing,
+        "uploaded_bytes": sum(part["Size"] for part in valid.values()),
+        "next_offset": (missing[0] - 1) * session.part_size if missing else session.file_size,
+    }
+
+
+def compute_s3_content_hash(s3_url: str) -> str:
+    """S3 객체를 스트리밍으로 읽어 SHA-256 해시 계산 (업로드 직후 백그라운드에서 실행)"""
+    hasher = hashlib.sha256()
+    for chunk in iter_s3_object(s3_url, HASH_CHUNK_SIZE):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def finalize_direct_upload(audio_file_id: int):
+    """
+    직접 업로드된 파일의 내용 해시를 계산하여 중복 제거/STT 캐시 대상으로 편입 (백그라운드 작업)
+
+    업로드 요청 경로에서 파일 전체를 읽지 않도록 완료 응답 이후에 실행합니다.
+    이미 STT가 진행 중이면 처리 중인 S3 객체를 지우지 않도록 해시만 기록합니다.
+    """
+    from app.db.session import SessionLocal
+    from app.db.models import AudioFile
+    from app.services.dedup import adopt_uploaded_object
+
+    db = SessionLocal()
+    try:
+        audio_file = db.query(AudioFile).filter(AudioFile.id == audio_file_id).first()
+        if not audio_file or audio_file.content_hash:
+            return
+
+        content_hash = compute_s3_content_hash(audio_file.s3_url)
+        # 해시 계산 중 시작된 STT와 경합하지 않도록 행을 잠근 뒤 상태 재확인
+        db.refresh(audio_file, with_for_update=True)
+        if audio_file.stt_status == "processing":
+            audio_file.content_hash = content_hash
+            db.commit()
+            return
+
+        duplicate_url = adopt_uploaded_object(db, audio_file, content_hash)
+        db.commit()
+        if duplicate_url:
+            delete_file_from_s3(duplicate_url)
+    except Exception as e:
+        logger.warning(f"직접 업로드 파일 해시 계산 실패: file {audio_file_id} ({e})")
+        db.rollback()
+    finally:
+        db.close()
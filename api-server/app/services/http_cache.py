@@ -0,0 +1,98 @@
+import json
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# 대시보드 조회 응답 기본 캐시 정책: 브라우저에 저장하되 매번 ETag로 재검증
+DEFAULT_CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(*parts: Any) -> str:
+    """
+    응답을 결정하는 값들로 약한(weak) ETag 생성
+
+    직렬화된 본문이 아닌 버전 정보(updated_at, 상태 등)로 만들어 본문을 만들기 전에 비교할 수 있습니다.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _strip_weak(etag: str) -> str:
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [_strip_weak(tag) for tag in if_none_match.split(",")]
+    return _strip_weak(etag) in candidates
+
+
+def _to_utc(value: datetime) -> datetime:
+    # DB에는 UTC naive datetime으로 저장됨
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def format_http_date(value: datetime) -> str:
+    return format_datetime(_to_utc(value).replace(microsecond=0), usegmt=True)
+
+
+def is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    조건부 GET 판단
+
+    If-None-Match가 있으면 ETag만 비교하고, 없을 때만 If-Modified-Since를 사용합니다.
+    """
+    if request.headers.get("if-none-match"):
+        return etag_matches(request, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since is None:
+        return False
+    # HTTP 날짜는 초 단위이므로 마이크로초를 버리고 비교
+    return _to_utc(last_modified).replace(microsecond=0) <= _to_utc(since)
+
+
+def set_cache_headers(
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = DEFAULT_CACHE_CONTROL
+) -> None:
+    """ETag, Last-Modified, Cache-Control 헤더 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_http_date(last_modified)
+
+
+def not_modified_response(
+    etag: str,
+    cache_control: Optional[str] = DEFAULT_CACHE_CONTROL,
+    last_modified: Optional[datetime] = None
+) -> Response:
+    """본문 없는 304 응답 생성"""
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, last_modified, cache_control)
+    return response
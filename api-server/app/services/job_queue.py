@@ -0,0 +1,511 @@
+import os
+import math
+import time
+import heapq
+import logging
+import itertools
+import threading
+from typing import Callable, Dict, Any, List, Optional, Iterable
+
+from fastapi import HTTPException
+
+from app.services.provider_guard import ProviderUnavailableError, returnzero, openai_provider
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 등급: 사용자가 직접 요청한 단건 작업(interactive)과 일괄 작업(bulk)
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BULK = "bulk"
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BULK)
+
+# 일괄 작업이 대기 중일 때 interactive 작업을 연속으로 실행할 최대 횟수 (이후 일괄 작업 1건 실행)
+SCHEDULER_INTERACTIVE_BURST = int(os.getenv("SCHEDULER_INTERACTIVE_BURST", "4"))
+# 실제 처리 시간으로 예상 처리 속도를 보정하는 비율 (지수 이동 평균)
+RUNTIME_EWMA_ALPHA = 0.2
+
+# STT 스케줄러 설정 (워커 프로세스 단위)
+STT_MAX_CONCURRENCY = int(os.getenv("STT_MAX_CONCURRENCY", "4"))
+STT_MAX_QUEUED_INTERACTIVE = int(os.getenv("STT_MAX_QUEUED_INTERACTIVE", "200"))
+STT_MAX_QUEUED_BULK = int(os.getenv("STT_MAX_QUEUED_BULK", "5000"))
+STT_SECONDS_PER_AUDIO_SECOND = float(os.getenv("STT_SECONDS_PER_AUDIO_SECOND", "0.3"))
+STT_JOB_OVERHEAD_SECONDS = float(os.getenv("STT_JOB_OVERHEAD_SECONDS", "5"))
+# 길이를 모르는 파일의 예상 오디오 길이 (초)
+STT_DEFAULT_AUDIO_SECONDS = int(os.getenv("STT_DEFAULT_AUDIO_SECONDS", "600"))
+
+# 로컬 STT 엔진 스케줄러 설정 (리턴제로 대기열/차단기와 별도로 이 서버의 CPU에서 처리)
+LOCAL_STT_MAX_CONCURRENCY = int(os.getenv("LOCAL_STT_MAX_CONCURRENCY", "2"))
+LOCAL_STT_MAX_QUEUED = int(os.getenv("LOCAL_STT_MAX_QUEUED", "200"))
+LOCAL_STT_SECONDS_PER_AUDIO_SECOND = float(os.getenv("LOCAL_STT_SECONDS_PER_AUDIO_SECOND", "0.5"))
+
+# AI 분석 스케줄러 설정 (워커 프로세스 단위)
+ANALYSIS_MAX_CONCURRENCY = int(os.getenv("ANALYSIS_MAX_CONCURRENCY", "2"))
+ANALYSIS_MAX_QUEUED = int(os.getenv("ANALYSIS_MAX_QUEUED", "50"))
+ANALYSIS_SECONDS_PER_AUDIO_SECOND = float(os.getenv("ANALYSIS_SECONDS_PER_AUDIO_SECOND", "0.02"))
+ANALYSIS_JOB_OVERHEAD_SECONDS = float(os.getenv("ANALYSIS_JOB_OVERHEAD_SECONDS", "20"))
+
+
+class RetryLater(Exception):
+    """작업을 실패로 끝내지 않고 retry_after초 뒤 다시 대기열에 넣도록 요청 (작업 함수에서 발생)"""
+
+    def __init__(self, retry_after: float, message: str = ""):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def audio_seconds(audio_file) -> float:
+    """AudioFile의 오디오 길이(초) - 작업 비용 추정용 (길이를 모르면 기본값)"""
+    if audio_file.duration_ms:
+        return audio_file.duration_ms / 1000
+    if audio_file.duration:
+        return float(audio_file.duration)
+    return float(STT_DEFAULT_AUDIO_SECONDS)
+
+
+class Job:
+    """
+    스케줄러 작업 하나
+
+    cost는 작업량(오디오 길이 초)으로, 짧은 작업 우선 실행과 공정 분배, ETA 계산에 사용합니다.
+    tenant_id가 있으면 사용자 단위로, 없으면 보고서 단위로 공정하게 분배합니다.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        report_id: int,
+        func: Callable,
+        args: tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        priority: str = PRIORITY_INTERACTIVE,
+        cost: float = 0,
+        tenant_id: Optional[int] = None
+    ):
+        if priority not in PRIORITIES:
+            raise ValueError(f"알 수 없는 우선순위: {priority}")
+        self.key = key
+        self.report_id = report_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.priority = priority
+        self.cost = max(float(cost or 0), 0.0)
+        self.flow = ("tenant", tenant_id) if tenant_id is not None else ("report", report_id)
+        self.enqueued_at = time.time()
+        self.started_at = None
+        self.deferred_until = None
+        self.start_tag = 0.0
+        self.finish_tag = 0.0
+
+
+class JobScheduler:
+    """
+    우선순위 등급과 공정 큐잉을 적용한 작업 스케줄러
+
+    - 등급: interactive 작업을 먼저 실행하되, 일괄 작업이 굶지 않도록
+      interactive를 SCHEDULER_INTERACTIVE_BURST건 연속 실행하면 일괄 작업을 1건 실행합니다.
+    - 공정 큐잉: 등급마다 보고서(또는 사용자)별 가상 완료 시각(예상 처리 시간 누적)이 가장 이른
+      작업부터 실행합니다. 파일이 많은 보고서도 자기 몫 이상을 차지하지 못하고,
+      같은 조건이면 짧은 작업이 먼저 실행됩니다.
+    - 수용 제어: 등급별 최대 대기 수를 넘으면 429와 Retry-After를 반환하고,
+      등록된 작업마다 대기 순번과 예상 시작/완료 시간을 계산합니다.
+
+    예상 처리 시간은 작업량 × 처리 속도 + 고정 비용이며, 처리 속도는 실제 처리 시간으로 보정합니다.
+    gate가 0보다 큰 값(외부 API 차단기가 열린 남은 시간)을 반환하는 동안에는 새 작업을 꺼내지 않고,
+    실행 중 차단기에 막힌 작업(ProviderUnavailableError)이나 재시도를 요청한 작업(RetryLater)은
+    잠시 뒤 같은 작업 객체를 다시 대기열에 넣습니다.
+    같은 key의 작업을 replace로 등록하면 대기/연기 중인 작업은 새 작업으로 바뀌고,
+    실행 중인 작업은 멈출 수 없으므로 끝난 뒤(재시도 요청은 무시) 새 작업을 시작합니다.
+    워커 스레드는 첫 작업이 들어올 때 시작합니다. (gunicorn 워커 프로세스마다 별도의 스케줄러를 가집니다)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_queued: Dict[str, int],
+        seconds_per_cost: float,
+        overhead_seconds: float,
+        gate: Optional[Callable[[], float]] = None
+    ):
+        self.name = name
+        self.gate = gate
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.overhead_seconds = overhead_seconds
+        self._seconds_per_cost = seconds_per_cost
+        self._heaps = {priority: [] for priority in PRIORITIES}  # (finish_tag, seq, Job)
+        self._virtual_time = {priority: 0.0 for priority in PRIORITIES}
+        self._flow_tags = {priority: {} for priority in PRIORITIES}  # flow → 마지막 가상 완료 시각
+        self._jobs = {}  # key → Job (대기/실행 중, 중복 등록 방지)
+        self._running = {}  # key → Job
+        self._deferred = {}  # key → Job (차단기로 연기되어 재등록 대기 중)
+        self._pending = {}  # key → Job (같은 key의 실행 중 작업이 끝나면 시작할 대체 작업)
+        self._seq = itertools.count()
+        self._interactive_streak = 0
+        self._condition = threading.Condition()
+        self._workers = []
+
+    def expected_runtime(self, job: Job) -> float:
+        """작업의 예상 처리 시간 (초)"""
+        return self.overhead_seconds + job.cost * self._seconds_per_cost
+
+    def ensure_capacity(self, priority: str, count: int = 1) -> None:
+        """
+        해당 등급 대기열에 count개를 더 넣을 수 없으면 429 발생
+
+        Retry-After는 같은 등급의 다음 작업이 시작될 때까지의 예상 시간입니다.
+        """
+        with self._condition:
+            if len(self._heaps[priority]) + count <= self.max_queued[priority]:
+                return
+            retry_after = 1
+            heap = self._heaps[priority]
+            if heap:
+                head = min(heap)[2]
+                retry_after = max(self._simulate()[head.key]["wait_seconds"], 1)
+        raise HTTPException(
+            status_code=429,
+            detail="처리 대기 중인 작업이 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+    def capacity(self, priority: str) -> int:
+        """해당 등급 대기열에 더 넣을 수 있는 작업 수"""
+        with self._condition:
+            return max(self.max_queued[priority] - len(self._heaps[priority]), 0)
+
+    def submit(self, jobs: List[Job], replace: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        작업 등록 (이미 대기/실행 중인 작업은 건너뜀)
+
+        같은 보고서의 작업은 짧은 것부터 가상 완료 시각을 매겨 먼저 실행되게 합니다.
+        replace가 True이면 같은 key의 기존 작업을 건너뛰지 않고 새 작업으로 대체합니다.
+
+        Returns:
+            작업 key별 대기 정보 (ticket 참고)
+        """
+        with self._condition:
+            added = 0
+            for job in sorted(jobs, key=lambda j: (j.flow, j.cost)):
+                if job.key in self._jobs:
+                    if not replace:
+                        continue
+                    if job.key in self._running:
+                        # 실행 중인 작업은 멈출 수 없으므로 끝난 뒤 새 작업을 시작
+                        self._pending[job.key] = job
+                        continue
+                    self._discard(job.key)
+                self._push(job)
+                self._jobs[job.key] = job
+                added += 1
+            if added:
+                self._ensure_workers()
+                self._condition.notify(added)
+
+            estimates = self._simulate()
+            return {job.key: estimates.get(job.key) for job in jobs}
+
+    def _push(self, job: Job) -> None:
+        """가상 완료 시각을 매겨 대기열에 넣기 (호출 측에서 _condition을 잡고 있어야 함)"""
+        tags = self._flow_tags[job.priority]
+        job.start_tag = max(self._virtual_time[job.priority], tags.get(job.flow, 0.0))
+        job.finish_tag = job.start_tag + self.expected_runtime(job)
+        tags[job.flow] = job.finish_tag
+        heapq.heappush(self._heaps[job.priority], (job.finish_tag, next(self._seq), job))
+
+    def _discard(self, key: str) -> Optional[Job]:
+        """대기/연기 중인 작업 제거 (호출 측에서 _condition을 잡고 있어야 함)"""
+        job = self._deferred.pop(key, None)
+        if job is None:
+            for heap in self._heaps.values():
+                entry = next((entry for entry in heap if entry[2].key == key), None)
+                if entry is not None:
+                    heap.remove(entry)
+                    heapq.heapify(heap)
+                    job = entry[2]
+                    break
+        if job is not None:
+            self._jobs.pop(key, None)
+        return job
+
+    def cancel(self, key: str) -> bool:
+        """
+        대기/연기 중인 작업과 실행 후 시작할 대체 작업 취소
+
+        실행 중인 작업은 멈출 수 없으므로 그대로 둡니다.
+
+        Returns:
+            취소한 작업이 있는지 여부
+        """
+        with self._condition:
+            replacement = self._pending.pop(key, None)
+            if key in self._running:
+                return replacement is not None
+            return self._discard(key) is not None
+
+    def _pause_seconds(self) -> float:
+        return self.gate() if self.gate else 0.0
+
+    def ticket(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        작업의 대기 정보 (이 프로세스에 없는 작업이면 None)
+
+        state(queued/running/deferred), priority, position(대기 순번, 실행 중이면 0),
+        wait_seconds(시작까지 예상 시간), eta_seconds(완료까지 예상 시간)
+        """
+        with self._condition:
+            if key not in self._jobs:
+                return None
+            return self._simulate().get(key)
+
+    def active_keys(self) -> List[str]:
+        """이 프로세스에서 대기/실행/연기 중인 작업 키 목록"""
+        with self._condition:
+            return list(self._jobs)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """대기/실행 중인 작업 현황"""
+        with self._condition:
+            now = time.time()
+            estimates = self._simulate()
+            queued_by_report = {}
+            for heap in self._heaps.values():
+                for _, _, job in heap:
+                    queued_by_report[job.report_id] = queued_by_report.get(job.report_id, 0) + 1
+            return {
+                "workers": self.max_workers,
+                "seconds_per_cost": round(self._seconds_per_cost, 4),
+                "running": [
+                    {
+                        "key": job.key,
+                        "report_id": job.report_id,
+                        "priority": job.priority,
+                        "elapsed_seconds": int(now - job.started_at),
+                        "eta_seconds": math.ceil(
+                            max(self.expected_runtime(job) - (now - job.started_at), 0.0)
+                        ),
+                    }
+                    for job in self._running.values()
+                ],
+                "queued": sum(len(heap) for heap in self._heaps.values()),
+                "deferred": len(self._deferred),
+                "replacing": len(self._pending),
+                "paused_seconds": math.ceil(self._pause_seconds()),
+                "queued_by_priority": {
+                    priority: len(heap) for priority, heap in self._heaps.items()
+                },
+                "queued_by_report": queued_by_report,
+                "drain_seconds": max(
+                    (estimate["eta_seconds"] for estimate in estimates.values()), default=0
+                ),
+            }
+
+    def _next_priority(self, interactive_left: bool, bulk_left: bool, streak: int) -> Optional[str]:
+        if interactive_left and (not bulk_left or streak < SCHEDULER_INTERACTIVE_BURST):
+            return PRIORITY_INTERACTIVE
+        return PRIORITY_BULK if bulk_left else None
+
+    def _simulate(self) -> Dict[str, Dict[str, Any]]:
+        """
+        대기열을 실행 순서대로 워커에 배치하여 작업별 순번과 예상 시작/완료 시간 계산
+
+        호출 측에서 _condition을 잡고 있어야 합니다.
+        """
+        now = time.time()
+        estimates = {}
+        free_at = []
+        for job in self._running.values():
+            remaining = max(self.expected_runtime(job) - (now - job.started_at), 0.0)
+            free_at.append(remaining)
+            estimates[job.key] = {
+                "state": "running",
+                "priority": job.priority,
+                "position": 0,
+                "wait_seconds": 0,
+                "eta_seconds": math.ceil(remaining),
+            }
+        for job in self._pending.values():
+            # 같은 key의 실행 중 작업이 끝나면 시작 (대기 순번 없음)
+            running = self._running[job.key]
+            remaining = max(self.expected_runtime(running) - (now - running.started_at), 0.0)
+            estimates[job.key] = {
+                "state": "queued",
+                "priority": job.priority,
+                "position": None,
+                "wait_seconds": math.ceil(remaining),
+                "eta_seconds": math.ceil(remaining + self.expected_runtime(job)),
+            }
+        free_at.extend([0.0] * max(self.max_workers - len(free_at), 0))
+        # 차단기로 일시 정지 중이면 정지가 풀린 뒤부터 시작
+        pause = self._pause_seconds()
+        free_at = [max(at, pause) for at in free_at]
+        heapq.heapify(free_at)
+        
+        for job in self._deferred.values():
+            remaining = max(job.deferred_until - now, 0.0)
+            estimates[job.key] = {
+                "state": "deferred",
+                "priority": job.priority,
+                "position": None,
+                "wait_seconds": math.ceil(remaining),
+                "eta_seconds": math.ceil(remaining + self.expected_runtime(job)),
+            }
+
+        queues = {priority: sorted(heap) for priority, heap in self._heaps.items()}
+        index = {priority: 0 for priority in PRIORITIES}
+        streak = self._interactive_streak
+        position = 0
+        while True:
+            interactive_left = index[PRIORITY_INTERACTIVE] < len(queues[PRIORITY_INTERACTIVE])
+            bulk_left = index[PRIORITY_BULK] < len(queues[PRIORITY_BULK])
+            priority = self._next_priority(interactive_left, bulk_left, streak)
+            if priority is None:
+                break
+            if priority == PRIORITY_INTERACTIVE:
+                streak = streak + 1 if bulk_left else 0
+            else:
+                streak = 0
+
+            job = queues[priority][index[priority]][2]
+            index[priority] += 1
+            position += 1
+            start = heapq.heappop(free_at)
+            finish = start + self.expected_runtime(job)
+            heapq.heappush(free_at, finish)
+            estimates[job.key] = {
+                "state": "queued",
+                "priority": job.priority,
+                "position": position,
+                "wait_seconds": math.ceil(start),
+                "eta_seconds": math.ceil(finish),
+            }
+        return estimates
+
+    def _ensure_workers(self) -> None:
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._work,
+                name=f"{self.name}-{len(self._workers)}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _take(self) -> Job:
+        with self._condition:
+            while True:
+                bulk_left = bool(self._heaps[PRIORITY_BULK])
+                priority = self._next_priority(
+                    bool(self._heaps[PRIORITY_INTERACTIVE]), bulk_left, self._interactive_streak
+                )
+                if priority is None:
+                    self._condition.wait()
+                    continue
+                pause = self._pause_seconds()
+                if pause <= 0:
+                    break
+                # 외부 API 차단기가 열려 있는 동안 새 작업을 꺼내지 않음
+                self._condition.wait(timeout=pause)
+
+            if priority == PRIORITY_INTERACTIVE:
+                self._interactive_streak = self._interactive_streak + 1 if bulk_left else 0
+            else:
+                self._interactive_streak = 0
+
+            heap = self._heaps[priority]
+            _, _, job = heapq.heappop(heap)
+            self._virtual_time[priority] = max(self._virtual_time[priority], job.start_tag)
+            if not heap:
+                # 대기열이 비면 보고서별 누적 시각을 초기화 (쉬던 보고서가 불리해지지 않도록)
+                self._flow_tags[priority].clear()
+            job.started_at = time.time()
+            self._running[job.key] = job
+            return job
+
+    def _record_runtime(self, job: Job, runtime: float) -> None:
+        # 고정 비용보다 짧게 끝난 작업(캐시 적중 등)은 처리 속도 추정에서 제외
+        if job.cost <= 0 or runtime <= self.overhead_seconds:
+            return
+        sample = (runtime - self.overhead_seconds) / job.cost
+        self._seconds_per_cost += RUNTIME_EWMA_ALPHA * (sample - self._seconds_per_cost)
+
+    def _defer(self, job: Job, delay: float) -> None:
+        """delay초 뒤 작업을 다시 대기열에 넣음 (호출 측에서 _condition을 잡고 있어야 함)"""
+        job.deferred_until = time.time() + delay
+        self._deferred[job.key] = job
+        timer = threading.Timer(delay, self._resume, args=(job,))
+        timer.daemon = True
+        timer.start()
+
+    def _resume(self, job: Job) -> None:
+        with self._condition:
+            # 연기된 동안 취소/대체되었으면 무시
+            if self._deferred.get(job.key) is not job:
+                return
+            del self._deferred[job.key]
+            job.deferred_until = None
+            self._push(job)
+            self._condition.notify()
+
+    def _work(self) -> None:
+        while True:
+            job = self._take()
+            retry_after = None
+            try:
+                job.func(*job.args, **job.kwargs)
+            except (ProviderUnavailableError, RetryLater) as e:
+                retry_after = max(e.retry_after, 1.0)
+                logger.info(f"{self.name} 작업 연기: {job.key} ({int(retry_after)}초 후 재등록, {e})")
+            except Exception as e:
+                logger.error(f"{self.name} 작업 실패: {job.key} ({e})")
+            finally:
+                with self._condition:
+                    self._running.pop(job.key, None)
+                    if retry_after is None:
+                        self._record_runtime(job, time.time() - job.started_at)
+                    replacement = self._pending.pop(job.key, None)
+                    if replacement is not None:
+                        # 실행 중에 대체된 작업은 재시도하지 않고 새 작업을 등록
+                        self._jobs[job.key] = replacement
+                        self._push(replacement)
+                        self._condition.notify()
+                    elif retry_after is not None:
+                        self._defer(job, retry_after)
+                    else:
+                        self._jobs.pop(job.key, None)
+
+
+def summarize_tickets(tickets: Iterable[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """여러 작업의 대기 정보 요약 (등록 수, 마지막 작업 완료까지 예상 시간)"""
+    tickets = [ticket for ticket in tickets if ticket]
+    return {
+        "queued": len(tickets),
+        "eta_seconds": max((ticket["eta_seconds"] for ticket in tickets), default=0),
+    }
+
+
+stt_queue = JobScheduler(
+    "stt",
+    STT_MAX_CONCURRENCY,
+    {PRIORITY_INTERACTIVE: STT_MAX_QUEUED_INTERACTIVE, PRIORITY_BULK: STT_MAX_QUEUED_BULK},
+    STT_SECONDS_PER_AUDIO_SECOND,
+    STT_JOB_OVERHEAD_SECONDS,
+    gate=returnzero.retry_after,
+)
+
+local_stt_queue = JobScheduler(
+    "stt_local",
+    LOCAL_STT_MAX_CONCURRENCY,
+    {PRIORITY_INTERACTIVE: LOCAL_STT_MAX_QUEUED, PRIORITY_BULK: LOCAL_STT_MAX_QUEUED},
+    LOCAL_STT_SECONDS_PER_AUDIO_SECOND,
+    STT_JOB_OVERHEAD_SECONDS,
+)
+
+analysis_queue = JobScheduler(
+    "analysis",
+    ANALYSIS_MAX_CONCURRENCY,
+    {PRIORITY_INTERACTIVE: ANALYSIS_MAX_QUEUED, PRIORITY_BULK: ANALYSIS_MAX_QUEUED},
+    ANALYSIS_SECONDS_PER_AUDIO_SECOND,
+    ANALYSIS_JOB_OVERHEAD_SECONDS,
+    gate=openai_provider.retry_after,
+)
@@ -0,0 +1,200 @@
+import os
+import uuid
+import logging
+import importlib.util
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any
+
+from app.services.stt import (
+    STTBackend,
+    TransientSTTError,
+    STT_ENGINE_LOCAL,
+    MIN_POLL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# 로컬 STT 설정 (faster-whisper, CPU 전용)
+# 모델 크기 (tiny, base, small, medium, large-v3 등)와 CPU 연산 정밀도 (int8, int8_float32, float32)
+LOCAL_STT_MODEL = os.getenv("LOCAL_STT_MODEL", "small")
+LOCAL_STT_COMPUTE_TYPE = os.getenv("LOCAL_STT_COMPUTE_TYPE", "int8")
+# 모델 파일 저장 경로 (없으면 faster-whisper 기본 캐시 경로)
+LOCAL_STT_MODEL_DIR = os.getenv("LOCAL_STT_MODEL_DIR") or None
+# 변환 프로세스 수와 프로세스당 CPU 스레드 수
+# (풀은 API 워커 프로세스마다 만들어지므로, 0이면 코어 수를 WEB_CONCURRENCY × 프로세스 수로 나눔)
+LOCAL_STT_WORKERS = int(os.getenv("LOCAL_STT_WORKERS", "2"))
+LOCAL_STT_CPU_THREADS = int(os.getenv("LOCAL_STT_CPU_THREADS", "0"))
+LOCAL_STT_BEAM_SIZE = int(os.getenv("LOCAL_STT_BEAM_SIZE", "5"))
+# 결과 대기 제한 시간 = MIN_POLL_SECONDS + 오디오 길이 × 이 값 (초과 시 재시도에서 같은 작업을 계속 기다림)
+LOCAL_STT_TIMEOUT_PER_AUDIO_SECOND = float(os.getenv("LOCAL_STT_TIMEOUT_PER_AUDIO_SECOND", "1.5"))
+
+# 변환 프로세스마다 한 번만 불러오는 모델
+_worker_model = None
+
+
+def _init_worker(model_size: str, compute_type: str, cpu_threads: int, model_dir: Optional[str]) -> None:
+    """변환 프로세스 시작 시 모델 로드 (작업마다 다시 불러오지 않도록)"""
+    global _worker_model
+    from faster_whisper import WhisperModel
+
+    _worker_model = WhisperModel(
+        model_size,
+        device="cpu",
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        download_root=model_dir,
+    )
+
+
+def _transcribe_in_worker(file_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    변환 프로세스에서 음성 파일을 변환하여 리턴제로 응답 형식으로 반환
+
+    화자 분리는 지원하지 않으므로 발화에 spk가 없습니다.
+    """
+    segments, info = _worker_model.transcribe(
+        file_path,
+        language=options.get("language"),
+        beam_size=options.get("beam_size", LOCAL_STT_BEAM_SIZE),
+        initial_prompt=options.get("initial_prompt"),
+        vad_filter=True,
+    )
+
+    utterances = []
+    for segment in segments:
+        text = segment.text.strip()
+        if not text:
+            continue
+        start_at = int(segment.start * 1000)
+        utterances.append({
+            "start_at": start_at,
+            "duration": max(0, int(segment.end * 1000) - start_at),
+            "msg": text,
+        })
+
+    return {
+        "status": "completed",
+        "engine": STT_ENGINE_LOCAL,
+        "model": options.get("model"),
+        "language": info.language,
+        "results": {"utterances": utterances},
+    }
+
+
+class LocalWhisperSTTService(STTBackend):
+    """
+    로컬 CPU에서 실행하는 faster-whisper STT 엔진
+
+    변환은 별도 프로세스 풀에서 실행하여 API 워커의 GIL/CPU를 점유하지 않습니다.
+    작업 ID는 이 프로세스 안에서만 유효하므로 재시작되면 처음부터 다시 변환합니다.
+    faster-whisper가 설치되어 있지 않으면 생성 시 ValueError를 발생시킵니다.
+    """
+    name = STT_ENGINE_LOCAL
+    durable_tasks = False
+
+    def __init__(self):
+        if importlib.util.find_spec("faster_whisper") is None:
+            raise ValueError(
+                "로컬 STT 엔진을 사용하려면 faster-whisper 패키지가 필요합니다. "
+                "(pip install -r requirements-local-stt.txt)"
+            )
+
+        self.workers = max(1, LOCAL_STT_WORKERS)
+        web_workers = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+        self.cpu_threads = LOCAL_STT_CPU_THREADS or max(
+            1, (os.cpu_count() or 1) // (web_workers * self.workers)
+        )
+        self._tasks: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._pool = self._create_pool()
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        # 스레드가 있는 API 워커를 fork하지 않도록 spawn으로 프로세스 생성
+        logger.info(
+            f"로컬 STT 프로세스 풀 시작: 모델 {LOCAL_STT_MODEL} ({LOCAL_STT_COMPUTE_TYPE}), "
+            f"프로세스 {self.workers}개 × 스레드 {self.cpu_threads}개"
+        )
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(LOCAL_STT_MODEL, LOCAL_STT_COMPUTE_TYPE, self.cpu_threads, LOCAL_STT_MODEL_DIR),
+        )
+
+    def build_request_config(
+        self,
+        config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        STT 설정을 faster-whisper 옵션으로 변환
+
+        언어가 detect/multi이면 자동 감지하고, 키워드는 initial_prompt로 전달합니다.
+        화자 분리, 간투어/비속어 필터, 도메인 설정은 적용되지 않습니다.
+        """
+        config = config or {}
+        language = config.get("language") or "ko"
+        keywords = config.get("keywords")
+        return {
+            "model": LOCAL_STT_MODEL,
+            "language": None if language in ["detect", "multi"] else language,
+            "beam_size": LOCAL_STT_BEAM_SIZE,
+            "initial_prompt": ", ".join(keywords) if keywords else None,
+        }
+
+    def submit(
+        self,
+        file_path: str,
+        file_extension: str,
+        mime_type: str,
+        request_config: Dict[str, Any]
+    ) -> str:
+        """프로세스 풀에 변환 작업을 등록하고 작업 ID 반환"""
+        task_id = f"local-{uuid.uuid4().hex}"
+        with self._lock:
+            try:
+                future = self._pool.submit(_transcribe_in_worker, file_path, request_config)
+            except BrokenProcessPool:
+                # 변환 프로세스가 비정상 종료된 경우 (메모리 부족 등) 풀을 다시 만듦
+                logger.warning("로컬 STT 프로세스 풀 재시작")
+                self._pool = self._create_pool()
+                future = self._pool.submit(_transcribe_in_worker, file_path, request_config)
+            self._tasks[task_id] = future
+
+        logger.info(f"로컬 STT 작업 등록: {task_id} ({file_path})")
+        return task_id
+
+    def poll(self, task_id: str, duration_ms: Optional[int] = None) -> Dict[str, Any]:
+        """변환이 끝날 때까지 기다려 결과 반환"""
+        with self._lock:
+            future = self._tasks.get(task_id)
+        if future is None:
+            # 프로세스 재시작 등으로 작업이 사라짐 - 재시도 시 다시 등록
+            raise TransientSTTError(f"로컬 STT 작업을 찾을 수 없습니다: {task_id}", resubmit=True)
+
+        timeout_seconds = MIN_POLL_SECONDS + (duration_ms or 0) / 1000 * LOCAL_STT_TIMEOUT_PER_AUDIO_SECOND
+        try:
+            result = future.result(timeout=timeout_seconds)
+        except FutureTimeoutError:
+            # 작업은 계속 실행 중이므로 재시도 시 같은 작업을 다시 기다림
+            raise TransientSTTError(f"로컬 STT 작업 시간 초과 ({int(timeout_seconds)}초)")
+        except BrokenProcessPool as e:
+            self._forget(task_id)
+            raise TransientSTTError(f"로컬 STT 프로세스 비정상 종료: {e}", resubmit=True)
+        except Exception as e:
+            self._forget(task_id)
+            logger.error(f"로컬 STT 작업 실패. Task ID: {task_id}, Error: {e}")
+            raise Exception(f"STT 작업 실패: {e}")
+
+        self._forget(task_id)
+        logger.info(
+            f"로컬 STT 작업 완료. Task ID: {task_id} "
+            f"(발화 {len(result['results']['utterances'])}개, 언어 {result.get('language')})"
+        )
+        return result
+
+    def _forget(self, task_id: str) -> None:
+        with self._lock:
+            self._tasks.pop(task_id, None)
@@ -0,0 +1,326 @@
+import os
+import time
+import random
+import logging
+import threading
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Any, Optional, Tuple
+
+import requests
+import openai
+
+logger = logging.getLogger(__name__)
+
+# 차단기 설정: 최근 CIRCUIT_WINDOW_SECONDS 동안 CIRCUIT_MIN_REQUESTS건 이상 호출했고
+# 실패 비율이 CIRCUIT_FAILURE_RATIO 이상이면 새 호출을 막음 (열림 시간은 재차단마다 2배, 최대값까지)
+CIRCUIT_WINDOW_SECONDS = int(os.getenv("CIRCUIT_WINDOW_SECONDS", "60"))
+CIRCUIT_MIN_REQUESTS = int(os.getenv("CIRCUIT_MIN_REQUESTS", "10"))
+CIRCUIT_FAILURE_RATIO = float(os.getenv("CIRCUIT_FAILURE_RATIO", "0.5"))
+CIRCUIT_OPEN_SECONDS = int(os.getenv("CIRCUIT_OPEN_SECONDS", "30"))
+CIRCUIT_MAX_OPEN_SECONDS = int(os.getenv("CIRCUIT_MAX_OPEN_SECONDS", "300"))
+
+# 재시도 백오프 (초): 첫 대기 시간과 최대 대기 시간
+RETRY_BASE_DELAY = float(os.getenv("PROVIDER_RETRY_BASE_DELAY", "2"))
+RETRY_MAX_DELAY = float(os.getenv("PROVIDER_RETRY_MAX_DELAY", "60"))
+# 429 응답에 Retry-After가 없을 때 엔드포인트 전체를 쉬게 할 시간 (초)
+THROTTLE_DEFAULT_SECONDS = float(os.getenv("PROVIDER_THROTTLE_SECONDS", "5"))
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class ProviderUnavailableError(Exception):
+    """차단기가 열려 있어 외부 API를 호출하지 않은 경우 (retry_after초 뒤 다시 시도)"""
+
+    def __init__(self, provider: str, retry_after: float):
+        super().__init__(f"{provider} 호출이 일시 중단되었습니다. ({int(retry_after)}초 후 재시도)")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+def get_status_code(error: Exception) -> Optional[int]:
+    """requests/OpenAI 예외의 HTTP 상태 코드"""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+    return status_code
+
+
+def is_provider_failure(error: Exception) -> bool:
+    """공급자 장애/과부하로 볼 오류인지 (429, 5xx, 연결 실패/타임아웃) - 재시도 및 차단기 집계 대상"""
+    status_code = get_status_code(error)
+    if status_code is not None:
+        return status_code == 429 or status_code >= 500
+    return isinstance(error, (
+        requests.ConnectionError, requests.Timeout, openai.APIConnectionError
+    ))
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """응답의 Retry-After 헤더 (초 또는 HTTP 날짜)"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷 (스레드 간 공유)
+
+    429를 받으면 penalize로 토큰을 음수로 만들어, 같은 엔드포인트를 호출하는 모든 작업이 함께 쉬게 합니다.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """토큰 하나를 얻을 때까지 대기하고 대기한 시간(초) 반환"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def penalize(self, seconds: float) -> None:
+        """seconds초 동안 새 토큰이 나오지 않도록 비움"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class CircuitBreaker:
+    """
+    최근 호출의 실패 비율로 열리고 닫히는 차단기
+
+    - closed: 정상 호출, 창 안의 실패 비율이 임계값을 넘으면 open
+    - open: 호출 거부 (ProviderUnavailableError), 열림 시간이 지나면 half_open
+    - half_open: 한 번에 하나의 시험 호출만 허용, 성공하면 closed, 실패하면 더 길게 open
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = CIRCUIT_CLOSED
+        self._outcomes = deque()  # (시각, 성공 여부)
+        self._open_seconds = CIRCUIT_OPEN_SECONDS
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._state_changed_at = time.time()
+        self._lock = threading.Lock()
+        self.counters = {"success": 0, "failure": 0, "rejected": 0, "opened": 0}
+
+    def retry_after(self) -> float:
+        """열려 있으면 half_open이 될 때까지 남은 시간, 아니면 0"""
+        with self._lock:
+            if self.state != CIRCUIT_OPEN:
+                return 0.0
+            return max(self._opened_at + self._open_seconds - time.time(), 0.0)
+
+    def before_call(self) -> None:
+        """호출 허용 여부 확인 (허용되지 않으면 ProviderUnavailableError)"""
+        with self._lock:
+            now = time.time()
+            if self.state == CIRCUIT_OPEN:
+                remaining = self._opened_at + self._open_seconds - now
+                if remaining > 0:
+                    self.counters["rejected"] += 1
+                    raise ProviderUnavailableError(self.name, remaining)
+                self._transition(CIRCUIT_HALF_OPEN)
+            if self.state == CIRCUIT_HALF_OPEN:
+                if self._probe_in_flight:
+                    self.counters["rejected"] += 1
+                    raise ProviderUnavailableError(self.name, 1.0)
+                self._probe_in_flight = True
+
+    def record(self, success: bool) -> None:
+        """호출 결과 기록"""
+        with self._lock:
+            now = time.time()
+            self.counters["success" if success else "failure"] += 1
+            self._outcomes.append((now, success))
+            while self._outcomes and self._outcomes[0][0] < now - CIRCUIT_WINDOW_SECONDS:
+                self._outcomes.popleft()
+
+            if self.state == CIRCUIT_HALF_OPEN:
+                self._probe_in_flight = False
+                if success:
+                    self._open_seconds = CIRCUIT_OPEN_SECONDS
+                    self._outcomes.clear()
+                    self._transition(CIRCUIT_CLOSED)
+                else:
+                    self._open_seconds = min(self._open_seconds * 2, CIRCUIT_MAX_OPEN_SECONDS)
+                    self._transition(CIRCUIT_OPEN)
+            elif self.state == CIRCUIT_CLOSED and not success:
+                total, failures = self._window_counts()
+                if total >= CIRCUIT_MIN_REQUESTS and failures / total >= CIRCUIT_FAILURE_RATIO:
+                    self._transition(CIRCUIT_OPEN)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total, failures = self._window_counts()
+            return {
+                "state": self.state,
+                "state_since": self._state_changed_at,
+                "retry_after": (
+                    max(self._opened_at + self._open_seconds - time.time(), 0.0)
+                    if self.state == CIRCUIT_OPEN else 0.0
+                ),
+                "window_requests": total,
+                "window_failure_ratio": round(failures / total, 3) if total else 0.0,
+                **self.counters,
+            }
+
+    def _window_counts(self) -> Tuple[int, int]:
+        return len(self._outcomes), sum(1 for _, success in self._outcomes if not success)
+
+    def _transition(self, state: str) -> None:
+        if state == CIRCUIT_OPEN:
+            self._opened_at = time.time()
+            self.counters["opened"] += 1
+            logger.warning(f"{self.name} 차단기 열림: {self._open_seconds}초 동안 호출 중단")
+        else:
+            logger.info(f"{self.name} 차단기 상태 변경: {self.state} → {state}")
+        self.state = state
+        self._state_changed_at = time.time()
+
+
+class Provider:
+    """
+    외부 API 공급자 하나의 엔드포인트별 속도 제한과 차단기
+
+    워커 프로세스 안의 모든 STT/분석 작업 스레드가 공유합니다.
+    (gunicorn 워커 프로세스마다 별도이므로 전체 호출량은 설정값 × 워커 수까지 늘어날 수 있습니다)
+    """
+
+    def __init__(self, name: str, endpoints: Dict[str, Tuple[float, int]]):
+        self.name = name
+        self.breaker = CircuitBreaker(name)
+        self.buckets = {
+            endpoint: TokenBucket(rate, burst) for endpoint, (rate, burst) in endpoints.items()
+        }
+        self._lock = threading.Lock()
+        self._endpoint_counters = {
+            endpoint: {"calls": 0, "throttled": 0, "retries": 0, "waited_seconds": 0.0}
+            for endpoint in endpoints
+        }
+
+    def retry_after(self) -> float:
+        """차단기가 열려 있으면 다시 호출할 수 있을 때까지 남은 시간 (스케줄러 일시 정지용)"""
+        return self.breaker.retry_after()
+
+    def _count(self, endpoint: str, key: str, value=1) -> None:
+        with self._lock:
+            self._endpoint_counters[endpoint][key] += value
+
+    def call(self, endpoint: str, func: Callable, *args, **kwargs):
+        """
+        차단기 확인과 속도 제한을 거쳐 func 호출
+
+        공급자 장애로 볼 오류(429/5xx/연결 실패)만 차단기 실패로 집계하고,
+        429면 Retry-After 동안 해당 엔드포인트의 토큰을 비웁니다.
+        """
+        self.breaker.before_call()
+        bucket = self.buckets[endpoint]
+        waited = bucket.acquire()
+        self._count(endpoint, "calls")
+        if waited:
+            self._count(endpoint, "waited_seconds", waited)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            failure = is_provider_failure(e)
+            self.breaker.record(not failure)
+            if get_status_code(e) == 429:
+                self._count(endpoint, "throttled")
+                bucket.penalize(get_retry_after(e) or THROTTLE_DEFAULT_SECONDS)
+            raise
+        self.breaker.record(True)
+        return result
+
+    def call_with_retry(self, endpoint: str, func: Callable, *args, retries: int = 3, **kwargs):
+        """
+        call에 공급자 장애 오류 재시도 추가 (지수 백오프 + 지터, Retry-After 우선)
+
+        차단기가 열려 거부된 경우(ProviderUnavailableError)는 재시도하지 않고 그대로 전달합니다.
+        """
+        for attempt in range(retries + 1):
+            try:
+                return self.call(endpoint, func, *args, **kwargs)
+            except ProviderUnavailableError:
+                raise
+            except Exception as e:
+                if attempt >= retries or not is_provider_failure(e):
+                    raise
+                delay = get_retry_after(e) or min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY)
+                delay += random.uniform(0, delay / 2)
+                logger.warning(
+                    f"{self.name} {endpoint} 호출 실패, {delay:.1f}초 후 재시도 "
+                    f"({attempt + 1}/{retries}): {e}"
+                )
+                self._count(endpoint, "retries")
+                time.sleep(delay)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """차단기 상태와 엔드포인트별 호출/대기 지표"""
+        with self._lock:
+            endpoints = {
+                endpoint: {
+                    **counters,
+                    "waited_seconds": round(counters["waited_seconds"], 1),
+                    "rate": self.buckets[endpoint].rate,
+                    "burst": self.buckets[endpoint].burst,
+                    "tokens": round(self.buckets[endpoint].tokens, 2),
+                }
+                for endpoint, counters in self._endpoint_counters.items()
+            }
+        return {"circuit": self.breaker.snapshot(), "endpoints": endpoints}
+
+
+def _limit(name: str, rate: str, burst: str) -> Tuple[float, int]:
+    """{name}_RATE(초당 호출 수), {name}_BURST(순간 최대 호출 수) 환경변수"""
+    return float(os.getenv(f"{name}_RATE", rate)), int(os.getenv(f"{name}_BURST", burst))
+
+
+returnzero = Provider("returnzero", {
+    "auth": _limit("RTZR_AUTH", "0.2", "2"),
+    "transcribe": _limit("RTZR_TRANSCRIBE", "2", "5"),
+    "poll": _limit("RTZR_POLL", "10", "20"),
+})
+
+openai_provider = Provider("openai", {
+    "chat": _limit("OPENAI_CHAT", "1", "3"),
+})
+
+PROVIDERS = {provider.name: provider for provider in (returnzero, openai_provider)}
@@ -40,13 +40,18 @@ def extract_s3_key_from_url(s3_url: str) -> str:
     except Exception as e:
         raise ValueError(f"S3 URL 파싱 실패: {e}")
 
-def generate_presigned_url_for_download(s3_url: str, expires_in: int = 3600) -> str:
+def generate_presigned_url_for_download(
+    s3_url: str, 
+    expires_in: int = 3600,
+    as_attachment: bool = True
+) -> str:
     """
     기존 S3 URL을 기반으로 다운로드용 Pre-signed URL을 생성합니다.
     
     Args:
         s3_url: 기존 S3 URL
         expires_in: URL 유효 시간 (초, 기본값: 1시간)
+        as_attachment: 다운로드 강제 여부 (False면 브라우저 재생용)
     
     Returns:
         Pre-signed URL
@@ -72,13 +77,12 @@ def generate_presigned_url_for_download(s3_url: str, expires_in: int = 3600) ->
                 )
         
         # Pre-signed URL 생성 (다운로드 강제를 위한 Content-Disposition 헤더 추가)
+        params = {'Bucket': AWS_S3_BUCKET_NAME, 'Key': key}
+        if as_attachment:
+            params['ResponseContentDisposition'] = 'attachment'
         presigned_url = s3_client.generate_presigned_url(
             'get_object',
-            Params={
-                'Bucket': AWS_S3_BUCKET_NAME, 
-                'Key': key,
-                'ResponseContentDisposition': 'attachment'
-            },
+            Params=params,
             ExpiresIn=expires_in
         )
         
@@ -92,15 +96,18 @@ def generate_presigned_url_for_download(s3_url: str, expires_in: int = 3600) ->
             detail=f"Pre-signed URL 생성 실패: {str(e)}"
         )
 
-def upload_file_to_s3(file_obj, filename, content_type):
+def build_unique_key(filename: str) -> str:
+    """유니크한 S3 키 생성 (타임스탬프 + UUID + 원본 파일명)"""
     import uuid
     from datetime import datetime
     
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    unique_id = str(uuid.uuid4())[:8]  # UUID의 앞 8자리만 사용
+    return f"{timestamp}_{unique_id}_{filename}"
+
+def upload_file_to_s3(file_obj, filename, content_type):
     try:
-        # 유니크한 S3 키 생성 (타임스탬프 + UUID + 원본 파일명)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]  # UUID의 앞 8자리만 사용
-        unique_key = f"{timestamp}_{unique_id}_{filename}"
+        unique_key = build_unique_key(filename)
         
         # 파일 업로드 (유니크한 키 사용)
         s3_client.upload_fileobj(
@@ -114,10 +121,7 @@ def upload_file_to_s3(file_obj, filename, content_type):
         s3_client.head_object(Bucket=AWS_S3_BUCKET_NAME, Key=unique_key)
         
         # 실제 URL 생성
-        direct_url = (
-            f"https://{AWS_S3_BUCKET_NAME}.s3.{AWS_REGION}"
-            f".amazonaws.com/{unique_key}"
-        )
+        direct_url = build_s3_direct_url(unique_key)
         
         # 사전 서명된 URL 생성 (1시간 유효)
         presigned_url = s3_client.generate_presigned_url(
@@ -155,4 +159,183 @@ def delete_file_from_s3(s3_url):
         raise HTTPException(
             status_code=500, 
             detail=f"S3 파일 삭제 실패: {str(e)}"
-        ) 
\ No newline at end of file
+        ) 
+def build_s3_direct_url(key: str) -> str:
+    """S3 키에 해당하는 직접 접근 URL을 생성합니다."""
+    return f"https://{AWS_S3_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com/{key}"
+
+def download_file_from_s3(s3_url: str, dest_path: str) -> None:
+    """
+    S3 파일을 로컬 경로로 다운로드합니다.
+    """
+    try:
+        key = extract_s3_key_from_url(s3_url)
+        s3_client.download_file(AWS_S3_BUCKET_NAME, key, dest_path)
+    except (BotoCoreError, ClientError) as e:
+        raise Exception(f"S3 파일 다운로드 실패: {str(e)}")
+
+def upload_local_file_to_s3(file_path: str, key: str, content_type: str) -> str:
+    """
+    로컬 파일을 지정한 S3 키로 업로드하고 직접 접근 URL을 반환합니다.
+    (트랜스코딩 결과 등 파생 파일 저장용)
+    """
+    try:
+        s3_client.upload_file(
+            file_path,
+            AWS_S3_BUCKET_NAME,
+            key,
+            ExtraArgs={"ContentType": content_type}
+        )
+        return build_s3_direct_url(key)
+    except (BotoCoreError, ClientError) as e:
+        raise Exception(f"S3 업로드 실패: {str(e)}")
+
+def create_multipart_upload(
+    key: str,
+    content_type: str,
+    checksum_algorithm: str = None
+) -> str:
+    """
+    S3 멀티파트 업로드를 시작하고 업로드 ID를 반환합니다.
+    checksum_algorithm(SHA256)을 지정하면 S3가 파트마다 체크섬을 검증합니다.
+    """
+    params = {
+        "Bucket": AWS_S3_BUCKET_NAME,
+        "Key": key,
+        "ContentType": content_type,
+    }
+    if checksum_algorithm:
+        params["ChecksumAlgorithm"] = checksum_algorithm
+    try:
+        response = s3_client.create_multipart_upload(**params)
+        return response["UploadId"]
+    except (BotoCoreError, ClientError) as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"S3 멀티파트 업로드 시작 실패: {str(e)}"
+        )
+
+def generate_presigned_part_url(
+    key: str,
+    upload_id: str,
+    part_number: int,
+    expires_in: int = 3600,
+    checksum_sha256: str = None
+) -> str:
+    """
+    멀티파트 업로드의 파트 하나를 브라우저에서 직접 PUT할 수 있는 Pre-signed URL을 생성합니다.
+    (버킷 CORS에 PUT 허용과 ETag 헤더 노출이 필요합니다)
+    
+    checksum_sha256(base64)을 지정하면 서명에 포함되므로, 클라이언트는 같은 값을
+    x-amz-checksum-sha256 헤더로 보내야 하고 S3는 내용이 다르면 파트를 거부합니다.
+    """
+    params = {
+        'Bucket': AWS_S3_BUCKET_NAME,
+        'Key': key,
+        'UploadId': upload_id,
+        'PartNumber': part_number,
+    }
+    if checksum_sha256:
+        params['ChecksumSHA256'] = checksum_sha256
+    return s3_client.generate_presigned_url(
+        'upload_part',
+        Params=params,
+        ExpiresIn=expires_in
+    )
+
+def list_uploaded_parts(key: str, upload_id: str) -> list:
+    """
+    멀티파트 업로드에 지금까지 올라간 파트 목록을 조회합니다. (이어 올리기 지점 계산용)
+    
+    Returns:
+        [{"PartNumber", "ETag", "Size", "ChecksumSHA256"(있으면)}] (파트 번호 오름차순)
+    """
+    parts = []
+    marker = 0
+    try:
+        while True:
+            response = s3_client.list_parts(
+                Bucket=AWS_S3_BUCKET_NAME,
+                Key=key,
+                UploadId=upload_id,
+                PartNumberMarker=marker
+            )
+            parts.extend(response.get("Parts", []))
+            if not response.get("IsTruncated"):
+                return parts
+            marker = response["NextPartNumberMarker"]
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'NoSuchUpload':
+            raise HTTPException(
+                status_code=410, 
+                detail="S3 멀티파트 업로드가 만료되었거나 취소되었습니다."
+            )
+        raise HTTPException(
+            status_code=500, 
+            detail=f"S3 업로드 파트 조회 실패: {e.response['Error']['Code']}"
+        )
+    except BotoCoreError as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"S3 업로드 파트 조회 실패: {str(e)}"
+        )
+
+def complete_multipart_upload(key: str, upload_id: str, parts: list) -> None:
+    """
+    업로드된 파트를 하나의 객체로 합칩니다.
+    
+    Args:
+        parts: [{"PartNumber": 1, "ETag": "..."}] (파트 번호 오름차순)
+    """
+    try:
+        s3_client.complete_multipart_upload(
+            Bucket=AWS_S3_BUCKET_NAME,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts}
+        )
+    except ClientError as e:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"S3 멀티파트 업로드 완료 실패: {e.response['Error']['Code']}"
+        )
+    except BotoCoreError as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"S3 멀티파트 업로드 완료 실패: {str(e)}"
+        )
+
+def abort_multipart_upload(key: str, upload_id: str) -> None:
+    """진행 중인 멀티파트 업로드를 취소하고 업로드된 파트를 삭제합니다."""
+    try:
+        s3_client.abort_multipart_upload(
+            Bucket=AWS_S3_BUCKET_NAME,
+            Key=key,
+            UploadId=upload_id
+        )
+    except (BotoCoreError, ClientError) as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"S3 멀티파트 업로드 취소 실패: {str(e)}"
+        )
+
+def head_s3_object(key: str) -> dict:
+    """S3 객체의 메타데이터(크기, Content-Type 등)를 조회합니다."""
+    try:
+        return s3_client.head_object(Bucket=AWS_S3_BUCKET_NAME, Key=key)
+    except ClientError:
+        raise HTTPException(
+            status_code=404, 
+            detail=f"S3 파일을 찾을 수 없음: {key}"
+        )
+
+def iter_s3_object(s3_url: str, chunk_size: int = 1024 * 1024):
+    """
+    S3 객체를 로컬에 저장하지 않고 청크 단위로 읽습니다. (해시 계산 등)
+    """
+    try:
+        key = extract_s3_key_from_url(s3_url)
+        response = s3_client.get_object(Bucket=AWS_S3_BUCKET_NAME, Key=key)
+        yield from response["Body"].iter_chunks(chunk_size)
+    except (BotoCoreError, ClientError) as e:
+        raise Exception(f"S3 파일 읽기 실패: {str(e)}")
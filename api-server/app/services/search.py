@@ -0,0 +1,270 @@
+import re
+import html
+import logging
+from typing import Optional, List, Dict, Any, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.db.models import (
+    SearchDocument, Transcript, AudioFile, Report, ReportData
+)
+
+logger = logging.getLogger(__name__)
+
+# ngram 파서 토큰 크기 (MySQL ngram_token_size 기본값)
+NGRAM_TOKEN_SIZE = 2
+SNIPPET_WINDOW = 80  # 긴 본문에서 일치 위치 앞뒤로 보여줄 글자 수
+BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+SOURCE_UTTERANCE = "utterance"
+SOURCE_LINE = "line"
+SOURCE_ANALYSIS = "analysis"
+
+
+def _delete_documents(db: Session, **filters) -> None:
+    db.query(SearchDocument).filter_by(**filters).delete(synchronize_session=False)
+
+
+def index_transcript(db: Session, transcript: Transcript, report_id: int) -> int:
+    """
+    Transcript를 발화 단위(화자 분리 결과) 또는 줄 단위(직접 편집된 본문)로 색인
+
+    기존 색인 문서를 지우고 다시 만들며, 커밋은 호출 측에서 Transcript 저장과 함께 수행합니다.
+
+    Returns:
+        색인된 문서 수
+    """
+    if transcript.id is None:
+        db.flush()
+    _delete_documents(db, transcript_id=transcript.id)
+
+    base = {
+        "report_id": report_id,
+        "audio_file_id": transcript.audio_file_id,
+        "transcript_id": transcript.id,
+    }
+    speaker_labels = None if transcript.content_detached else transcript.speaker_labels
+
+    rows = []
+    if speaker_labels:
+        for index, label in enumerate(speaker_labels):
+            text = label.get("text")
+            if not text:
+                continue
+            rows.append({
+                **base,
+                "source_type": SOURCE_UTTERANCE,
+                "position": index,
+                "speaker": label.get("speaker"),
+                "start_at": label.get("start_at"),
+                "end_at": label.get("end_at"),
+                "body": text,
+            })
+    else:
+        for index, line in enumerate((transcript.content or "").splitlines()):
+            if line.strip():
+                rows.append({
+                    **base,
+                    "source_type": SOURCE_LINE,
+                    "position": index,
+                    "body": line,
+                })
+
+    if rows:
+        db.execute(insert(SearchDocument), rows)
+    return len(rows)
+
+
+def _flatten_strings(value, path: str = "") -> List[Tuple[str, str]]:
+    """JSON 값에서 (필드 경로, 문자열) 목록 추출"""
+    if isinstance(value, str):
+        return [(path, value)] if value.strip() else []
+    if isinstance(value, dict):
+        items = []
+        for key, child in value.items():
+            items.extend(_flatten_strings(child, f"{path}.{key}" if path else str(key)))
+        return items
+    if isinstance(value, list):
+        items = []
+        for index, child in enumerate(value):
+            items.extend(_flatten_strings(child, f"{path}[{index}]"))
+        return items
+    return []
+
+
+def index_report_data(db: Session, report_data: ReportData) -> int:
+    """
+    AI 분석 결과의 문자열 필드를 색인
+
+    parsed_data가 있으면 그것만 색인하고, 원문 JSON 문자열(original_json)은 중복이므로 제외합니다.
+    """
+    if report_data.id is None:
+        db.flush()
+    _delete_documents(db, report_data_id=report_data.id)
+
+    analysis_data = report_data.analysis_data or {}
+    if isinstance(analysis_data, dict) and "parsed_data" in analysis_data:
+        source = analysis_data["parsed_data"]
+    elif isinstance(analysis_data, dict):
+        source = {k: v for k, v in analysis_data.items() if k != "original_json"}
+    else:
+        source = analysis_data
+
+    rows = [
+        {
+            "source_type": SOURCE_ANALYSIS,
+            "report_id": report_data.report_id,
+            "report_data_id": report_data.id,
+            "field": field[:255],
+            "body": text,
+        }
+        for field, text in _flatten_strings(source)
+    ]
+    if rows:
+        db.execute(insert(SearchDocument), rows)
+    return len(rows)
+
+
+def index_safely(db: Session, indexer, *args) -> None:
+    """
+    색인 실패가 원래 저장 작업(STT 결과, 편집, AI 분석)을 실패시키지 않도록 SAVEPOINT 안에서 색인
+
+    원본 행은 SAVEPOINT 밖에서 먼저 flush하여 색인이 롤백되어도 함께 롤백되지 않게 합니다.
+    """
+    db.flush()
+    try:
+        with db.begin_nested():
+            indexer(db, *args)
+    except Exception as e:
+        logger.warning(f"검색 색인 실패 (scripts/rebuild_search_index.py로 재색인 가능): {e}")
+
+
+def parse_query(q: str) -> List[str]:
+    """검색어를 공백 기준 단어 목록으로 변환 (불리언 연산자 제거)"""
+    return [term for term in BOOLEAN_OPERATORS.sub(" ", q).split() if term]
+
+
+def highlight(text: str, terms: List[str], window: int = SNIPPET_WINDOW) -> str:
+    """
+    일치 구간을 <em>으로 감싼 HTML 이스케이프된 스니펫 생성
+
+    긴 본문은 첫 일치 위치 주변만 잘라서 반환합니다.
+    """
+    spans = []
+    lowered = text.lower()
+    for term in terms:
+        term = term.lower()
+        start = lowered.find(term)
+        while start != -1:
+            spans.append((start, start + len(term)))
+            start = lowered.find(term, start + len(term))
+    spans.sort()
+
+    merged = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    begin, finish = 0, len(text)
+    if len(text) > window * 2:
+        anchor = merged[0][0] if merged else 0
+        begin = max(0, anchor - window)
+        finish = min(len(text), anchor + window)
+
+    parts = ["…"] if begin > 0 else []
+    position = begin
+    for start, end in merged:
+        if end <= begin or start >= finish:
+            continue
+        start, end = max(start, begin), min(end, finish)
+        parts.append(html.escape(text[position:start]))
+        parts.append(f"<em>{html.escape(text[start:end])}</em>")
+        position = end
+    parts.append(html.escape(text[position:finish]))
+    if finish < len(text):
+        parts.append("…")
+    return "".join(parts)
+
+
+def search(
+    db: Session,
+    q: str,
+    source_type: Optional[str] = None,
+    report_id: Optional[int] = None,
+    limit: int = 20,
+    offset: int = 0
+) -> Dict[str, Any]:
+    """
+    FULLTEXT(ngram) 인덱스로 발화/본문/AI 분석 결과 검색
+
+    모든 단어가 포함된 문서만 관련도 순으로 반환합니다. ngram 토큰보다 짧은 단어(한 글자)만
+    있는 검색어는 FULLTEXT로 찾을 수 없으므로 LIKE 검색으로 대체합니다.
+    """
+    terms = parse_query(q)
+    if not terms:
+        return {"query": q, "hits": [], "has_more": False}
+
+    fulltext_terms = [term for term in terms if len(term) >= NGRAM_TOKEN_SIZE]
+    short_terms = [term for term in terms if len(term) < NGRAM_TOKEN_SIZE]
+
+    query = db.query(
+        SearchDocument,
+        Transcript.speaker_names,
+        AudioFile.display_name,
+        AudioFile.filename,
+        Report.title,
+    ).outerjoin(
+        Transcript, Transcript.id == SearchDocument.transcript_id
+    ).outerjoin(
+        AudioFile, AudioFile.id == SearchDocument.audio_file_id
+    ).join(
+        Report, Report.id == SearchDocument.report_id
+    )
+
+    if fulltext_terms:
+        # ngram 파서는 불리언 모드에서 큰따옴표 구문을 연속된 ngram 일치로 처리
+        boolean_query = " ".join(f'+"{term}"' for term in fulltext_terms)
+        score = SearchDocument.body.match(boolean_query)
+        query = query.add_columns(score.label("score")).filter(score).order_by(score.desc())
+    else:
+        query = query.add_columns(SearchDocument.id.label("score")).order_by(SearchDocument.id.desc())
+    for term in short_terms:
+        query = query.filter(SearchDocument.body.contains(term, autoescape=True))
+
+    if source_type:
+        query = query.filter(SearchDocument.source_type == source_type)
+    if report_id:
+        query = query.filter(SearchDocument.report_id == report_id)
+
+    rows = query.offset(offset).limit(limit + 1).all()
+
+    hits = []
+    for document, speaker_names, display_name, filename, report_title, score in rows[:limit]:
+        speaker = document.speaker
+        hits.append({
+            "source_type": document.source_type,
+            "report_id": document.report_id,
+            "report_title": report_title,
+            "audio_file_id": document.audio_file_id,
+            "audio_file_name": display_name or filename,
+            "report_data_id": document.report_data_id,
+            "position": document.position,
+            "field": document.field,
+            "speaker": speaker,
+            "speaker_name": (speaker_names or {}).get(speaker, speaker) if speaker else None,
+            "start_at": document.start_at,
+            "end_at": document.end_at,
+            "highlight": highlight(document.body, terms),
+            "score": float(score) if fulltext_terms else None,
+        })
+
+    return {
+        "query": q,
+        "hits": hits,
+        "offset": offset,
+        "limit": limit,
+        "has_more": len(rows) > limit,
+    }
@@ -2,26 +2,198 @@ import requests
 import os
 import time
 import tempfile
+import shutil
 import json
-from typing import Optional, Dict, Any
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable
 import logging
 
+from app.services.audio_utils import get_mime_type_for_codec
+from app.services.provider_guard import (
+    ProviderUnavailableError,
+    returnzero,
+    is_provider_failure,
+    get_status_code,
+)
+from app.services.audio_chunking import (
+    CHUNK_EXTENSION,
+    CHUNK_MIME_TYPE,
+    CHUNK_MAX_PARALLEL,
+    should_chunk,
+    detect_silences,
+    plan_segments,
+    cut_segment,
+    stitch_segment_results,
+)
+
 logger = logging.getLogger(__name__)
 
+# 결과 폴링 간격 (초)과 최소 폴링 시간 (초)
+POLL_INTERVAL = 5
+MIN_POLL_SECONDS = 300
+# 폴링 중 공급자 오류가 이어질 때 늘려가는 최대 폴링 간격 (초)
+POLL_MAX_INTERVAL = 60
+# 인증/STT 요청의 공급자 장애(429, 5xx, 연결 실패) 재시도 횟수
+RTZR_RETRIES = int(os.getenv("RTZR_RETRIES", "3"))
+
+# STT 엔진 (STTConfig.engine)
+STT_ENGINE_RETURNZERO = "returnzero"
+STT_ENGINE_LOCAL = "local"  # 로컬 CPU faster-whisper (app/services/local_stt.py)
+STT_ENGINES = (STT_ENGINE_RETURNZERO, STT_ENGINE_LOCAL)
+
+
+# STT 작업 진행 단계
+PHASE_PENDING = "pending"
+PHASE_DOWNLOADED = "downloaded"  # 음성 파일을 임시 파일로 받아 둠
+PHASE_SUBMITTED = "submitted"  # 리턴제로에 전송하고 task_id를 받음
+PHASE_POLLING = "polling"  # 결과 폴링 중
+
+
+class TransientSTTError(Exception):
+    """
+    다시 시도하면 성공할 수 있는 STT 오류 (다운로드/전송 타임아웃, 공급자 장애, 폴링 시간 초과)
+
+    resubmit이 True면 리턴제로 작업이 사라진 경우로, 재시도 시 음성을 다시 전송합니다.
+    """
+
+    def __init__(self, message: str, resubmit: bool = False):
+        super().__init__(message)
+        self.resubmit = resubmit
+
+
+class STTCheckpoint:
+    """
+    STT 작업 진행 상황 (같은 작업을 재시도할 때 마지막 단계부터 이어서 처리)
+
+    받아 둔 임시 파일은 다시 다운로드하지 않고, 이미 받은 task_id는 음성을 다시 올리지 않고
+    같은 작업을 폴링합니다. 분할 처리 시에는 세그먼트별 task_id와 완료된 결과를 보관합니다.
+    작업이 최종 완료/실패하면 cleanup으로 임시 파일을 정리해야 합니다.
+    on_submit이 있으면 task_id를 받을 때마다 호출하여 프로세스 재시작 후에도 이어서 폴링할 수 있게
+    저장합니다. (분할 처리 시 여러 스레드에서 호출될 수 있음)
+    """
+
+    def __init__(self, on_submit: Optional[Callable[["STTCheckpoint"], None]] = None):
+        self.on_submit = on_submit
+        self.phase = PHASE_PENDING
+        self.attempts = 0  # 지금까지의 재시도 횟수
+        self.temp_file_path = None
+        self.file_extension = None
+        self.task_id = None
+        self.submitted_at = None
+        self.segments = None
+        self.chunk_dir = None
+        self.segment_tasks = {}  # 세그먼트 index → task_id
+        self.segment_results = {}  # 세그먼트 index → 리턴제로 원본 결과
+        self.config_hash = None  # 진행 상황을 만든 STT 설정 해시 (설정이 바뀌면 reset)
+
+    def has_download(self) -> bool:
+        return bool(self.temp_file_path) and os.path.exists(self.temp_file_path)
+
+    def mark_submitted(self, task_id: str) -> None:
+        self.task_id = task_id
+        self.submitted_at = time.time()
+        self.phase = PHASE_SUBMITTED
+        self._notify_submit()
+
+    def mark_segment_submitted(self, index: int, task_id: str) -> None:
+        self.segment_tasks[index] = task_id
+        self.submitted_at = self.submitted_at or time.time()
+        self.phase = PHASE_SUBMITTED
+        self._notify_submit()
+
+    def _notify_submit(self) -> None:
+        if not self.on_submit:
+            return
+        try:
+            self.on_submit(self)
+        except Exception as e:
+            # 저장 실패로 진행 중인 STT를 중단하지 않음 (재시작 시 처음부터 다시 처리될 뿐)
+            logger.warning(f"STT 진행 상황 저장 실패: {e}")
+
+    def reset_submission(self) -> None:
+        """리턴제로 작업이 사라졌을 때 다음 시도에서 다시 전송하도록 task_id 제거"""
+        self.task_id = None
+        self.submitted_at = None
+        self.phase = PHASE_DOWNLOADED if self.has_download() else PHASE_PENDING
+
+    def reset(self) -> None:
+        """STT 설정이 바뀌었을 때 받아 둔 파일과 전송된 작업을 버리고 처음부터 처리 (재시도 횟수는 유지)"""
+        self.cleanup()
+        self.phase = PHASE_PENDING
+        self.file_extension = None
+        self.task_id = None
+        self.submitted_at = None
+        self.segments = None
+        self.segment_tasks = {}
+        self.segment_results = {}
+        self.config_hash = None
+
+    def cleanup(self) -> None:
+        """임시 파일/분할 디렉토리 삭제"""
+        if self.temp_file_path and os.path.exists(self.temp_file_path):
+            try:
+                os.unlink(self.temp_file_path)
+                logger.debug(f"임시 파일 삭제: {self.temp_file_path}")
+            except Exception as e:
+                logger.warning(f"임시 파일 삭제 실패: {e}")
+        if self.chunk_dir:
+            shutil.rmtree(self.chunk_dir, ignore_errors=True)
+        self.temp_file_path = None
+        self.chunk_dir = None
+
+
+def get_poll_attempts(duration_ms: Optional[int]) -> int:
+    """
+    녹음 길이에 비례한 폴링 횟수 계산
+    (최소 5분, 이후 녹음 길이의 절반만큼 추가 대기)
+    """
+    poll_seconds = MIN_POLL_SECONDS
+    if duration_ms:
+        poll_seconds += duration_ms // 1000 // 2
+    return max(1, poll_seconds // POLL_INTERVAL)
+
+
+class STTBackend(ABC):
+    """
+    STT 엔진 공통 처리 (S3 다운로드, 긴 녹음 분할, 재시도 이어 처리, 결과 후처리)
+
+    엔진별로 build_request_config(설정 변환), submit(전송 후 작업 ID 반환),
+    poll(작업 ID로 원본 결과 조회)을 구현합니다 (하나라도 빠지면 인스턴스 생성 시 TypeError).
+    원본 결과는 리턴제로 응답 형식 ({"results": {"utterances": [...]}})으로 반환하여
+    분할 결과 합치기, 결과 캐시, build_result(텍스트/화자 추출)를 엔진과 관계없이 같이 사용합니다.
+    """
+    name = ""
+    # 작업 ID가 프로세스 재시작 후에도 유효한지 (유효하면 AudioFile에 저장해 재시작 후 이어서 폴링)
+    durable_tasks = True
+
+    @abstractmethod
+    def build_request_config(
+        self,
+        config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """STT 설정을 엔진 요청 설정으로 변환"""
+
+    @abstractmethod
+    def submit(
+        self,
+        file_path: str,
+        file_extension: str,
+        mime_type: str,
+        request_config: Dict[str, Any]
+    ) -> str:
+        """STT 작업을 시작하고 작업 ID 반환"""
+
+    @abstractmethod
+    def poll(self, task_id: str, duration_ms: Optional[int] = None) -> Dict[str, Any]:
+        """
+        작업 결과를 기다려 원본 결과 반환
+
+        작업이 사라졌으면 TransientSTTError(resubmit=True), 제한 시간 안에 끝나지 않으면
+        TransientSTTError를 발생시킵니다 (재시도 시 같은 작업을 다시 기다림).
+        """
 
-class ReturnZeroSTTService:
-    def __init__(self):
-        self.client_id = os.getenv("RTZR_CLIENT_ID")
-        self.client_secret = os.getenv("RTZR_CLIENT_SECRET")
-        self.base_url = "https://openapi.vito.ai/v1"
-        self.access_token = None
-        self.token_expires_at = 0
-        
-        if not self.client_id or not self.client_secret:
-            raise ValueError(
-                "RTZR_CLIENT_ID와 RTZR_CLIENT_SECRET 환경변수가 필요합니다."
-            )
-    
     def _get_mime_type(self, file_extension: str) -> str:
         """파일 확장자에 따른 MIME 타입 반환"""
         mime_types = {
@@ -39,49 +211,11 @@ class ReturnZeroSTTService:
         logger.debug(f"파일 확장자 {extension}에 대한 MIME 타입: {mime_type}")
         return mime_type
     
-    def _get_access_token(self) -> str:
-        """액세스 토큰 발급 또는 갱신"""
-        current_time = time.time()
-        
-        # 토큰이 유효하면 기존 토큰 사용
-        if self.access_token and current_time < self.token_expires_at:
-            logger.debug("기존 액세스 토큰 사용")
-            return self.access_token
-        
-        # 새 토큰 발급
-        auth_url = f"{self.base_url}/authenticate"
-        data = {
-            "client_id": self.client_id,
-            "client_secret": self.client_secret
-        }
-        
-        logger.info(f"새 액세스 토큰 요청: {auth_url}")
-        logger.debug(f"인증 데이터: client_id={self.client_id[:8]}...")
-        
-        try:
-            response = requests.post(auth_url, data=data, timeout=30)
-            logger.debug(f"인증 응답 상태: {response.status_code}")
-            logger.debug(f"인증 응답 헤더: {dict(response.headers)}")
-            
-            response.raise_for_status()
-            
-            token_data = response.json()
-            logger.debug(f"토큰 응답: {token_data}")
-            
-            self.access_token = token_data["access_token"]
-            # 토큰 만료 시간을 현재 시간 + 5시간으로 설정 (6시간 유효하지만 여유를 둠)
-            self.token_expires_at = current_time + (5 * 60 * 60)
-            
-            logger.info("리턴제로 STT 액세스 토큰 발급 성공")
-            return self.access_token
-            
-        except requests.RequestException as e:
-            logger.error(f"리턴제로 STT 인증 실패: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"인증 실패 응답: {e.response.text}")
-            raise Exception(f"STT 서비스 인증 실패: {e}")
-    
-    def _download_file_from_s3(self, s3_url: str) -> tuple[str, str]:
+    def _download_file_from_s3(
+        self, 
+        s3_url: str, 
+        verify_signature: bool = True
+    ) -> tuple[str, str]:
         """S3에서 파일을 임시 디렉토리로 다운로드"""
         logger.info(f"S3에서 파일 다운로드 시작: {s3_url}")
         
@@ -181,7 +315,8 @@ class ReturnZeroSTTService:
             )
             
             # 파일 시그니처 확인 (처음 몇 바이트)
-            if file_size > 0:
+            # 업로드 시 ffprobe 메타데이터가 있으면 생략
+            if verify_signature and file_size > 0:
                 file_signature = response.content[:16].hex()
                 logger.debug(f"파일 시그니처 (첫 16바이트): {file_signature}")
                 
@@ -211,261 +346,246 @@ class ReturnZeroSTTService:
             
         except requests.RequestException as e:
             logger.error(f"S3 파일 다운로드 실패: {e}")
+            if is_provider_failure(e):
+                raise TransientSTTError(f"파일 다운로드 실패: {e}")
             raise Exception(f"파일 다운로드 실패: {e}")
 
     def transcribe_file(
         self, 
         file_url: str, 
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        audio_metadata: Optional[Dict[str, Any]] = None,
+        checkpoint: Optional[STTCheckpoint] = None
     ) -> Dict[str, Any]:
         """
-        음성 파일을 텍스트로 변환 (리턴제로 RTZR STT API)
+        음성 파일을 텍스트로 변환 (엔진별 submit/poll 사용)
+        
+        긴 녹음은 (STT_CHUNK_ENABLED 설정 시) 무음 구간에서 분할하여
+        병렬로 처리한 뒤 결과를 이어 붙입니다.
         
         Args:
             file_url: S3에 업로드된 음성 파일 URL
             config: STT 설정 (모델명, 화자 분리, 필터 등)
+            audio_metadata: 업로드 시 추출한 오디오 메타데이터 (코덱 등)
+            checkpoint: 재시도 시 이어서 처리할 진행 상황 (주면 임시 파일 정리는 호출 측에서 수행)
         
         Returns:
             STT 결과 딕셔너리
+        
+        Raises:
+            TransientSTTError: 재시도할 수 있는 오류 (checkpoint에 진행 단계가 남음)
         """
-        logger.info(f"STT 변환 시작: {file_url}")
+        logger.info(f"STT 변환 시작 ({self.name}): {file_url}")
         
-        access_token = self._get_access_token()
-        temp_file_path = None
+        own_checkpoint = checkpoint is None
+        checkpoint = checkpoint or STTCheckpoint()
+        
+        # 업로드 시 추출한 코덱 정보가 있으면 MIME 타입 추측/시그니처 확인 생략
+        codec_mime = get_mime_type_for_codec(
+            (audio_metadata or {}).get("codec")
+        )
+        duration_ms = (audio_metadata or {}).get("duration_ms")
+        
+        def ensure_download():
+            # S3에서 파일 다운로드 (이전 시도에서 받아 둔 파일이 있으면 재사용)
+            if not checkpoint.has_download():
+                checkpoint.temp_file_path, checkpoint.file_extension = self._download_file_from_s3(
+                    file_url, verify_signature=codec_mime is None
+                )
+                checkpoint.phase = PHASE_DOWNLOADED
+            return checkpoint.temp_file_path, checkpoint.file_extension
         
         try:
-            # S3에서 파일 다운로드
-            temp_file_path, file_extension = self._download_file_from_s3(
-                file_url
-            )
-            
-            # 리턴제로 API 기본 설정
-            default_config = {
-                "model_name": "sommers",  # sommers, whisper
-                "language": "ko",
-                "use_itn": True,  # 영어/숫자/단위 변환
-                "use_disfluency_filter": True,  # 간투어 필터
-                "use_profanity_filter": False,  # 비속어 필터
-                "use_paragraph_splitter": True,  # 문단 나누기
-                "paragraph_splitter": {"max": 50},  # 문단 최대 길이
-                "domain": "GENERAL",  # 도메인 설정
-                "use_word_timestamp": False,  # 단어별 Timestamp
-                "use_diarization": False,  # 화자 분리
-            }
+            request_config = self.build_request_config(config)
+            logger.info(f"STT 설정: {request_config}")
+            
+            # 긴 녹음은 분할 병렬 처리
+            if should_chunk(duration_ms):
+                temp_file_path, _ = ensure_download()
+                raw_result = self._transcribe_chunked(
+                    temp_file_path, duration_ms, request_config, checkpoint
+                )
+                return self.build_result(raw_result, config)
             
-            # 사용자 설정 적용
-            if config:
-                # 모델 설정
-                if config.get("model_type"):
-                    default_config["model_name"] = config["model_type"]
-                
-                # 언어 설정 (Whisper 모델일 때만)
-                if config.get("model_type") == "whisper":
-                    if config.get("language"):
-                        default_config["language"] = config["language"]
-                    
-                    # 언어 감지 후보군 설정 (detect 또는 multi일 때만)
-                    if config.get("language") in ["detect", "multi"] and config.get("language_candidates"):
-                        default_config["language_candidates"] = config["language_candidates"]
+            # 1단계: STT 작업 시작 (이전 시도의 task_id가 있으면 다운로드/전송 없이 폴링)
+            if checkpoint.task_id:
+                logger.info(f"기존 STT 작업 이어서 폴링: {checkpoint.task_id}")
+            else:
+                temp_file_path, file_extension = ensure_download()
                 
-                # 간투어 필터 설정
-                if config.get("use_disfluency_filter") is not None:
-                    default_config["use_disfluency_filter"] = config["use_disfluency_filter"]
-                
-                # 욕설 필터 설정
-                if config.get("profanity_filter") is not None:
-                    default_config["use_profanity_filter"] = config["profanity_filter"]
-                
-                # 문단 나누기 설정
-                if config.get("use_paragraph_splitter") is not None:
-                    default_config["use_paragraph_splitter"] = config["use_paragraph_splitter"]
-                    # paragraph_max_length가 None이 아닐 때만 포함
-                    paragraph_max_length = config.get("paragraph_max_length")
-                    if paragraph_max_length is not None:
-                        default_config["paragraph_splitter"]["max"] = paragraph_max_length
-                
-                # 도메인 설정
-                if config.get("domain"):
-                    default_config["domain"] = config["domain"]
-                
-                # 키워드 부스팅 설정
-                if config.get("keywords"):
-                    default_config["keywords"] = config["keywords"]
+                # 코덱 정보 우선, 없으면 파일 확장자에 따른 MIME 타입 설정
+                if codec_mime:
+                    mime_type, file_extension = codec_mime
+                else:
+                    mime_type = self._get_mime_type(file_extension)
                 
-                # 화자 분리 설정 (리턴제로 API 스펙에 맞춤)
-                if config.get("speaker_diarization"):
-                    default_config["use_diarization"] = True
-                    diarization_config = {}
-                    
-                    # spk_count가 None이 아닐 때만 포함 (자동 감지를 위해)
-                    spk_count = config.get("spk_count")
-                    if spk_count is not None:
-                        diarization_config["spk_count"] = spk_count
-                    
-                    default_config["diarization"] = diarization_config
-            
-            logger.info(f"STT 설정: {default_config}")
-            
-            # 1단계: STT 작업 시작
-            transcribe_url = f"{self.base_url}/transcribe"
-            headers = {
-                "Authorization": f"Bearer {access_token}"
-            }
-            
-            logger.info(f"STT 요청 URL: {transcribe_url}")
-            logger.debug(f"요청 헤더: {headers}")
+                checkpoint.mark_submitted(self.submit(
+                    temp_file_path, file_extension, mime_type, request_config
+                ))
             
-            # 파일 확장자에 따른 올바른 MIME 타입 설정
-            mime_type = self._get_mime_type(file_extension)
-            filename = f'audio{file_extension}'
-            
-            # 실제 파일을 multipart/form-data로 업로드
-            with open(temp_file_path, 'rb') as file:
-                # 파일 내용 확인
-                file_content = file.read()
-                file.seek(0)  # 파일 포인터를 처음으로 되돌림
-                
-                logger.info(f"업로드할 파일 크기: {len(file_content)} bytes")
-                logger.debug(f"파일 시그니처: {file_content[:16].hex()}")
-                
-                files = {
-                    'file': (filename, file, mime_type)
-                }
-                data = {
-                    'config': json.dumps(default_config)
-                }
-                
-                logger.info(f"파일 업로드 시작: {temp_file_path}")
-                logger.info(f"파일명: {filename}, MIME 타입: {mime_type}")
-                logger.info(f"Config JSON: {json.dumps(default_config)}")
-                logger.debug(f"요청 데이터: {data}")
-                
-                response = requests.post(
-                    transcribe_url, 
-                    headers=headers, 
-                    files=files, 
-                    data=data,
-                    timeout=120
-                )
-                
-                logger.info(f"STT 요청 응답 상태: {response.status_code}")
-                logger.debug(f"STT 요청 응답 헤더: {dict(response.headers)}")
-                logger.debug(f"STT 요청 응답 내용: {response.text}")
-                
-                response.raise_for_status()
-                
-                result = response.json()
-                task_id = result.get("id")
-                
-                if not task_id:
-                    logger.error(f"STT 작업 ID를 받지 못함. 응답: {result}")
-                    raise Exception("STT 작업 ID를 받지 못했습니다.")
-                
-                logger.info(f"STT 작업 시작됨. Task ID: {task_id}")
-                
-                # 2단계: 결과 폴링
-                stt_result = self._poll_transcription_result(task_id, access_token)
-                
-                return stt_result
+            # 2단계: 결과 폴링 (녹음 길이에 비례한 대기 시간)
+            checkpoint.phase = PHASE_POLLING
+            try:
+                raw_result = self.poll(checkpoint.task_id, duration_ms)
+            except TransientSTTError as e:
+                if e.resubmit:
+                    checkpoint.reset_submission()
+                raise
+            return self.build_result(raw_result, config)
                 
         except requests.RequestException as e:
             logger.error(f"STT 요청 실패: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 logger.error(f"STT 실패 응답: {e.response.text}")
+            if is_provider_failure(e):
+                raise TransientSTTError(f"STT 요청 실패: {e}")
             raise Exception(f"STT 요청 실패: {e}")
         finally:
-            # 임시 파일 정리
-            if temp_file_path and os.path.exists(temp_file_path):
-                try:
-                    os.unlink(temp_file_path)
-                    logger.debug(f"임시 파일 삭제: {temp_file_path}")
-                except Exception as e:
-                    logger.warning(f"임시 파일 삭제 실패: {e}")
+            # 임시 파일 정리 (재시도용 checkpoint를 받은 경우는 호출 측에서 정리)
+            if own_checkpoint:
+                checkpoint.cleanup()
     
-    def _poll_transcription_result(
-        self, 
-        task_id: str, 
-        access_token: str, 
-        max_attempts: int = 60
+    def _transcribe_chunked(
+        self,
+        file_path: str,
+        duration_ms: int,
+        request_config: Dict[str, Any],
+        checkpoint: STTCheckpoint
     ) -> Dict[str, Any]:
         """
-        STT 결과를 폴링으로 가져오기
+        무음 구간 기준으로 분할한 세그먼트를 병렬로 STT 처리하고
+        발화 타임스탬프/화자를 보정하여 하나의 결과로 합침
         
-        Args:
-            task_id: STT 작업 ID
-            access_token: 액세스 토큰
-            max_attempts: 최대 시도 횟수 (기본 60회 = 5분)
-        
-        Returns:
-            STT 결과
+        재시도 시에는 이미 완료된 세그먼트를 건너뛰고, 전송된 세그먼트는 같은 작업을 폴링합니다.
         """
-        result_url = f"{self.base_url}/transcribe/{task_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}"
-        }
+        if checkpoint.segments is None:
+            silences = detect_silences(file_path)
+            checkpoint.segments = plan_segments(duration_ms, silences)
+            logger.info(
+                f"분할 STT 시작: {len(checkpoint.segments)}개 세그먼트 "
+                f"(전체 {duration_ms}ms, 무음 구간 {len(silences)}개)"
+            )
+        else:
+            logger.info(
+                f"분할 STT 재개: {len(checkpoint.segment_results)}/{len(checkpoint.segments)}개 세그먼트 완료"
+            )
+        segments = checkpoint.segments
         
-        logger.info(f"STT 결과 폴링 시작: {result_url}")
+        if not checkpoint.chunk_dir or not os.path.isdir(checkpoint.chunk_dir):
+            checkpoint.chunk_dir = tempfile.mkdtemp(prefix="stt_chunks_")
         
-        for attempt in range(max_attempts):
-            try:
-                response = requests.get(result_url, headers=headers, timeout=30)
-                logger.debug(
-                    f"폴링 시도 {attempt + 1}: 상태 {response.status_code}"
+        def transcribe_segment(index: int, segment: Dict[str, int]):
+            if index in checkpoint.segment_results:
+                return checkpoint.segment_results[index]
+            
+            task_id = checkpoint.segment_tasks.get(index)
+            if not task_id:
+                segment_path = cut_segment(
+                    file_path, segment, checkpoint.chunk_dir, index
                 )
-                
-                response.raise_for_status()
-                
-                result = response.json()
-                status = result.get("status")
-                
-                logger.debug(f"STT 상태: {status}")
-                
-                if status == "completed":
-                    logger.info(f"STT 작업 완료. Task ID: {task_id}")
-                    logger.debug(f"완료된 결과: {result}")
-                    
-                    # 텍스트 추출 (화자 정보 포함)
-                    extracted_data = self._extract_transcript(result)
-                    
-                    return {
-                        "status": "completed",
-                        "transcript": extracted_data["transcript"],
-                        "speaker_labels": extracted_data["speaker_labels"],
-                        "speaker_names": extracted_data["speaker_names"],
-                        "full_result": result
-                    }
-                elif status == "failed":
-                    error_msg = result.get("message", "알 수 없는 오류")
-                    logger.error(
-                        f"STT 작업 실패. Task ID: {task_id}, Error: {error_msg}"
-                    )
-                    logger.error(f"실패 상세: {result}")
-                    raise Exception(f"STT 작업 실패: {error_msg}")
-                elif status in ["transcribing", "uploaded"]:
-                    # 작업 진행 중, 5초 대기 후 재시도
-                    logger.info(
-                        f"STT 작업 진행 중... ({attempt + 1}/{max_attempts}) "
-                        f"- 상태: {status}"
-                    )
-                    time.sleep(5)
-                    continue
+                task_id = self.submit(
+                    segment_path, CHUNK_EXTENSION, CHUNK_MIME_TYPE, request_config
+                )
+                checkpoint.mark_segment_submitted(index, task_id)
+            
+            try:
+                result = self.poll(task_id, segment["end_ms"] - segment["start_ms"])
+            except TransientSTTError as e:
+                if e.resubmit:
+                    checkpoint.segment_tasks.pop(index, None)
+                raise
+            checkpoint.segment_results[index] = result
+            return result
+        
+        checkpoint.phase = PHASE_POLLING
+        with ThreadPoolExecutor(max_workers=CHUNK_MAX_PARALLEL) as pool:
+            segment_results = list(pool.map(
+                transcribe_segment, range(len(segments)), segments
+            ))
+        
+        # 세그먼트 결과를 원본 타임라인 기준으로 이어 붙이기
+        return stitch_segment_results(segments, segment_results)
+    
+    def build_result(
+        self, 
+        raw_result: Dict[str, Any], 
+        config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        리턴제로 원본 응답에 후처리(문단 나누기, 텍스트/화자 추출)를 적용
+        
+        원본 응답은 STT 결과 캐시에 저장되므로, 후처리 설정만 다른 재처리는
+        리턴제로 호출 없이 이 단계만 다시 수행합니다.
+        """
+        config = config or {}
+        utterances = raw_result.get("results", {}).get("utterances", [])
+        
+        # 문단 나누기 (기본: 사용, 최대 50자)
+        use_paragraph_splitter = config.get("use_paragraph_splitter")
+        if use_paragraph_splitter is None or use_paragraph_splitter:
+            max_length = config.get("paragraph_max_length") or 50
+            utterances = self._split_paragraphs(utterances, max_length)
+        
+        extracted_data = self._extract_transcript(
+            {"results": {"utterances": utterances}}
+        )
+        
+        return {
+            "status": "completed",
+            "transcript": extracted_data["transcript"],
+            "speaker_labels": extracted_data["speaker_labels"],
+            "speaker_names": extracted_data["speaker_names"],
+            "full_result": raw_result
+        }
+    
+    def _split_paragraphs(
+        self, 
+        utterances: list, 
+        max_length: int
+    ) -> list:
+        """
+        최대 길이를 넘는 발화를 문장/공백 경계에서 나누고
+        타임스탬프를 글자 수 비율로 배분
+        """
+        split_utterances = []
+        for utterance in utterances:
+            text = utterance.get("msg", "")
+            if len(text) <= max_length:
+                split_utterances.append(utterance)
+                continue
+            
+            pieces = []
+            remaining = text
+            while len(remaining) > max_length:
+                window = remaining[:max_length + 1]
+                # 문장 부호 → 공백 순으로 분할 지점 탐색
+                cut = max(window.rfind(mark) for mark in (". ", "? ", "! "))
+                if cut > 0:
+                    cut += 1
                 else:
-                    logger.warning(f"알 수 없는 STT 상태: {status}")
-                    logger.debug(f"상태 상세: {result}")
-                    time.sleep(5)
-                    continue
-                    
-            except requests.RequestException as e:
-                logger.error(f"STT 결과 조회 실패 (시도 {attempt + 1}): {e}")
-                if hasattr(e, 'response') and e.response is not None:
-                    logger.error(f"조회 실패 응답: {e.response.text}")
-                if attempt == max_attempts - 1:
-                    raise Exception(f"STT 결과 조회 실패: {e}")
-                time.sleep(5)
+                    cut = window.rfind(" ")
+                if cut <= 0:
+                    cut = max_length
+                pieces.append(remaining[:cut].strip())
+                remaining = remaining[cut:].strip()
+            if remaining:
+                pieces.append(remaining)
+            
+            start_at = utterance.get("start_at", 0)
+            duration = utterance.get("duration", 0)
+            total_chars = sum(len(piece) for piece in pieces) or 1
+            offset = 0
+            for piece in pieces:
+                piece_duration = duration * len(piece) // total_chars
+                split_utterances.append({
+                    **utterance,
+                    "msg": piece,
+                    "start_at": start_at + offset,
+                    "duration": piece_duration,
+                })
+                offset += piece_duration
         
-        # 최대 시도 횟수 초과
-        logger.error("STT 작업 시간 초과 (5분)")
-        raise Exception("STT 작업 시간 초과 (5분)")
+        return split_utterances
     
     def _extract_transcript(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """STT 결과에서 텍스트 추출 (리턴제로 응답 형식)"""
@@ -533,13 +653,293 @@ class ReturnZeroSTTService:
             }
 
 
-# 싱글톤 인스턴스
-stt_service = None
+class ReturnZeroSTTService(STTBackend):
+    """리턴제로 RTZR STT API (task_id는 리턴제로에 남으므로 재시작 후에도 이어서 폴링)"""
+    name = STT_ENGINE_RETURNZERO
+
+    def __init__(self):
+        self.client_id = os.getenv("RTZR_CLIENT_ID")
+        self.client_secret = os.getenv("RTZR_CLIENT_SECRET")
+        self.base_url = "https://openapi.vito.ai/v1"
+        self.access_token = None
+        self.token_expires_at = 0
+        
+        if not self.client_id or not self.client_secret:
+            raise ValueError(
+                "RTZR_CLIENT_ID와 RTZR_CLIENT_SECRET 환경변수가 필요합니다."
+            )
+    
+    def _get_access_token(self) -> str:
+        """액세스 토큰 발급 또는 갱신"""
+        current_time = time.time()
+        
+        # 토큰이 유효하면 기존 토큰 사용
+        if self.access_token and current_time < self.token_expires_at:
+            logger.debug("기존 액세스 토큰 사용")
+            return self.access_token
+        
+        # 새 토큰 발급
+        auth_url = f"{self.base_url}/authenticate"
+        data = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret
+        }
+        
+        logger.info(f"새 액세스 토큰 요청: {auth_url}")
+        logger.debug(f"인증 데이터: client_id={self.client_id[:8]}...")
+        
+        def authenticate():
+            response = requests.post(auth_url, data=data, timeout=30)
+            logger.debug(f"인증 응답 상태: {response.status_code}")
+            logger.debug(f"인증 응답 헤더: {dict(response.headers)}")
+            response.raise_for_status()
+            return response
+        
+        try:
+            response = returnzero.call_with_retry("auth", authenticate, retries=RTZR_RETRIES)
+            
+            token_data = response.json()
+            logger.debug(f"토큰 응답: {token_data}")
+            
+            self.access_token = token_data["access_token"]
+            # 토큰 만료 시간을 현재 시간 + 5시간으로 설정 (6시간 유효하지만 여유를 둠)
+            self.token_expires_at = current_time + (5 * 60 * 60)
+            
+            logger.info("리턴제로 STT 액세스 토큰 발급 성공")
+            return self.access_token
+            
+        except requests.RequestException as e:
+            logger.error(f"리턴제로 STT 인증 실패: {e}")
+            if hasattr(e, 'response') and e.response is not None:
+                logger.error(f"인증 실패 응답: {e.response.text}")
+            raise Exception(f"STT 서비스 인증 실패: {e}")
+    
+    def build_request_config(
+        self, 
+        config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """STT 설정을 리턴제로 API 요청 설정으로 변환"""
+        # 리턴제로 API 기본 설정
+        default_config = {
+            "model_name": "sommers",  # sommers, whisper
+            "language": "ko",
+            "use_itn": True,  # 영어/숫자/단위 변환
+            "use_disfluency_filter": True,  # 간투어 필터
+            "use_profanity_filter": False,  # 비속어 필터
+            # 문단 나누기는 STT 결과 캐시 재사용을 위해 후처리(build_result)에서 수행
+            "use_paragraph_splitter": False,
+            "domain": "GENERAL",  # 도메인 설정
+            "use_word_timestamp": False,  # 단어별 Timestamp
+            "use_diarization": False,  # 화자 분리
+        }
+        
+        # 사용자 설정 적용
+        if config:
+            # 모델 설정
+            if config.get("model_type"):
+                default_config["model_name"] = config["model_type"]
+            
+            # 언어 설정 (Whisper 모델일 때만)
+            if config.get("model_type") == "whisper":
+                if config.get("language"):
+                    default_config["language"] = config["language"]
+                
+                # 언어 감지 후보군 설정 (detect 또는 multi일 때만)
+                if config.get("language") in ["detect", "multi"] and config.get("language_candidates"):
+                    default_config["language_candidates"] = config["language_candidates"]
+            
+            # 간투어 필터 설정
+            if config.get("use_disfluency_filter") is not None:
+                default_config["use_disfluency_filter"] = config["use_disfluency_filter"]
+            
+            # 욕설 필터 설정
+            if config.get("profanity_filter") is not None:
+                default_config["use_profanity_filter"] = config["profanity_filter"]
+            
+            # 도메인 설정
+            if config.get("domain"):
+                default_config["domain"] = config["domain"]
+            
+            # 키워드 부스팅 설정
+            if config.get("keywords"):
+                default_config["keywords"] = config["keywords"]
+            
+            # 화자 분리 설정 (리턴제로 API 스펙에 맞춤)
+            if config.get("speaker_diarization"):
+                default_config["use_diarization"] = True
+                diarization_config = {}
+                
+                # spk_count가 None이 아닐 때만 포함 (자동 감지를 위해)
+                spk_count = config.get("spk_count")
+                if spk_count is not None:
+                    diarization_config["spk_count"] = spk_count
+                
+                default_config["diarization"] = diarization_config
+        
+        return default_config
+    
+    def submit(
+        self,
+        file_path: str,
+        file_extension: str,
+        mime_type: str,
+        request_config: Dict[str, Any]
+    ) -> str:
+        """STT 작업을 시작하고 리턴제로 Task ID 반환"""
+        access_token = self._get_access_token()
+        transcribe_url = f"{self.base_url}/transcribe"
+        headers = {
+            "Authorization": f"Bearer {access_token}"
+        }
+        
+        logger.info(f"STT 요청 URL: {transcribe_url}")
+        logger.debug(f"요청 헤더: {headers}")
+        
+        filename = f'audio{file_extension}'
+        data = {
+            'config': json.dumps(request_config)
+        }
+        
+        logger.info(f"업로드할 파일 크기: {os.path.getsize(file_path)} bytes")
+        logger.info(f"파일 업로드 시작: {file_path}")
+        logger.info(f"파일명: {filename}, MIME 타입: {mime_type}")
+        logger.info(f"Config JSON: {json.dumps(request_config)}")
+        logger.debug(f"요청 데이터: {data}")
+        
+        def upload():
+            # 재시도마다 파일을 처음부터 다시 전송하도록 매번 새로 열기
+            with open(file_path, 'rb') as file:
+                response = requests.post(
+                    transcribe_url, 
+                    headers=headers, 
+                    files={'file': (filename, file, mime_type)}, 
+                    data=data,
+                    timeout=120
+                )
+            
+            logger.info(f"STT 요청 응답 상태: {response.status_code}")
+            logger.debug(f"STT 요청 응답 헤더: {dict(response.headers)}")
+            logger.debug(f"STT 요청 응답 내용: {response.text}")
+            
+            response.raise_for_status()
+            return response
+        
+        # 429/5xx/연결 실패는 지수 백오프로 재시도 (차단기가 열려 있으면 즉시 중단)
+        response = returnzero.call_with_retry("transcribe", upload, retries=RTZR_RETRIES)
+        result = response.json()
+        task_id = result.get("id")
+        
+        if not task_id:
+            logger.error(f"STT 작업 ID를 받지 못함. 응답: {result}")
+            raise Exception("STT 작업 ID를 받지 못했습니다.")
+        
+        logger.info(f"STT 작업 시작됨. Task ID: {task_id}")
+        return task_id
+
+    def poll(
+        self, 
+        task_id: str, 
+        duration_ms: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        STT 결과를 폴링으로 가져오기
+        
+        Args:
+            task_id: STT 작업 ID
+            duration_ms: 녹음 길이 (폴링 시간 제한 계산용, get_poll_attempts)
+        
+        Returns:
+            리턴제로 원본 응답 (완료 상태)
+        """
+        access_token = self._get_access_token()
+        max_attempts = get_poll_attempts(duration_ms)
+        result_url = f"{self.base_url}/transcribe/{task_id}"
+        headers = {
+            "Authorization": f"Bearer {access_token}"
+        }
+        
+        logger.info(f"STT 결과 폴링 시작: {result_url}")
+        
+        def fetch_result():
+            response = requests.get(result_url, headers=headers, timeout=30)
+            response.raise_for_status()
+            return response.json()
+        
+        # 시도 횟수 대신 전체 폴링 시간으로 제한 (오류가 이어지면 간격을 늘리므로)
+        timeout_seconds = max_attempts * POLL_INTERVAL
+        deadline = time.time() + timeout_seconds
+        attempt = 0
+        consecutive_errors = 0
+        while time.time() < deadline:
+            attempt += 1
+            try:
+                result = returnzero.call("poll", fetch_result)
+            except ProviderUnavailableError as e:
+                # 차단기가 열려 있는 동안은 같은 작업을 계속 기다림 (음성을 다시 올리지 않도록)
+                logger.info(f"STT 결과 조회 일시 중단, {int(e.retry_after)}초 후 재개: {task_id}")
+                time.sleep(min(max(e.retry_after, POLL_INTERVAL), POLL_MAX_INTERVAL))
+                continue
+            except requests.RequestException as e:
+                logger.error(f"STT 결과 조회 실패 (시도 {attempt}): {e}")
+                if hasattr(e, 'response') and e.response is not None:
+                    logger.error(f"조회 실패 응답: {e.response.text}")
+                if get_status_code(e) == 404:
+                    # 리턴제로에서 작업이 사라짐 (만료 등) - 재시도 시 다시 전송
+                    raise TransientSTTError(f"STT 작업을 찾을 수 없습니다: {task_id}", resubmit=True)
+                if not is_provider_failure(e):
+                    raise Exception(f"STT 결과 조회 실패: {e}")
+                if time.time() >= deadline:
+                    raise TransientSTTError(f"STT 결과 조회 실패: {e}")
+                # 공급자 과부하/장애 시 폴링 간격을 지수적으로 늘림
+                consecutive_errors += 1
+                time.sleep(min(POLL_INTERVAL * 2 ** consecutive_errors, POLL_MAX_INTERVAL))
+                continue
+            
+            consecutive_errors = 0
+            status = result.get("status")
+            logger.debug(f"폴링 시도 {attempt}: STT 상태 {status}")
+            
+            if status == "completed":
+                logger.info(f"STT 작업 완료. Task ID: {task_id}")
+                logger.debug(f"완료된 결과: {result}")
+                return result
+            elif status == "failed":
+                error_msg = result.get("message", "알 수 없는 오류")
+                logger.error(
+                    f"STT 작업 실패. Task ID: {task_id}, Error: {error_msg}"
+                )
+                logger.error(f"실패 상세: {result}")
+                raise Exception(f"STT 작업 실패: {error_msg}")
+            elif status in ["transcribing", "uploaded"]:
+                # 작업 진행 중, POLL_INTERVAL초 대기 후 재시도
+                logger.info(
+                    f"STT 작업 진행 중... (시도 {attempt}) - 상태: {status}"
+                )
+            else:
+                logger.warning(f"알 수 없는 STT 상태: {status}")
+                logger.debug(f"상태 상세: {result}")
+            time.sleep(POLL_INTERVAL)
+        
+        # 최대 폴링 시간 초과 - 리턴제로에서는 계속 처리 중일 수 있으므로 재시도 시 같은 작업을 다시 폴링
+        logger.error(f"STT 작업 시간 초과 ({timeout_seconds}초)")
+        raise TransientSTTError(f"STT 작업 시간 초과 ({timeout_seconds}초)")
+    
+# 엔진별 싱글톤 인스턴스 (스케줄러 스레드에서 동시에 요청될 수 있음)
+_stt_services: Dict[str, STTBackend] = {}
+_stt_services_lock = threading.Lock()
 
 
-def get_stt_service() -> ReturnZeroSTTService:
-    """STT 서비스 인스턴스 반환"""
-    global stt_service
-    if stt_service is None:
-        stt_service = ReturnZeroSTTService()
-    return stt_service 
\ No newline at end of file
+def get_stt_service(engine: Optional[str] = None) -> STTBackend:
+    """STT 엔진 인스턴스 반환 (engine이 없으면 리턴제로)"""
+    engine = engine or STT_ENGINE_RETURNZERO
+    with _stt_services_lock:
+        if engine not in _stt_services:
+            if engine == STT_ENGINE_RETURNZERO:
+                _stt_services[engine] = ReturnZeroSTTService()
+            elif engine == STT_ENGINE_LOCAL:
+                # faster-whisper는 선택 설치 의존성이므로 로컬 엔진을 쓸 때만 불러옴
+                from app.services.local_stt import LocalWhisperSTTService
+                _stt_services[engine] = LocalWhisperSTTService()
+            else:
+                raise ValueError(f"지원하지 않는 STT 엔진입니다: {engine}")
+        return _stt_services[engine]
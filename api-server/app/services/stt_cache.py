@@ -0,0 +1,149 @@
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.models import STTResultCache
+from app.services.stt import STT_ENGINE_RETURNZERO, STT_ENGINE_LOCAL
+from app.services.local_stt import LOCAL_STT_MODEL
+
+logger = logging.getLogger(__name__)
+
+STT_CACHE_ENABLED = os.getenv("STT_CACHE_ENABLED", "true").lower() == "true"
+
+# 캐시 키 버전 (리턴제로 요청 방식이 바뀌면 올려서 기존 캐시 무효화)
+CACHE_KEY_VERSION = 1
+
+
+def normalize_stt_config(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    STT 엔진 호출 결과에 영향을 주는 STT 설정만 남겨 정규화
+
+    문단 나누기, 화자 이름 등 후처리 설정은 제외하여 후처리만 다른
+    재처리가 같은 캐시를 사용하도록 합니다.
+    로컬 엔진은 적용되는 설정(모델, 언어, 키워드)만 남깁니다.
+    """
+    config = config or {}
+    if get_engine(config) == STT_ENGINE_LOCAL:
+        language = config.get("language") or "ko"
+        return {
+            "engine": STT_ENGINE_LOCAL,
+            "model": LOCAL_STT_MODEL,
+            "language": "detect" if language in ["detect", "multi"] else language,
+            "keywords": config.get("keywords") or None,
+        }
+
+    model_type = config.get("model_type") or "sommers"
+    normalized = {
+        "model_type": model_type,
+        "language": "ko",
+        "language_candidates": None,
+        "speaker_diarization": bool(config.get("speaker_diarization")),
+        "spk_count": None,
+        "profanity_filter": bool(config.get("profanity_filter")),
+        "use_disfluency_filter": config.get("use_disfluency_filter") is not False,
+        "domain": config.get("domain") or "GENERAL",
+        "keywords": config.get("keywords") or None,
+    }
+
+    # 언어 설정은 Whisper 모델일 때만 적용됨
+    if model_type == "whisper":
+        normalized["language"] = config.get("language") or "ko"
+        if normalized["language"] in ["detect", "multi"]:
+            normalized["language_candidates"] = config.get("language_candidates") or None
+
+    # 화자 수는 화자 분리 사용 시에만 적용됨
+    if normalized["speaker_diarization"]:
+        normalized["spk_count"] = config.get("spk_count")
+
+    return normalized
+
+
+def get_engine(config: Optional[Dict[str, Any]]) -> str:
+    """STT 설정의 엔진 (없으면 리턴제로)"""
+    return (config or {}).get("engine") or STT_ENGINE_RETURNZERO
+
+
+def build_cache_key(content_hash: str, config: Optional[Dict[str, Any]]) -> str:
+    """오디오 내용 해시와 정규화된 STT 설정으로 캐시 키 생성"""
+    payload = json.dumps(
+        {
+            "version": CACHE_KEY_VERSION,
+            "provider": get_engine(config),
+            "content_hash": content_hash,
+            "config": normalize_stt_config(config),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_config_hash(config: Optional[Dict[str, Any]]) -> str:
+    """STT 엔진 호출 결과에 영향을 주는 STT 설정의 해시 (전송된 작업을 이어서 폴링해도 되는지 확인용)"""
+    payload = json.dumps(
+        {"version": CACHE_KEY_VERSION, "config": normalize_stt_config(config)},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cached_result(
+    db: Session,
+    content_hash: Optional[str],
+    config: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """캐시된 리턴제로 원본 응답 조회 (없으면 None)"""
+    if not STT_CACHE_ENABLED or not content_hash:
+        return None
+
+    entry = db.query(STTResultCache).filter(
+        STTResultCache.cache_key == build_cache_key(content_hash, config)
+    ).first()
+    if not entry:
+        return None
+
+    entry.hit_count = (entry.hit_count or 0) + 1
+    entry.last_used_at = datetime.utcnow()
+    db.commit()
+
+    logger.info(f"STT 결과 캐시 적중: {content_hash[:12]} (적중 {entry.hit_count}회)")
+    return entry.raw_result
+
+
+def store_result(
+    db: Session,
+    content_hash: Optional[str],
+    config: Optional[Dict[str, Any]],
+    raw_result: Dict[str, Any]
+) -> None:
+    """리턴제로 원본 응답을 캐시에 저장 (이미 있으면 갱신)"""
+    if not STT_CACHE_ENABLED or not content_hash or not raw_result:
+        return
+
+    cache_key = build_cache_key(content_hash, config)
+    try:
+        entry = db.query(STTResultCache).filter(
+            STTResultCache.cache_key == cache_key
+        ).first()
+        if entry:
+            entry.raw_result = raw_result
+            entry.last_used_at = datetime.utcnow()
+        else:
+            db.add(STTResultCache(
+                cache_key=cache_key,
+                content_hash=content_hash,
+                provider_config=normalize_stt_config(config),
+                raw_result=raw_result,
+                hit_count=0
+            ))
+        db.commit()
+    except IntegrityError:
+        # 동시에 같은 결과를 저장한 경우 먼저 저장된 캐시 유지
+        db.rollback()
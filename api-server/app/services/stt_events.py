@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from app.db.models import AudioFile
+
+logger = logging.getLogger(__name__)
+
+# 보고서 ID → 구독 중인 SSE 연결의 (이벤트 루프, 큐) 목록
+_subscribers = defaultdict(set)
+_lock = threading.Lock()
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def build_status_event(audio_file) -> Dict[str, Any]:
+    """AudioFile의 STT 상태 필드만 담은 이벤트 데이터 생성"""
+    return {
+        "id": audio_file.id,
+        "stt_status": audio_file.stt_status or "pending",
+        "stt_processed_at": _serialize(audio_file.stt_processed_at),
+        "stt_error_message": audio_file.stt_error_message,
+    }
+
+
+def subscribe(report_id: int) -> asyncio.Queue:
+    """현재 이벤트 루프에서 보고서의 STT 상태 변경 이벤트 구독"""
+    queue = asyncio.Queue()
+    with _lock:
+        _subscribers[report_id].add((asyncio.get_running_loop(), queue))
+    return queue
+
+
+def unsubscribe(report_id: int, queue: asyncio.Queue) -> None:
+    with _lock:
+        subscribers = _subscribers.get(report_id)
+        if not subscribers:
+            return
+        for subscriber in list(subscribers):
+            if subscriber[1] is queue:
+                subscribers.discard(subscriber)
+        if not subscribers:
+            _subscribers.pop(report_id, None)
+
+
+def publish_stt_status(report_id: Optional[int], audio_file) -> None:
+    """
+    STT 상태 변경을 같은 프로세스의 SSE 구독자에게 전달
+
+    백그라운드 스레드에서 호출되므로 각 구독자의 이벤트 루프로 넘겨서 큐에 넣습니다.
+    다른 워커 프로세스의 변경은 SSE 엔드포인트의 주기적 상태 조회로 반영됩니다.
+    """
+    if report_id is None:
+        return
+
+    event = build_status_event(audio_file)
+    with _lock:
+        subscribers = list(_subscribers.get(report_id, ()))
+
+    for loop, queue in subscribers:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+        except RuntimeError:
+            # 이미 종료된 이벤트 루프
+            unsubscribe(report_id, queue)
+
+
+def load_stt_statuses(db, report_id: int) -> Dict[int, Dict[str, Any]]:
+    """보고서에 속한 오디오 파일의 STT 상태만 조회 (Transcript 본문 제외)"""
+    rows = db.query(
+        AudioFile.id,
+        AudioFile.stt_status,
+        AudioFile.stt_processed_at,
+        AudioFile.stt_error_message,
+    ).filter(AudioFile.report_id == report_id).all()
+    return {row.id: build_status_event(row) for row in rows}
@@ -0,0 +1,649 @@
+import os
+import random
+import logging
+from datetime import datetime, timezone
+from functools import partial
+from typing import Optional, Iterable, Dict, Any, Tuple
+
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session, selectinload
+
+from app.db.models import AudioFile, Transcript, STTConfig, Report
+from app.services.stt import (
+    get_stt_service, STTCheckpoint, TransientSTTError, PHASE_SUBMITTED,
+    STT_ENGINE_RETURNZERO, STT_ENGINE_LOCAL
+)
+from app.services.stt_cache import get_cached_result, store_result, build_config_hash, get_engine
+from app.services.stt_events import publish_stt_status
+from app.services.provider_guard import ProviderUnavailableError
+from app.services.job_queue import (
+    Job,
+    RetryLater,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_BULK,
+    JobScheduler,
+    stt_queue,
+    local_stt_queue,
+    audio_seconds,
+    summarize_tickets,
+)
+from app.services.dedup import find_reusable_transcript
+from app.services.search import index_safely, index_transcript
+from app.services.transcode import (
+    TRANSCODE_ENABLED,
+    TARGET_SAMPLE_RATE,
+    TARGET_CHANNELS,
+    needs_transcoding,
+    transcode_for_stt,
+    get_transcode_format,
+)
+
+logger = logging.getLogger(__name__)
+
+# STTConfig에 저장할 수 있는 설정 필드
+STT_CONFIG_FIELDS = {
+    'engine', 'model_type', 'language', 'language_candidates', 'speaker_diarization', 
+    'spk_count', 'profanity_filter', 'use_disfluency_filter', 
+    'use_paragraph_splitter', 'paragraph_max_length', 'domain', 'keywords'
+}
+
+# 일괄 STT 대상 상태
+BULK_STT_STATUSES = ("pending", "failed")
+
+# 일시적 오류(TransientSTTError) 자동 재시도 횟수와 백오프 (초)
+STT_MAX_RETRIES = int(os.getenv("STT_MAX_RETRIES", "3"))
+STT_RETRY_BASE_DELAY = int(os.getenv("STT_RETRY_BASE_DELAY", "30"))
+STT_RETRY_MAX_DELAY = int(os.getenv("STT_RETRY_MAX_DELAY", "600"))
+
+
+# 엔진별 STT 스케줄러 (같은 파일의 작업은 한 스케줄러에만 있어야 함)
+STT_QUEUES = (stt_queue, local_stt_queue)
+
+
+def get_stt_queue(stt_config: Optional[Dict[str, Any]]) -> JobScheduler:
+    """STT 설정의 엔진을 처리하는 스케줄러 (로컬 엔진은 리턴제로 대기열/차단기와 별도)"""
+    if get_engine(stt_config) == STT_ENGINE_LOCAL:
+        return local_stt_queue
+    return stt_queue
+
+
+def build_stt_config_dict(file: AudioFile) -> dict:
+    """파일의 STT 설정을 딕셔너리로 변환 (설정이 없으면 기본값)"""
+    stt_config = file.stt_config
+    if not stt_config:
+        return {
+            "engine": STT_ENGINE_RETURNZERO,
+            "model_type": "sommers",
+            "language": "ko",
+            "language_candidates": None,
+            "speaker_diarization": False,
+            "spk_count": 2,
+            "profanity_filter": False,
+            "use_disfluency_filter": True,
+            "use_paragraph_splitter": True,
+            "paragraph_max_length": 50,
+            "domain": "GENERAL",
+            "keywords": None
+        }
+    
+    # STTConfig 객체를 딕셔너리로 변환
+    return {
+        "engine": stt_config.engine or STT_ENGINE_RETURNZERO,
+        "model_type": stt_config.model_type,
+        "language": stt_config.language,
+        "language_candidates": stt_config.language_candidates,
+        "speaker_diarization": stt_config.speaker_diarization,
+        "spk_count": stt_config.spk_count,
+        "profanity_filter": stt_config.profanity_filter,
+        "use_disfluency_filter": stt_config.use_disfluency_filter,
+        "use_paragraph_splitter": stt_config.use_paragraph_splitter,
+        "paragraph_max_length": stt_config.paragraph_max_length,
+        "domain": stt_config.domain,
+        "keywords": stt_config.keywords
+    }
+
+
+def get_audio_metadata(file: AudioFile) -> dict:
+    """AudioFile에 저장된 오디오 메타데이터를 딕셔너리로 반환"""
+    return {
+        "duration_ms": file.duration_ms,
+        "codec": file.codec,
+        "sample_rate": file.sample_rate,
+        "channels": file.channels,
+        "bit_rate": file.bit_rate,
+        "content_hash": file.content_hash,
+    }
+
+
+def prepare_stt_source(db: Session, file: AudioFile) -> tuple[str, dict]:
+    """
+    STT에 전송할 오디오 URL과 메타데이터 결정
+    
+    트랜스코딩이 활성화되어 있으면 16kHz 모노 파생 파일을 사용하며,
+    이미 변환된 파일이 S3에 있으면 재사용합니다. 변환 실패 시 원본을 사용합니다.
+    """
+    audio_metadata = get_audio_metadata(file)
+    
+    if not TRANSCODE_ENABLED or not needs_transcoding(audio_metadata):
+        return file.s3_url, audio_metadata
+    
+    if not file.transcoded_s3_url:
+        try:
+            file.transcoded_s3_url = transcode_for_stt(file.s3_url)
+            db.commit()
+        except Exception as e:
+            logger.warning(f"트랜스코딩 실패, 원본 파일로 STT 진행: {e}")
+            db.rollback()
+            return file.s3_url, audio_metadata
+    
+    transcoded_metadata = {
+        **audio_metadata,
+        "codec": get_transcode_format()["codec"],
+        "sample_rate": TARGET_SAMPLE_RATE,
+        "channels": TARGET_CHANNELS,
+        "bit_rate": None,
+    }
+    return file.transcoded_s3_url, transcoded_metadata
+
+
+def clear_stt_task(file: AudioFile) -> None:
+    """저장된 리턴제로 작업 정보 비우기 (완료/실패 또는 새 설정으로 다시 시작할 때)"""
+    file.stt_task_id = None
+    file.stt_segment_tasks = None
+    file.stt_submitted_at = None
+    file.stt_config_hash = None
+
+
+def start_stt_generation(db: Session, file: AudioFile) -> int:
+    """
+    파일의 STT 세대를 올리고 새 세대 번호 반환 (커밋은 호출 측에서 수행)
+    
+    이전 세대의 작업은 실행 중이거나 다른 워커 프로세스에 있어도 결과/상태를 저장하지 않습니다.
+    동시에 재시작해도 세대가 겹치지 않도록 DB에서 증가시키고 커밋 전에 값을 읽습니다.
+    """
+    file.stt_generation = AudioFile.stt_generation + 1
+    db.flush()
+    db.refresh(file, attribute_names=["stt_generation"])
+    return file.stt_generation
+
+
+def load_current_stt_file(
+    db: Session,
+    file_id: int,
+    generation: Optional[int],
+    lock: bool = False
+) -> Optional[AudioFile]:
+    """
+    작업 세대가 파일의 현재 STT 세대와 같을 때만 AudioFile 반환
+    
+    파일이 삭제되었거나 재시작으로 세대가 바뀌었으면 None입니다. (generation이 None이면 세대를 확인하지 않음)
+    lock이면 결과를 저장하는 동안 재시작이 끼어들지 못하도록 행을 잠그고 최신 값으로 다시 읽습니다.
+    """
+    query = db.query(AudioFile).filter(AudioFile.id == file_id)
+    if lock:
+        query = query.with_for_update().populate_existing()
+    file = query.first()
+    if file and generation is not None and file.stt_generation != generation:
+        logger.info(
+            f"재시작된 STT의 이전 작업 결과 무시: file {file_id} "
+            f"(작업 세대 {generation}, 현재 세대 {file.stt_generation})"
+        )
+        return None
+    return file
+
+
+def persist_stt_checkpoint(
+    file_id: int,
+    config_hash: str,
+    generation: Optional[int],
+    checkpoint: STTCheckpoint
+) -> None:
+    """
+    전송된 리턴제로 task_id를 AudioFile에 저장 (재시작 후 reconcile_orphaned_stt가 이어서 폴링)
+    
+    분할 처리 시 여러 스레드에서 호출되므로 호출마다 별도 세션을 사용합니다.
+    STT가 재시작되어 세대가 바뀌었으면 저장하지 않습니다.
+    """
+    from app.db.session import SessionLocal
+    
+    segment_tasks = None
+    if checkpoint.segment_tasks:
+        segment_tasks = {
+            "segments": checkpoint.segments,
+            "tasks": {str(index): task_id for index, task_id in checkpoint.segment_tasks.items()},
+        }
+    
+    db = SessionLocal()
+    try:
+        query = db.query(AudioFile).filter(AudioFile.id == file_id)
+        if generation is not None:
+            query = query.filter(AudioFile.stt_generation == generation)
+        query.update({
+            "stt_task_id": checkpoint.task_id,
+            "stt_segment_tasks": segment_tasks,
+            "stt_submitted_at": datetime.utcfromtimestamp(checkpoint.submitted_at),
+            "stt_config_hash": config_hash,
+            "stt_heartbeat_at": datetime.utcnow(),
+            # 조회 응답 ETag가 바뀌지 않도록 updated_at 유지
+            "updated_at": AudioFile.updated_at,
+        }, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def restore_stt_checkpoint(file: AudioFile, stt_config: dict) -> STTCheckpoint:
+    """
+    AudioFile에 저장된 리턴제로 작업으로 진행 상황 복원
+    
+    전송 당시와 STT 설정이 다르면 저장된 작업을 버리고 처음부터 처리합니다.
+    """
+    checkpoint = STTCheckpoint()
+    if file.stt_config_hash != build_config_hash(stt_config):
+        return checkpoint
+    
+    if file.stt_task_id:
+        checkpoint.task_id = file.stt_task_id
+    segment_tasks = file.stt_segment_tasks or {}
+    if segment_tasks.get("segments") and segment_tasks.get("tasks"):
+        checkpoint.segments = segment_tasks["segments"]
+        checkpoint.segment_tasks = {
+            int(index): task_id for index, task_id in segment_tasks["tasks"].items()
+        }
+    if checkpoint.task_id or checkpoint.segment_tasks:
+        checkpoint.phase = PHASE_SUBMITTED
+        if file.stt_submitted_at:
+            checkpoint.submitted_at = file.stt_submitted_at.replace(tzinfo=timezone.utc).timestamp()
+    return checkpoint
+
+
+def save_stt_result(db: Session, file: AudioFile, result: dict):
+    """STT 결과로 Transcript를 생성/업데이트하고 완료 상태로 변경"""
+    file.stt_status = "completed"
+    file.stt_processed_at = datetime.utcnow()
+    file.stt_error_message = None
+    clear_stt_task(file)
+    
+    # Transcript 생성 또는 업데이트 (화자 정보 포함)
+    transcript_content = result.get("transcript", "")
+    speaker_labels = result.get("speaker_labels")
+    speaker_names = result.get("speaker_names")
+    
+    transcript = file.transcript
+    if transcript:
+        transcript.content = transcript_content
+        transcript.speaker_labels = speaker_labels
+        transcript.speaker_names = speaker_names
+        transcript.content_detached = False
+        transcript.updated_at = datetime.utcnow()
+    else:
+        transcript = Transcript(
+            audio_file_id=file.id,
+            content=transcript_content,
+            speaker_labels=speaker_labels,
+            speaker_names=speaker_names,
+            is_edited=False
+        )
+        db.add(transcript)
+    
+    index_safely(db, index_transcript, transcript, file.report_id)
+    db.commit()
+    publish_stt_status(file.report_id, file)
+
+
+def schedule_stt_retry(
+    db: Session,
+    file_id: int,
+    checkpoint: STTCheckpoint,
+    error: Exception,
+    generation: Optional[int] = None
+) -> Optional[RetryLater]:
+    """
+    일시적 오류 후 재시도 예약 (상태는 processing 유지, 재시도 안내를 오류 메시지에 기록)
+    
+    Returns:
+        스케줄러에 던질 RetryLater (지수 백오프 + 지터),
+        그 사이 파일이 삭제되었거나 STT가 재시작되어 재시도할 필요가 없으면 None
+    """
+    file = load_current_stt_file(db, file_id, generation)
+    if file is None and generation is not None:
+        return None
+    
+    checkpoint.attempts += 1
+    delay = min(STT_RETRY_BASE_DELAY * 2 ** (checkpoint.attempts - 1), STT_RETRY_MAX_DELAY)
+    delay += random.uniform(0, delay / 4)
+    logger.warning(
+        f"STT 일시적 오류, {int(delay)}초 후 재시도 ({checkpoint.attempts}/{STT_MAX_RETRIES}, "
+        f"{checkpoint.phase} 단계부터): file {file_id} ({error})"
+    )
+    
+    if file:
+        file.stt_error_message = (
+            f"일시적 오류로 재시도 대기 중 ({checkpoint.attempts}/{STT_MAX_RETRIES}): {error}"
+        )
+        db.commit()
+        publish_stt_status(file.report_id, file)
+    return RetryLater(delay, str(error))
+
+
+def process_stt_background(
+    file_id: int, 
+    s3_url: str, 
+    stt_config: dict, 
+    use_cache: bool = True,
+    checkpoint: Optional[STTCheckpoint] = None,
+    generation: Optional[int] = None
+):
+    """
+    백그라운드에서 STT 처리를 수행하는 함수
+    
+    use_cache가 True이면 같은 오디오/설정의 기존 결과를 재사용합니다.
+    checkpoint가 있으면 일시적 오류(TransientSTTError) 시 STT_MAX_RETRIES번까지
+    스케줄러에 재시도를 요청하며, 재시도는 받아 둔 파일과 전송된 task_id부터 이어서 처리합니다.
+    전송된 task_id는 AudioFile에도 저장하여 프로세스가 재시작되어도 이어서 폴링합니다.
+    generation이 있으면 처리 중 STT가 재시작되어 세대가 바뀐 경우 결과/상태를 저장하지 않습니다.
+    
+    재시도로 다시 실행될 때도 파일의 현재 STT 설정을 다시 읽습니다. 재시도 대기 중에 설정이 바뀌었으면
+    받아 둔 진행 상황을 버리고 새 설정으로 처리하며, 엔진이 바뀌었으면 그 엔진의 스케줄러에 다시 등록합니다.
+    """
+    from app.db.session import SessionLocal
+    
+    db = SessionLocal()
+    keep_checkpoint = False
+    try:
+        file = load_current_stt_file(db, file_id, generation)
+        if file is None and generation is not None:
+            # 파일이 삭제되었거나 STT가 재시작되어 이 작업은 더 이상 필요 없음
+            return
+        
+        if file:
+            current_config = build_stt_config_dict(file)
+            if get_stt_queue(current_config) is not get_stt_queue(stt_config):
+                logger.info(f"STT 엔진이 바뀌어 해당 엔진의 스케줄러에 다시 등록: file {file_id}")
+                enqueue_stt(file, current_config, use_cache, generation=generation)
+                return
+            stt_config = current_config
+        
+        # STT 엔진 인스턴스 생성 (STTConfig.engine)
+        stt_service = get_stt_service(get_engine(stt_config))
+        
+        if checkpoint is not None:
+            config_hash = build_config_hash(stt_config)
+            if checkpoint.config_hash and checkpoint.config_hash != config_hash:
+                logger.info(f"STT 설정이 바뀌어 이전 진행 상황을 버리고 처음부터 처리: file {file_id}")
+                checkpoint.reset()
+            checkpoint.config_hash = config_hash
+            # 재시작 후에도 유효한 작업 ID(리턴제로 task_id)만 저장
+            checkpoint.on_submit = partial(
+                persist_stt_checkpoint, file_id, config_hash, generation
+            ) if stt_service.durable_tasks else None
+        
+        # 같은 내용/설정으로 이미 완료된 결과가 있으면 STT 호출 없이 재사용
+        if file and use_cache:
+            reusable = find_reusable_transcript(
+                db, file, stt_config, build_stt_config_dict
+            )
+            if reusable:
+                logger.info(f"동일 오디오의 STT 결과 재사용: file {file_id} <- transcript {reusable.id}")
+                result = {
+                    "transcript": reusable.content,
+                    "speaker_labels": reusable.speaker_labels,
+                    "speaker_names": reusable.speaker_names,
+                }
+                file = load_current_stt_file(db, file_id, generation, lock=True)
+                if file:
+                    save_stt_result(db, file, result)
+                return
+        
+        # 리턴제로 원본 결과 캐시 확인 (후처리 설정만 다르면 캐시 적중)
+        content_hash = file.content_hash if file else None
+        cached_result = (
+            get_cached_result(db, content_hash, stt_config) if use_cache else None
+        )
+        
+        if cached_result is not None:
+            result = stt_service.build_result(cached_result, stt_config)
+        else:
+            # 업로드 시 추출한 메타데이터 (코덱 등) 재사용 및 트랜스코딩
+            audio_metadata = None
+            if file:
+                s3_url, audio_metadata = prepare_stt_source(db, file)
+            
+            # STT 처리 실행
+            result = stt_service.transcribe_file(
+                s3_url, stt_config, audio_metadata=audio_metadata, checkpoint=checkpoint
+            )
+            store_result(db, content_hash, stt_config, result.get("full_result"))
+        
+        # DB 업데이트 (처리 중 재시작되었으면 이전 설정의 결과를 저장하지 않음)
+        if file:
+            file = load_current_stt_file(db, file_id, generation, lock=True)
+            if file:
+                save_stt_result(db, file, result)
+            
+    except ProviderUnavailableError:
+        # 리턴제로 차단기가 열려 있음 - processing 상태로 두고 STT 스케줄러가 나중에 다시 실행
+        db.rollback()
+        keep_checkpoint = True
+        raise
+    except Exception as e:
+        db.rollback()
+        if (
+            isinstance(e, TransientSTTError)
+            and checkpoint is not None
+            and checkpoint.attempts < STT_MAX_RETRIES
+        ):
+            retry = schedule_stt_retry(db, file_id, checkpoint, e, generation)
+            if retry is None:
+                return
+            keep_checkpoint = True
+            raise retry
+        
+        # 에러 발생 시 DB 업데이트
+        file = load_current_stt_file(db, file_id, generation, lock=True)
+        if file:
+            file.stt_status = "failed"
+            file.stt_error_message = str(e)
+            clear_stt_task(file)
+            db.commit()
+            publish_stt_status(file.report_id, file)
+    finally:
+        if checkpoint is not None and not keep_checkpoint:
+            checkpoint.cleanup()
+        db.close()
+
+
+def stt_job_key(file_id: int) -> str:
+    """STT 스케줄러 작업 key"""
+    return f"stt:{file_id}"
+
+
+def build_stt_job(
+    file: AudioFile,
+    stt_config: dict,
+    use_cache: bool = True,
+    priority: str = PRIORITY_INTERACTIVE,
+    tenant_id: Optional[int] = None,
+    checkpoint: Optional[STTCheckpoint] = None,
+    generation: Optional[int] = None
+) -> Job:
+    """
+    파일 STT 작업 생성 (오디오 길이를 작업량으로 사용)
+    
+    generation은 작업이 속한 STT 세대입니다. (생략하면 파일의 현재 세대)
+    """
+    return Job(
+        stt_job_key(file.id), file.report_id, process_stt_background,
+        args=(file.id, file.s3_url, stt_config),
+        kwargs={
+            "use_cache": use_cache,
+            "checkpoint": checkpoint or STTCheckpoint(),
+            "generation": file.stt_generation if generation is None else generation,
+        },
+        priority=priority,
+        cost=audio_seconds(file),
+        tenant_id=tenant_id
+    )
+
+
+def enqueue_stt(
+    file: AudioFile,
+    stt_config: dict,
+    use_cache: bool = True,
+    priority: str = PRIORITY_INTERACTIVE,
+    generation: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    STT 작업을 스케줄러에 등록 (상태 변경/커밋은 호출 측에서 수행)
+
+    STT 설정의 엔진에 맞는 스케줄러(get_stt_queue)에 등록하며,
+    수용 여부는 호출 측에서 상태를 바꾸기 전에 같은 스케줄러의 ensure_capacity로 확인합니다.
+    이 프로세스에 같은 파일의 이전 작업이 있으면 새 작업으로 대체합니다. (submit_stt_jobs 참고)
+
+    Returns:
+        대기 순번과 예상 시작/완료 시간
+    """
+    job = build_stt_job(
+        file, stt_config, use_cache, priority,
+        tenant_id=file.report.user_id if file.report else None,
+        generation=generation
+    )
+    return submit_stt_jobs([(stt_config, job)], replace=True)[job.key]
+
+
+def submit_stt_jobs(
+    jobs: Iterable[Tuple[Dict[str, Any], Job]],
+    replace: bool = False
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    (STT 설정, 작업) 목록을 엔진별 스케줄러에 나누어 등록
+
+    replace가 True이면 같은 파일의 이전 작업을 새 작업으로 대체하고, 엔진이 바뀌었으면
+    다른 엔진 스케줄러에 남은 작업은 취소합니다. 이미 실행 중인 이전 작업은 멈추지 않지만
+    세대(stt_generation)가 바뀌었으므로 결과를 저장하지 않습니다.
+    """
+    by_queue = {}
+    for stt_config, job in jobs:
+        by_queue.setdefault(get_stt_queue(stt_config), []).append(job)
+    
+    tickets = {}
+    for queue, queue_jobs in by_queue.items():
+        if replace:
+            for other_queue in STT_QUEUES:
+                if other_queue is not queue:
+                    for job in queue_jobs:
+                        other_queue.cancel(job.key)
+        tickets.update(queue.submit(queue_jobs, replace=replace))
+    return tickets
+
+
+def enqueue_stt_bulk(
+    db: Session,
+    report_ids: Optional[Iterable[int]] = None,
+    statuses: Iterable[str] = BULK_STT_STATUSES,
+    stt_config: Optional[Dict[str, Any]] = None,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    대기/실패 상태의 파일을 한 번에 골라 STT 작업으로 등록
+
+    대상 선택, STT 설정 upsert, 상태 변경을 파일 수와 관계없이 몇 개의 쿼리로 처리합니다.
+    다른 요청이 이미 잡은 행은 건너뛰므로(SKIP LOCKED) 동시에 호출해도 같은 파일이 중복 등록되지 않습니다.
+
+    일괄 작업(bulk) 등급으로 등록하며, 대기열에 남은 자리만큼만 골라 나머지는 대기 상태로 둡니다.
+    자리가 없으면 429를 반환합니다. (stt_config를 주면 그 엔진의 대기열, 아니면 리턴제로 대기열 기준)
+
+    Args:
+        report_ids: 대상 보고서 (None이면 전체)
+        stt_config: 모든 대상 파일에 적용할 STT 설정 (None이면 파일별 기존 설정 사용)
+        limit: 최대 등록 파일 수
+
+    Returns:
+        등록된 파일 수, 파일 ID 목록, 보고서별 파일 수, 대기 정보 요약,
+        대기열이 가득 차 일부만 등록되었을 수 있는지 여부(capacity_limited)
+    """
+    admission_queue = get_stt_queue(stt_config)
+    admission_queue.ensure_capacity(PRIORITY_BULK)
+    capacity = admission_queue.capacity(PRIORITY_BULK)
+    capacity_limited = not limit or limit > capacity
+    limit = min(limit, capacity) if limit else capacity
+    
+    stt_status = func.coalesce(AudioFile.stt_status, "pending")
+    query = db.query(AudioFile.id).filter(stt_status.in_(list(statuses)))
+    if report_ids is not None:
+        query = query.filter(AudioFile.report_id.in_(list(report_ids)))
+    query = query.order_by(AudioFile.report_id, AudioFile.id).limit(limit)
+    file_ids = [row.id for row in query.with_for_update(skip_locked=True).all()]
+    
+    if not file_ids:
+        db.rollback()
+        return {
+            "count": 0, "file_ids": [], "by_report": {},
+            "queue": summarize_tickets([]), "capacity_limited": False,
+        }
+    
+    now = datetime.utcnow()
+    if stt_config:
+        config = {k: v for k, v in stt_config.items() if k in STT_CONFIG_FIELDS}
+        existing = {
+            row.audio_file_id for row in db.query(STTConfig.audio_file_id).filter(
+                STTConfig.audio_file_id.in_(file_ids)
+            )
+        }
+        if existing and config:
+            db.query(STTConfig).filter(
+                STTConfig.audio_file_id.in_(existing)
+            ).update({**config, "updated_at": now}, synchronize_session=False)
+        new_ids = [file_id for file_id in file_ids if file_id not in existing]
+        if new_ids:
+            db.execute(insert(STTConfig), [
+                {"audio_file_id": file_id, **config} for file_id in new_ids
+            ])
+    
+    db.query(AudioFile).filter(AudioFile.id.in_(file_ids)).update({
+        "stt_status": "processing",
+        "stt_processed_at": None,
+        "stt_error_message": None,
+        "stt_task_id": None,
+        "stt_segment_tasks": None,
+        "stt_submitted_at": None,
+        "stt_config_hash": None,
+        "stt_heartbeat_at": now,
+        "stt_generation": AudioFile.stt_generation + 1,
+        "updated_at": now,
+    }, synchronize_session=False)
+    # 커밋 후 다른 요청이 다시 올린 세대를 가져오지 않도록 잠금 중에 새 세대를 읽음
+    generations = dict(db.query(AudioFile.id, AudioFile.stt_generation).filter(
+        AudioFile.id.in_(file_ids)
+    ).all())
+    db.commit()
+    
+    files = db.query(AudioFile).options(
+        selectinload(AudioFile.stt_config)
+    ).filter(AudioFile.id.in_(file_ids)).all()
+    
+    tenants = dict(db.query(Report.id, Report.user_id).filter(
+        Report.id.in_({file.report_id for file in files})
+    ).all())
+    
+    by_report = {}
+    jobs = []
+    for file in files:
+        publish_stt_status(file.report_id, file)
+        by_report[file.report_id] = by_report.get(file.report_id, 0) + 1
+        file_config = build_stt_config_dict(file)
+        jobs.append((file_config, build_stt_job(
+            file, file_config,
+            priority=PRIORITY_BULK,
+            tenant_id=tenants.get(file.report_id),
+            generation=generations[file.id]
+        )))
+    tickets = submit_stt_jobs(jobs, replace=True)
+    
+    return {
+        "count": len(file_ids),
+        "file_ids": file_ids,
+        "by_report": by_report,
+        "queue": summarize_tickets(tickets.values()),
+        "capacity_limited": capacity_limited and len(file_ids) == limit,
+    }
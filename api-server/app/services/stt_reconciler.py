@@ -0,0 +1,168 @@
+import os
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
+
+from app.db.models import AudioFile, Report
+from app.db.session import SessionLocal
+from app.services.stt_jobs import (
+    build_stt_config_dict, build_stt_job, restore_stt_checkpoint, stt_job_key, submit_stt_jobs
+)
+from app.services.stt_events import publish_stt_status
+from app.services.job_queue import (
+    PRIORITY_INTERACTIVE, stt_queue, local_stt_queue, summarize_tickets
+)
+
+logger = logging.getLogger(__name__)
+
+# 이 프로세스가 가진 STT 작업의 stt_heartbeat_at 갱신 주기 (초)
+STT_HEARTBEAT_SECONDS = int(os.getenv("STT_HEARTBEAT_SECONDS", "60"))
+# 이 시간(초) 동안 heartbeat가 없는 processing 파일은 작업을 가진 프로세스가 없는 것으로 보고 다시 등록
+STT_ORPHAN_SECONDS = int(os.getenv("STT_ORPHAN_SECONDS", "300"))
+# 한 번에 다시 등록할 최대 파일 수
+STT_RECONCILE_BATCH = int(os.getenv("STT_RECONCILE_BATCH", "500"))
+
+_maintenance_started = False
+_maintenance_lock = threading.Lock()
+
+
+def _active_stt_keys() -> set:
+    """이 프로세스의 STT 스케줄러(리턴제로, 로컬)에 있는 작업 키"""
+    return set(stt_queue.active_keys()) | set(local_stt_queue.active_keys())
+
+
+def send_heartbeats(db: Session) -> int:
+    """
+    이 프로세스의 STT 스케줄러에 있는 파일들의 stt_heartbeat_at 갱신
+
+    Returns:
+        갱신한 파일 수
+    """
+    prefix = stt_job_key("")
+    file_ids = [
+        int(key[len(prefix):]) for key in _active_stt_keys() if key.startswith(prefix)
+    ]
+    if not file_ids:
+        return 0
+
+    now = datetime.utcnow()
+    updated = 0
+    for start in range(0, len(file_ids), STT_RECONCILE_BATCH):
+        chunk = file_ids[start:start + STT_RECONCILE_BATCH]
+        updated += db.query(AudioFile).filter(
+            AudioFile.id.in_(chunk),
+            AudioFile.stt_status == "processing"
+        ).update({
+            "stt_heartbeat_at": now,
+            # 조회 응답 ETag가 바뀌지 않도록 updated_at 유지
+            "updated_at": AudioFile.updated_at,
+        }, synchronize_session=False)
+    db.commit()
+    return updated
+
+
+def reconcile_orphaned_stt(db: Session) -> Dict[str, Any]:
+    """
+    처리 중이던 프로세스가 사라진 STT 파일을 이 프로세스의 스케줄러에 다시 등록
+
+    processing 상태이면서 STT_ORPHAN_SECONDS 동안 heartbeat가 없는 파일을 한 번에 골라
+    heartbeat를 찍어 가져옵니다. 다른 워커가 이미 잡은 행은 건너뛰므로(SKIP LOCKED)
+    여러 워커가 동시에 시작해도 같은 파일을 중복 등록하지 않습니다.
+    저장된 리턴제로 task_id가 있고 STT 설정이 그대로면 재전송 없이 그 작업부터 폴링합니다.
+
+    Returns:
+        다시 등록한 파일 수, 그중 기존 작업을 이어서 폴링하는 파일 수, 파일 ID 목록, 대기 정보 요약
+    """
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=STT_ORPHAN_SECONDS)
+    active = _active_stt_keys()
+
+    query = db.query(AudioFile.id, AudioFile.stt_generation).filter(
+        AudioFile.stt_status == "processing",
+        func.coalesce(AudioFile.stt_heartbeat_at, AudioFile.updated_at) < cutoff
+    ).order_by(AudioFile.id).limit(STT_RECONCILE_BATCH)
+    # 커밋 후 재시작된 파일의 새 세대를 가져오지 않도록 잠금 중에 세대를 읽음
+    generations = {
+        row.id: row.stt_generation for row in query.with_for_update(skip_locked=True).all()
+        if stt_job_key(row.id) not in active
+    }
+    file_ids = list(generations)
+
+    if not file_ids:
+        db.rollback()
+        return {"count": 0, "resumed_polling": 0, "file_ids": [], "queue": summarize_tickets([])}
+
+    db.query(AudioFile).filter(AudioFile.id.in_(file_ids)).update({
+        "stt_heartbeat_at": now,
+        "updated_at": AudioFile.updated_at,
+    }, synchronize_session=False)
+    db.commit()
+
+    files = db.query(AudioFile).options(
+        selectinload(AudioFile.stt_config)
+    ).filter(AudioFile.id.in_(file_ids)).all()
+
+    tenants = dict(db.query(Report.id, Report.user_id).filter(
+        Report.id.in_({file.report_id for file in files})
+    ).all())
+
+    jobs = []
+    resumed_polling = 0
+    for file in files:
+        stt_config = build_stt_config_dict(file)
+        checkpoint = restore_stt_checkpoint(file, stt_config)
+        if checkpoint.task_id or checkpoint.segment_tasks:
+            resumed_polling += 1
+        # 이미 오래 기다린 작업이므로 단건 요청과 같은 등급으로 등록
+        jobs.append((stt_config, build_stt_job(
+            file, stt_config,
+            priority=PRIORITY_INTERACTIVE,
+            tenant_id=tenants.get(file.report_id),
+            checkpoint=checkpoint,
+            generation=generations[file.id]
+        )))
+        publish_stt_status(file.report_id, file)
+    tickets = submit_stt_jobs(jobs)
+
+    logger.info(
+        f"중단된 STT 작업 {len(jobs)}건 재등록 (기존 리턴제로 작업 이어서 폴링: {resumed_polling}건)"
+    )
+    return {
+        "count": len(jobs),
+        "resumed_polling": resumed_polling,
+        "file_ids": [file.id for file in files],
+        "queue": summarize_tickets(tickets.values()),
+    }
+
+
+def _maintenance_loop() -> None:
+    while True:
+        db = SessionLocal()
+        try:
+            send_heartbeats(db)
+            reconcile_orphaned_stt(db)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"STT 작업 점검 실패: {e}")
+        finally:
+            db.close()
+        time.sleep(STT_HEARTBEAT_SECONDS)
+
+
+def start_stt_maintenance() -> None:
+    """
+    heartbeat 갱신과 중단된 작업 재등록을 주기적으로 실행하는 백그라운드 스레드 시작
+
+    시작 직후 한 번 실행하므로 heartbeat가 끊긴 지 STT_ORPHAN_SECONDS가 지난 파일은 바로 다시 등록됩니다.
+    """
+    global _maintenance_started
+    with _maintenance_lock:
+        if _maintenance_started:
+            return
+        _maintenance_started = True
+    threading.Thread(target=_maintenance_loop, name="stt-maintenance", daemon=True).start()
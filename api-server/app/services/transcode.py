@@ -0,0 +1,154 @@
+import os
+import subprocess
+import tempfile
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
+
+from app.services.s3 import (
+    extract_s3_key_from_url,
+    build_s3_direct_url,
+    download_file_from_s3,
+    upload_local_file_to_s3,
+)
+
+logger = logging.getLogger(__name__)
+
+# 트랜스코딩 설정 (STT 전송량을 줄이기 위한 선택적 단계)
+TRANSCODE_ENABLED = os.getenv("STT_TRANSCODE_ENABLED", "false").lower() == "true"
+TRANSCODE_FORMAT = os.getenv("STT_TRANSCODE_FORMAT", "flac")  # flac, opus
+TRANSCODE_MAX_WORKERS = int(os.getenv("STT_TRANSCODE_MAX_WORKERS", "2"))
+TRANSCODE_TIMEOUT = int(os.getenv("STT_TRANSCODE_TIMEOUT", "1800"))  # 초
+
+# STT 최적 포맷: 16kHz 모노
+TARGET_SAMPLE_RATE = 16000
+TARGET_CHANNELS = 1
+
+# 포맷별 ffmpeg 인코더 옵션, 확장자, MIME 타입, ffprobe 코덱명
+TRANSCODE_FORMATS = {
+    "flac": {
+        "args": ["-c:a", "flac", "-compression_level", "8"],
+        "extension": ".flac",
+        "content_type": "audio/flac",
+        "codec": "flac",
+    },
+    "opus": {
+        "args": ["-c:a", "libopus", "-b:a", "24k", "-application", "voip"],
+        "extension": ".ogg",
+        "content_type": "audio/ogg",
+        "codec": "opus",
+    },
+}
+
+# ffmpeg 프로세스 수를 제한하는 워커 풀 (백그라운드 작업 간 공유)
+_transcode_pool = ThreadPoolExecutor(
+    max_workers=TRANSCODE_MAX_WORKERS,
+    thread_name_prefix="transcode"
+)
+
+
+def get_transcode_format() -> Dict[str, Any]:
+    """설정된 트랜스코딩 포맷 정보 반환 (알 수 없으면 flac)"""
+    return TRANSCODE_FORMATS.get(TRANSCODE_FORMAT, TRANSCODE_FORMATS["flac"])
+
+
+def needs_transcoding(audio_metadata: Optional[Dict[str, Any]]) -> bool:
+    """
+    이미 STT 최적 포맷(16kHz 이하 모노 압축 포맷)이면 트랜스코딩이 필요 없음
+    """
+    if not audio_metadata:
+        return True
+
+    sample_rate = audio_metadata.get("sample_rate")
+    channels = audio_metadata.get("channels")
+    codec = audio_metadata.get("codec")
+
+    return not (
+        sample_rate is not None and sample_rate <= TARGET_SAMPLE_RATE
+        and channels == TARGET_CHANNELS
+        and codec in ("flac", "opus")
+    )
+
+
+def build_transcoded_key(original_key: str) -> str:
+    """원본 S3 키 옆에 위치할 파생 파일 키 생성"""
+    base, _ = os.path.splitext(original_key)
+    return f"{base}.stt16k{get_transcode_format()['extension']}"
+
+
+def build_transcoded_urls(s3_url: str) -> List[str]:
+    """
+    원본 S3 URL에서 만들어질 수 있는 모든 파생 파일 URL (포맷 설정이 바뀌기 전에 만든 파일 포함)
+
+    파생 파일 키는 원본 키로 정해지므로 AudioFile에 URL이 저장되지 않은 경우에도 찾을 수 있습니다.
+    """
+    base, _ = os.path.splitext(extract_s3_key_from_url(s3_url))
+    extensions = dict.fromkeys(transcode_format["extension"] for transcode_format in TRANSCODE_FORMATS.values())
+    return [build_s3_direct_url(f"{base}.stt16k{extension}") for extension in extensions]
+
+
+def _run_ffmpeg(input_path: str, output_path: str) -> None:
+    """ffmpeg로 16kHz 모노 포맷으로 변환 (워커 풀에서 실행)"""
+    cmd = [
+        'ffmpeg',
+        '-nostdin',
+        '-y',
+        '-v', 'error',
+        '-i', input_path,
+        '-vn',
+        '-ac', str(TARGET_CHANNELS),
+        '-ar', str(TARGET_SAMPLE_RATE),
+        *get_transcode_format()["args"],
+        output_path
+    ]
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, timeout=TRANSCODE_TIMEOUT
+    )
+    if result.returncode != 0:
+        raise Exception(f"ffmpeg 트랜스코딩 실패: {result.stderr.strip()}")
+
+
+def transcode_file(input_path: str, output_path: str) -> None:
+    """워커 풀에 트랜스코딩 작업을 제출하고 완료까지 대기"""
+    future = _transcode_pool.submit(_run_ffmpeg, input_path, output_path)
+    future.result()
+
+
+def transcode_for_stt(s3_url: str) -> str:
+    """
+    원본 오디오를 STT 최적 포맷으로 변환하여 원본 옆에 S3로 저장
+
+    Args:
+        s3_url: 원본 오디오 S3 URL
+
+    Returns:
+        변환된 파일의 S3 URL
+    """
+    original_key = extract_s3_key_from_url(s3_url)
+    transcoded_key = build_transcoded_key(original_key)
+    transcode_format = get_transcode_format()
+
+    _, original_ext = os.path.splitext(original_key)
+    temp_dir = tempfile.mkdtemp(prefix="transcode_")
+    input_path = os.path.join(temp_dir, f"input{original_ext}")
+    output_path = os.path.join(
+        temp_dir, f"output{transcode_format['extension']}"
+    )
+
+    try:
+        logger.info(f"트랜스코딩 시작: {original_key} -> {transcoded_key}")
+        download_file_from_s3(s3_url, input_path)
+        transcode_file(input_path, output_path)
+
+        logger.info(
+            f"트랜스코딩 완료: {os.path.getsize(input_path)} bytes -> "
+            f"{os.path.getsize(output_path)} bytes"
+        )
+        return upload_local_file_to_s3(
+            output_path, transcoded_key, transcode_format["content_type"]
+        )
+    finally:
+        for path in (input_path, output_path):
+            if os.path.exists(path):
+                os.unlink(path)
+        os.rmdir(temp_dir)
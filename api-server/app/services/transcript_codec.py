@@ -0,0 +1,175 @@
+import os
+import zlib
+import logging
+from typing import Optional, List, Dict, Any, Tuple
+
+import orjson
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없는 환경(마이그레이션 도구 등)에서는 zlib 사용
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 화자별 발화(speaker_labels) 압축 설정: zstd, zlib, none
+TRANSCRIPT_COMPRESSION = os.getenv("TRANSCRIPT_COMPRESSION", "zstd")
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 6
+
+# 인코딩 앞에 붙는 형식 표시 바이트
+FORMAT_PLAIN = b"J"
+FORMAT_ZLIB = b"D"
+FORMAT_ZSTD = b"Z"
+
+ENCODING_VERSION = 1
+STANDARD_KEYS = ("speaker", "text", "start_at", "end_at")
+
+
+def _to_columns(labels: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    발화 목록을 열 단위 배열로 변환
+
+    화자는 화자 목록의 인덱스로, 텍스트는 하나의 문자열과 끝 위치 배열로 저장합니다.
+    텍스트가 None인 발화는 빈 문자열과 구분되도록 null_text에 인덱스를 기록합니다.
+    표준 키 외의 값은 extra에, 표준 키가 빠졌거나 텍스트가 문자열이 아닌 발화는 raw에 그대로 보관하여
+    원본을 복원할 수 있게 합니다.
+    """
+    speakers = []
+    speaker_index = {}
+    spk, start, end, text_ends = [], [], [], []
+    text_parts = []
+    text_length = 0
+    null_text = []
+    extra = {}
+    raw = {}
+
+    for index, label in enumerate(labels):
+        if not all(key in label for key in STANDARD_KEYS) or not isinstance(
+            label["text"], (str, type(None))
+        ):
+            raw[str(index)] = label
+            label = {}
+
+        speaker = label.get("speaker")
+        if speaker not in speaker_index:
+            speaker_index[speaker] = len(speakers)
+            speakers.append(speaker)
+        spk.append(speaker_index[speaker])
+        start.append(label.get("start_at"))
+        end.append(label.get("end_at"))
+
+        text = label.get("text")
+        if text is None:
+            if label:
+                null_text.append(index)
+            text = ""
+        text_parts.append(text)
+        text_length += len(text)
+        text_ends.append(text_length)
+
+        others = {k: v for k, v in label.items() if k not in STANDARD_KEYS}
+        if others:
+            extra[str(index)] = others
+
+    columns = {
+        "v": ENCODING_VERSION,
+        "speakers": speakers,
+        "spk": spk,
+        "start": start,
+        "end": end,
+        "text": "".join(text_parts),
+        "text_ends": text_ends,
+    }
+    if null_text:
+        columns["null_text"] = null_text
+    if extra:
+        columns["extra"] = extra
+    if raw:
+        columns["raw"] = raw
+    return columns
+
+
+def _from_columns(
+    columns: Dict[str, Any],
+    offset: int = 0,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """열 단위 배열에서 [offset, offset + limit) 구간의 발화만 원래 형태로 복원"""
+    total = len(columns["spk"])
+    stop = total if limit is None else min(total, offset + limit)
+    speakers = columns["speakers"]
+    text = columns["text"]
+    text_ends = columns["text_ends"]
+    null_text = set(columns.get("null_text", ()))
+    extra = columns.get("extra", {})
+    raw = columns.get("raw", {})
+
+    labels = []
+    for index in range(offset, stop):
+        key = str(index)
+        if key in raw:
+            labels.append(raw[key])
+            continue
+        text_start = text_ends[index - 1] if index > 0 else 0
+        label = {
+            "speaker": speakers[columns["spk"][index]],
+            "text": None if index in null_text else text[text_start:text_ends[index]],
+            "start_at": columns["start"][index],
+            "end_at": columns["end"][index],
+        }
+        if key in extra:
+            label.update(extra[key])
+        labels.append(label)
+    return labels
+
+
+def encode_speaker_labels(labels: Optional[List[Dict[str, Any]]]) -> Optional[bytes]:
+    """speaker_labels를 압축된 열 단위 바이너리로 인코딩 (None은 그대로 None)"""
+    if labels is None:
+        return None
+
+    payload = orjson.dumps(_to_columns(labels))
+    if TRANSCRIPT_COMPRESSION == "zstd" and zstandard is not None:
+        return FORMAT_ZSTD + zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    if TRANSCRIPT_COMPRESSION in ("zstd", "zlib"):
+        return FORMAT_ZLIB + zlib.compress(payload, ZLIB_LEVEL)
+    return FORMAT_PLAIN + payload
+
+
+def _load_columns(data: bytes) -> Dict[str, Any]:
+    data = bytes(data)
+    marker, body = data[:1], data[1:]
+    if marker == FORMAT_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 Transcript를 읽으려면 zstandard 패키지가 필요합니다.")
+        body = zstandard.ZstdDecompressor().decompress(body)
+    elif marker == FORMAT_ZLIB:
+        body = zlib.decompress(body)
+    elif marker != FORMAT_PLAIN:
+        raise ValueError(f"알 수 없는 Transcript 인코딩 형식: {marker!r}")
+    return orjson.loads(body)
+
+
+def decode_speaker_labels(data: Optional[bytes]) -> Optional[List[Dict[str, Any]]]:
+    """인코딩된 바이너리를 기존 speaker_labels 형태(발화 dict 목록)로 복원"""
+    if data is None:
+        return None
+    return _from_columns(_load_columns(data))
+
+
+def decode_speaker_labels_range(
+    data: Optional[bytes],
+    offset: int,
+    limit: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    일부 구간의 발화만 복원
+
+    Returns:
+        (구간 발화 목록, 전체 발화 수)
+    """
+    if data is None:
+        return [], 0
+    columns = _load_columns(data)
+    return _from_columns(columns, offset, limit), len(columns["spk"])
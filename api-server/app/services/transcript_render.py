@@ -0,0 +1,116 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+# 프로세스별 렌더링 캐시 크기 (Transcript 수 기준)
+RENDER_CACHE_SIZE = int(os.getenv("TRANSCRIPT_RENDER_CACHE_SIZE", "128"))
+
+# 화자 분리 정보가 없어 저장된 content를 그대로 사용하는 Transcript 표시
+_NO_TEMPLATE = object()
+
+
+class _LRUCache:
+    """스레드 안전한 간단한 LRU 캐시"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+
+# (transcript id, content_version) → 화자 키/텍스트 템플릿
+_templates = _LRUCache(RENDER_CACHE_SIZE)
+# (transcript id, content_version, 화자 이름 버전) → 렌더링된 텍스트
+_renderings = _LRUCache(RENDER_CACHE_SIZE)
+
+
+def names_version(speaker_names: Optional[Dict[str, Any]]) -> str:
+    """화자 이름 매핑의 버전 (내용 해시)"""
+    payload = json.dumps(speaker_names or {}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def build_template(speaker_labels) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """발화 목록에서 (화자 키 목록, 텍스트 목록) 템플릿 생성 (텍스트 없는 발화 제외)"""
+    speakers = []
+    texts = []
+    for label in speaker_labels:
+        text = label.get("text", "")
+        if not text:
+            continue
+        speakers.append(label.get("speaker", ""))
+        texts.append(text)
+    return tuple(speakers), tuple(texts)
+
+
+def render_template(template, speaker_names: Optional[Dict[str, Any]]) -> str:
+    """템플릿에 화자 이름을 적용하여 "화자: 텍스트" 줄 단위 텍스트 생성"""
+    speaker_names = speaker_names or {}
+    speakers, texts = template
+    return "\n".join(
+        f"{speaker_names.get(speaker, speaker)}: {text}" if speaker else text
+        for speaker, text in zip(speakers, texts)
+    )
+
+
+def _get_template(transcript):
+    key = (transcript.id, transcript.content_version)
+    template = _templates.get(key)
+    if template is None:
+        speaker_labels = transcript.speaker_labels
+        template = build_template(speaker_labels) if speaker_labels else _NO_TEMPLATE
+        _templates.put(key, template)
+    return template
+
+
+def render_content(
+    transcript,
+    speaker_names: Optional[Dict[str, Any]] = None,
+    ignore_edits: bool = False
+) -> str:
+    """
+    화자 이름을 적용한 Transcript 텍스트 반환
+
+    화자 이름은 저장된 본문에 반영하지 않고 조회 시점에 적용하며, 결과는 화자 이름 버전별로 캐시합니다.
+    본문 전체를 직접 편집한 Transcript나 화자 분리 정보가 없는 Transcript는 저장된 content를 그대로 반환합니다.
+
+    Args:
+        speaker_names: 적용할 화자 이름 (None이면 저장된 speaker_names, 미리보기용으로 지정 가능)
+        ignore_edits: True면 본문 편집 여부와 관계없이 발화 기준으로 렌더링
+    """
+    if transcript is None:
+        return ""
+    if (transcript.content_detached and not ignore_edits) or transcript.id is None:
+        return transcript.content or ""
+
+    if speaker_names is None:
+        speaker_names = transcript.speaker_names
+    key = (transcript.id, transcript.content_version, names_version(speaker_names))
+    rendered = _renderings.get(key)
+    if rendered is not None:
+        return rendered
+
+    template = _get_template(transcript)
+    if template is _NO_TEMPLATE:
+        return transcript.content or ""
+
+    rendered = render_template(template, speaker_names)
+    _renderings.put(key, rendered)
+    return rendered
@@ -0,0 +1,50 @@
+"""
+운영 환경용 Gunicorn 설정 (Uvicorn 워커 N개)
+
+실행: gunicorn -c gunicorn.conf.py app.main:app
+무중단 재시작: kill -HUP <master pid> (워커를 순차적으로 교체)
+"""
+import os
+import multiprocessing
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# 워커 수 (기본: CPU 코어 수)
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+# 각 워커가 fork 이후 앱을 로드하여 워커별 DB 엔진/커넥션 풀을 생성
+preload_app = False
+
+# 요청 처리/종료 대기 시간 (초)
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "60"))
+keepalive = 5
+
+# 주기적 워커 교체 (0이면 비활성화)
+# STT 백그라운드 작업이 워커 안에서 수 분간 실행되므로 기본값은 비활성화
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
+
+# DB 최대 커넥션 수가 지정되면 워커 수로 나누어 워커별 풀 크기 결정
+# (전체 커넥션 = 워커 수 × (DB_POOL_SIZE + DB_MAX_OVERFLOW))
+_db_max_connections = os.getenv("DB_MAX_CONNECTIONS")
+if _db_max_connections and "DB_POOL_SIZE" not in os.environ:
+    os.environ["DB_POOL_SIZE"] = str(max(1, int(_db_max_connections) // workers))
+    os.environ.setdefault("DB_MAX_OVERFLOW", "0")
+
+
+def on_starting(server):
+    server.log.info(
+        f"워커 {workers}개로 시작 "
+        f"(워커별 DB 풀: {os.getenv('DB_POOL_SIZE', '5')} + "
+        f"overflow {os.getenv('DB_MAX_OVERFLOW', '10')})"
+    )
+
+
+def worker_int(worker):
+    worker.log.info(f"워커 종료 요청 수신 (pid: {worker.pid})")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+대시보드 세션당 전송량 벤치마크 스크립트 (조건부 GET 적용 전/후 비교)
+
+보고서 상세 화면을 열어 두고 주기적으로 새로고침하는 세션을 흉내 내어
+ETag(If-None-Match)를 보내지 않을 때와 보낼 때의 응답 바이트 수를 비교합니다.
+실행 중인 API 서버와 데이터가 있는 보고서가 필요합니다.
+
+예시:
+    python scripts/benchmark_conditional_get.py --base-url http://localhost:8000 --report-id 1 --rounds 20
+"""
+
+import argparse
+import sys
+
+import requests
+
+
+def response_bytes(response: requests.Response) -> int:
+    """상태 줄 + 헤더 + 본문 크기 (대략적인 전송량)"""
+    header_bytes = sum(len(k) + len(v) + 4 for k, v in response.headers.items())
+    return len(f"HTTP/1.1 {response.status_code} {response.reason}\r\n") + header_bytes + len(response.content)
+
+
+def session_paths(base_url: str, report_id: int) -> list:
+    """보고서 상세 화면이 한 번 새로고침될 때 요청하는 경로 목록"""
+    report = requests.get(f"{base_url}/reports/{report_id}", timeout=30)
+    report.raise_for_status()
+    paths = [
+        f"/reports/{report_id}",
+        f"/reports/{report_id}/ai-analysis/latest",
+        "/ai-prompts-for-report",
+        "/audio-files",
+    ]
+    for audio_file in report.json().get("audio_files", []):
+        paths.append(f"/audio-files/{audio_file['id']}/transcript")
+    return paths
+
+
+def run_session(base_url: str, paths: list, rounds: int, conditional: bool) -> dict:
+    """rounds번 새로고침하는 세션의 전송량과 304 비율 집계"""
+    session = requests.Session()
+    etags = {}
+    total_bytes = 0
+    not_modified = 0
+    requests_sent = 0
+
+    for _ in range(rounds):
+        for path in paths:
+            headers = {}
+            if conditional and path in etags:
+                headers["If-None-Match"] = etags[path]
+            response = session.get(base_url + path, headers=headers, timeout=30)
+            requests_sent += 1
+            total_bytes += response_bytes(response)
+            if response.status_code == 304:
+                not_modified += 1
+            if response.headers.get("ETag"):
+                etags[path] = response.headers["ETag"]
+
+    return {
+        "requests": requests_sent,
+        "bytes": total_bytes,
+        "not_modified": not_modified,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조건부 GET 전송량 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="API 서버 주소")
+    parser.add_argument("--report-id", type=int, required=True, help="측정할 보고서 ID")
+    parser.add_argument("--rounds", type=int, default=20, help="세션당 새로고침 횟수")
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip("/")
+    paths = session_paths(base_url, args.report_id)
+    print(f"세션당 요청 경로 {len(paths)}개 x {args.rounds}회")
+    print(f"{'mode':>12} {'requests':>10} {'304':>6} {'bytes':>12}")
+
+    results = {}
+    for mode, conditional in (("full", False), ("conditional", True)):
+        results[mode] = run_session(base_url, paths, args.rounds, conditional)
+        result = results[mode]
+        print(f"{mode:>12} {result['requests']:>10} {result['not_modified']:>6} {result['bytes']:>12,}")
+
+    saved = results["full"]["bytes"] - results["conditional"]["bytes"]
+    ratio = saved / (results["full"]["bytes"] or 1) * 100
+    print(f"절감: {saved:,} bytes ({ratio:.1f}%)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+보고서 상세 응답 직렬화/압축 벤치마크 스크립트
+
+1시간 분량 Transcript 20개와 AI 분석 이력을 가진 보고서 응답을 만들어
+표준 json과 orjson의 직렬화 시간, gzip/brotli 압축 후 크기를 비교합니다.
+DB 없이 실행할 수 있습니다.
+
+예시:
+    python scripts/benchmark_serialization.py --files 20 --minutes 60
+"""
+
+import argparse
+import gzip
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import brotli
+import orjson
+
+SAMPLE_SENTENCES = [
+    "오늘 학교에서 친구랑 무슨 이야기 했어?",
+    "그냥 점심시간에 같이 놀았어요.",
+    "그랬구나, 어떤 놀이를 했는지 궁금하다.",
+    "술래잡기 했는데 제가 계속 술래였어요.",
+    "속상했겠네. 그럴 때는 어떻게 했어?",
+    "처음엔 화났는데 나중엔 재미있었어요.",
+]
+
+
+def build_transcript(minutes: int) -> dict:
+    """평균 4초 길이 발화로 채운 Transcript 데이터 생성"""
+    speaker_labels = []
+    position = 0
+    while position < minutes * 60 * 1000:
+        duration = random.randint(1500, 6500)
+        speaker_labels.append({
+            "speaker": f"speaker{random.randint(1, 2)}",
+            "text": random.choice(SAMPLE_SENTENCES),
+            "start_at": position,
+            "end_at": position + duration,
+        })
+        position += duration
+    content = "\n".join(f"{u['speaker']}: {u['text']}" for u in speaker_labels)
+    return {"content": content, "speaker_labels": speaker_labels}
+
+
+def build_report(files: int, minutes: int, analyses: int) -> dict:
+    """GET /reports/{id} 응답과 같은 형태의 보고서 데이터 생성"""
+    now = datetime.utcnow()
+    audio_files = []
+    for index in range(files):
+        transcript = build_transcript(minutes)
+        audio_files.append({
+            "id": index + 1,
+            "filename": f"recording_{index + 1}.m4a",
+            "display_name": f"상담 녹음 {index + 1}",
+            "s3_url": f"https://bucket.s3.ap-northeast-2.amazonaws.com/recording_{index + 1}.m4a",
+            "file_size": 60 * 1024 * 1024,
+            "duration": minutes * 60,
+            "duration_ms": minutes * 60 * 1000,
+            "uploaded_at": now - timedelta(days=index),
+            "stt_status": "completed",
+            "stt_processed_at": now,
+            "stt_error_message": None,
+            "stt_transcript": transcript["content"],
+            "speaker_labels": transcript["speaker_labels"],
+        })
+
+    parsed = {
+        "summary": "아이와 부모의 대화 분석 요약 " * 50,
+        "sections": [{"title": f"항목 {i}", "content": "분석 내용 " * 100} for i in range(10)],
+    }
+    report_data = [
+        {
+            "id": index + 1,
+            "ai_prompt_id": 1,
+            "generated_at": now - timedelta(hours=index),
+            "analysis_data": {
+                "original_json": json.dumps(parsed, ensure_ascii=False),
+                "parsed_data": parsed,
+            },
+        }
+        for index in range(analyses)
+    ]
+
+    return {
+        "id": 1,
+        "title": "벤치마크 보고서",
+        "status": "completed",
+        "created_at": now,
+        "updated_at": now,
+        "audio_files": audio_files,
+        "report_data": report_data,
+    }
+
+
+def dumps_stdlib(data) -> bytes:
+    # Starlette JSONResponse와 같은 옵션 (datetime은 jsonable_encoder가 문자열로 변환)
+    return json.dumps(
+        data, ensure_ascii=False, allow_nan=False, indent=None,
+        separators=(",", ":"), default=lambda value: value.isoformat()
+    ).encode("utf-8")
+
+
+def dumps_orjson(data) -> bytes:
+    return orjson.dumps(data)
+
+
+def measure(func, data, repeat: int) -> tuple:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(data)
+        timings.append(time.perf_counter() - started)
+    return result, min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보고서 응답 직렬화/압축 벤치마크")
+    parser.add_argument("--files", type=int, default=20, help="오디오 파일 수")
+    parser.add_argument("--minutes", type=int, default=60, help="파일당 녹음 길이 (분)")
+    parser.add_argument("--analyses", type=int, default=5, help="AI 분석 이력 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    random.seed(0)
+    report = build_report(args.files, args.minutes, args.analyses)
+
+    print(f"보고서: 파일 {args.files}개 x {args.minutes}분, 분석 이력 {args.analyses}개")
+    print(f"{'serializer':>10} {'time(ms)':>10} {'raw':>12} {'gzip':>12} {'brotli':>12}")
+    for name, func in (("json", dumps_stdlib), ("orjson", dumps_orjson)):
+        body, elapsed = measure(func, report, args.repeat)
+        gzip_size = len(gzip.compress(body, compresslevel=9))
+        brotli_size = len(brotli.compress(body, quality=4))
+        print(
+            f"{name:>10} {elapsed:>10.1f} {len(body):>12,} "
+            f"{gzip_size:>12,} {brotli_size:>12,}"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+STT 엔진(리턴제로, 로컬 faster-whisper) 벤치마크 스크립트
+
+같은 로컬 음성 파일(fixture)을 엔진별로 변환하여 처리 시간, 실시간 배율(RTF = 처리 시간 / 오디오 길이),
+발화 수와 글자 오류율(CER)을 비교합니다. 음성 파일과 같은 이름의 .txt 파일이 있으면 정답으로 사용하고,
+없으면 첫 번째 엔진 결과를 기준으로 비교합니다. S3/DB 없이 실행할 수 있습니다.
+(리턴제로는 RTZR_CLIENT_ID/SECRET, 로컬 엔진은 faster-whisper 설치와 LOCAL_STT_* 설정 필요)
+
+예시:
+    python scripts/benchmark_stt_engines.py fixtures/*.m4a --engines returnzero,local --warmup
+"""
+
+import argparse
+import difflib
+import glob
+import json
+import os
+import shutil
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.audio_utils import probe_audio_metadata  # noqa: E402
+from app.services.stt import STT_ENGINES, STTCheckpoint, get_stt_service  # noqa: E402
+
+AUDIO_EXTENSIONS = {".mp3", ".m4a", ".mp4", ".wav", ".flac", ".ogg", ".amr"}
+
+
+def collect_fixtures(paths: list) -> list:
+    """인자로 받은 파일/디렉토리에서 음성 파일 목록 수집"""
+    fixtures = []
+    for path in paths:
+        if os.path.isdir(path):
+            fixtures.extend(sorted(
+                file_path for file_path in glob.glob(os.path.join(path, "*"))
+                if os.path.splitext(file_path)[1].lower() in AUDIO_EXTENSIONS
+            ))
+        else:
+            fixtures.append(path)
+    return fixtures
+
+
+def character_error_rate(reference: str, hypothesis: str) -> float:
+    """
+    공백을 제외한 글자 단위 오류율
+
+    긴 녹음에서도 빠르게 계산하도록 difflib 정렬 결과로 편집 거리를 근사합니다.
+    """
+    reference = "".join(reference.split())
+    hypothesis = "".join(hypothesis.split())
+    if not reference:
+        return 0.0 if not hypothesis else 1.0
+    errors = 0
+    matcher = difflib.SequenceMatcher(None, reference, hypothesis, autojunk=False)
+    for tag, ref_start, ref_end, hyp_start, hyp_end in matcher.get_opcodes():
+        if tag != "equal":
+            errors += max(ref_end - ref_start, hyp_end - hyp_start)
+    return errors / len(reference)
+
+
+def plain_text(result: dict) -> str:
+    """화자 표시 없이 발화 텍스트만 이어 붙이기 (엔진 간 비교용)"""
+    utterances = result["full_result"].get("results", {}).get("utterances", [])
+    return " ".join(utterance.get("msg", "") for utterance in utterances)
+
+
+def transcribe_fixture(engine: str, fixture: str, metadata: dict, config: dict) -> tuple:
+    """
+    fixture를 다운로드 단계 없이 변환하고 (처리 시간, 결과) 반환
+
+    받아 둔 파일이 있는 checkpoint를 넘겨 S3 다운로드를 건너뛰고, fixture는 지우지 않습니다.
+    """
+    checkpoint = STTCheckpoint()
+    checkpoint.temp_file_path = fixture
+    checkpoint.file_extension = os.path.splitext(fixture)[1]
+    started = time.perf_counter()
+    try:
+        result = get_stt_service(engine).transcribe_file(
+            fixture, {**config, "engine": engine}, audio_metadata=metadata, checkpoint=checkpoint
+        )
+    finally:
+        if checkpoint.chunk_dir:
+            shutil.rmtree(checkpoint.chunk_dir, ignore_errors=True)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="STT 엔진 벤치마크")
+    parser.add_argument("fixtures", nargs="+", help="음성 파일 또는 음성 파일이 있는 디렉토리")
+    parser.add_argument(
+        "--engines", default=",".join(STT_ENGINES), help="비교할 엔진 (쉼표로 구분)"
+    )
+    parser.add_argument("--config", default="{}", help="공통 STT 설정 (JSON)")
+    parser.add_argument(
+        "--warmup", action="store_true",
+        help="측정 전에 엔진별로 첫 파일을 한 번 변환 (로컬 엔진 프로세스 시작/모델 로드 시간 제외)"
+    )
+    parser.add_argument("--output", help="파일별 결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    engines = [engine.strip() for engine in args.engines.split(",") if engine.strip()]
+    config = json.loads(args.config)
+    fixtures = collect_fixtures(args.fixtures)
+    if not fixtures:
+        print("음성 파일이 없습니다.")
+        return 1
+
+    metadata = {}
+    for fixture in fixtures:
+        with open(fixture, "rb") as file_obj:
+            metadata[fixture] = probe_audio_metadata(file_obj)
+
+    if args.warmup:
+        for engine in engines:
+            try:
+                transcribe_fixture(engine, fixtures[0], metadata[fixtures[0]], config)
+            except Exception as e:
+                print(f"{engine} 워밍업 실패: {e}")
+
+    rows = []
+    print(f"{'engine':>10} {'file':>28} {'audio(s)':>9} {'wall(s)':>9} {'RTF':>7} {'utts':>6} {'CER':>7}")
+    for fixture in fixtures:
+        audio_seconds = (metadata[fixture].get("duration_ms") or 0) / 1000
+        reference_path = os.path.splitext(fixture)[0] + ".txt"
+        reference = None
+        if os.path.exists(reference_path):
+            with open(reference_path, encoding="utf-8") as reference_file:
+                reference = reference_file.read()
+
+        for engine in engines:
+            try:
+                elapsed, result = transcribe_fixture(engine, fixture, metadata[fixture], config)
+            except Exception as e:
+                print(f"{engine:>10} {os.path.basename(fixture)[-28:]:>28} 실패: {e}")
+                rows.append({"engine": engine, "file": fixture, "error": str(e)})
+                continue
+
+            text = plain_text(result)
+            # 정답이 없으면 첫 번째 엔진 결과를 기준으로 비교
+            if reference is None:
+                reference = text
+            cer = character_error_rate(reference, text)
+            rtf = elapsed / audio_seconds if audio_seconds else 0.0
+            utterances = len(result["full_result"].get("results", {}).get("utterances", []))
+            print(
+                f"{engine:>10} {os.path.basename(fixture)[-28:]:>28} {audio_seconds:>9.1f} "
+                f"{elapsed:>9.2f} {rtf:>7.3f} {utterances:>6} {cer:>7.3f}"
+            )
+            rows.append({
+                "engine": engine,
+                "file": fixture,
+                "audio_seconds": audio_seconds,
+                "wall_seconds": round(elapsed, 3),
+                "rtf": round(rtf, 4),
+                "utterances": utterances,
+                "cer": round(cer, 4),
+                "transcript": result["transcript"],
+            })
+
+    print()
+    print(f"{'engine':>10} {'files':>6} {'audio(s)':>9} {'wall(s)':>9} {'RTF':>7} {'CER':>7}")
+    for engine in engines:
+        done = [row for row in rows if row["engine"] == engine and "error" not in row]
+        if not done:
+            continue
+        total_audio = sum(row["audio_seconds"] for row in done)
+        total_wall = sum(row["wall_seconds"] for row in done)
+        mean_cer = sum(row["cer"] for row in done) / len(done)
+        rtf = total_wall / total_audio if total_audio else 0.0
+        print(f"{engine:>10} {len(done):>6} {total_audio:>9.1f} {total_wall:>9.2f} {rtf:>7.3f} {mean_cer:>7.3f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(rows, output_file, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+speaker_labels 저장 형식 벤치마크 스크립트
+
+긴 녹음의 화자별 발화를 기존 JSON 컬럼 형식과 열 단위 인코딩(압축 방식별)으로
+저장했을 때의 컬럼 크기와 전체/구간 복원 시간을 비교합니다. DB 없이 실행할 수 있습니다.
+
+예시:
+    python scripts/benchmark_transcript_storage.py --minutes 120
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import transcript_codec  # noqa: E402
+
+SAMPLE_SENTENCES = [
+    "오늘 학교에서 친구랑 무슨 이야기 했어?",
+    "그냥 점심시간에 같이 놀았어요.",
+    "그랬구나, 어떤 놀이를 했는지 궁금하다.",
+    "술래잡기 했는데 제가 계속 술래였어요.",
+    "속상했겠네. 그럴 때는 어떻게 했어?",
+    "처음엔 화났는데 나중엔 재미있었어요.",
+]
+
+
+def build_speaker_labels(minutes: int) -> list:
+    """평균 4초 길이 발화로 채운 speaker_labels 생성"""
+    labels = []
+    position = 0
+    while position < minutes * 60 * 1000:
+        duration = random.randint(1500, 6500)
+        labels.append({
+            "speaker": f"speaker{random.randint(0, 1)}",
+            "text": random.choice(SAMPLE_SENTENCES),
+            "start_at": position,
+            "end_at": position + duration,
+        })
+        position += duration
+    return labels
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="speaker_labels 저장 형식 벤치마크")
+    parser.add_argument("--minutes", type=int, default=120, help="녹음 길이 (분)")
+    parser.add_argument("--page-size", type=int, default=100, help="구간 조회 발화 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    random.seed(0)
+    labels = build_speaker_labels(args.minutes)
+    # 기존 형식: JSON 컬럼 + content 컬럼에 "speakerN: text" 중복 저장
+    content = "\n".join(f"{label['speaker']}: {label['text']}" for label in labels)
+    legacy_json = json.dumps(labels, ensure_ascii=False).encode("utf-8")
+    middle = len(labels) // 2
+
+    print(f"발화 {len(labels):,}개 ({args.minutes}분), content {len(content.encode('utf-8')):,} bytes")
+    print(f"{'format':>10} {'bytes':>12} {'ratio':>7} {'full(ms)':>10} {'page(ms)':>10}")
+
+    full_ms = best_of(lambda: json.loads(legacy_json), args.repeat)
+    page_ms = best_of(lambda: json.loads(legacy_json)[middle:middle + args.page_size], args.repeat)
+    print(f"{'json':>10} {len(legacy_json):>12,} {1:>7.2f} {full_ms:>10.2f} {page_ms:>10.2f}")
+
+    for compression in ("none", "zlib", "zstd"):
+        if compression == "zstd" and transcript_codec.zstandard is None:
+            print(f"{compression:>10} (zstandard 미설치로 건너뜀)")
+            continue
+        transcript_codec.TRANSCRIPT_COMPRESSION = compression
+        encoded = transcript_codec.encode_speaker_labels(labels)
+        assert transcript_codec.decode_speaker_labels(encoded) == labels
+
+        full_ms = best_of(lambda: transcript_codec.decode_speaker_labels(encoded), args.repeat)
+        page_ms = best_of(
+            lambda: transcript_codec.decode_speaker_labels_range(encoded, middle, args.page_size),
+            args.repeat
+        )
+        print(
+            f"{compression:>10} {len(encoded):>12,} {len(encoded) / len(legacy_json):>7.2f} "
+            f"{full_ms:>10.2f} {page_ms:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+워커 수에 따른 API 처리량 벤치마크 스크립트
+
+워커 수별로 gunicorn 서버를 띄운 뒤 같은 엔드포인트에 동시 요청을 보내
+초당 처리량(req/s)과 지연 시간을 비교합니다. DB가 연결된 환경에서 실행하세요.
+
+예시:
+    python scripts/benchmark_workers.py --path /reports/1 --workers 1,2,4 --concurrency 32
+"""
+
+import argparse
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+API_SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wait_until_ready(base_url: str, timeout: float = 60) -> None:
+    """서버가 응답할 때까지 대기"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(base_url, timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("서버가 시작되지 않았습니다.")
+
+
+def run_load(url: str, concurrency: int, duration: float) -> dict:
+    """duration초 동안 concurrency개의 스레드로 요청을 보내고 결과 집계"""
+    deadline = time.time() + duration
+
+    def worker():
+        session = requests.Session()
+        latencies = []
+        errors = 0
+        while time.time() < deadline:
+            started = time.perf_counter()
+            try:
+                response = session.get(url, timeout=30)
+                if response.status_code >= 400:
+                    errors += 1
+            except requests.RequestException:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+        return latencies, errors
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda _: worker(), range(concurrency)))
+
+    latencies = sorted(l for result in results for l in result[0])
+    errors = sum(result[1] for result in results)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / duration,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000 if latencies else 0,
+    }
+
+
+def benchmark(workers: int, args) -> dict:
+    """지정한 워커 수로 서버를 띄우고 부하 측정"""
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers), "PORT": str(args.port)}
+    server = subprocess.Popen(
+        ["gunicorn", "-c", "gunicorn.conf.py", "app.main:app"],
+        cwd=API_SERVER_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        wait_until_ready(base_url)
+        # 워밍업 후 측정
+        run_load(base_url + args.path, args.concurrency, 2)
+        return run_load(base_url + args.path, args.concurrency, args.duration)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커 수별 처리량 벤치마크")
+    parser.add_argument("--path", default="/", help="측정할 API 경로")
+    parser.add_argument("--workers", default=f"1,2,{os.cpu_count()}", help="쉼표로 구분한 워커 수 목록")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--duration", type=float, default=15, help="측정 시간 (초)")
+    parser.add_argument("--port", type=int, default=18000, help="벤치마크 서버 포트")
+    args = parser.parse_args()
+
+    print(f"CPU 코어: {os.cpu_count()}, 경로: {args.path}, 동시 요청: {args.concurrency}")
+    print(f"{'workers':>8} {'req/s':>10} {'p50(ms)':>10} {'p95(ms)':>10} {'errors':>8}")
+
+    baseline = None
+    for workers in [int(w) for w in args.workers.split(",")]:
+        result = benchmark(workers, args)
+        baseline = baseline or result["rps"] or 1
+        print(
+            f"{workers:>8} {result['rps']:>10.1f} {result['p50_ms']:>10.1f} "
+            f"{result['p95_ms']:>10.1f} {result['errors']:>8}  "
+            f"(x{result['rps'] / baseline:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
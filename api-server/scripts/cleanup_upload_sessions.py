@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+만료된 S3 직접 업로드 세션 정리 스크립트 (cron 등으로 주기 실행)
+
+DIRECT_UPLOAD_SESSION_TTL_HOURS가 지나도록 완료되지 않은 세션의 멀티파트 업로드를 취소하여
+S3에 남은 파트(과금 대상)를 삭제하고 세션을 aborted로 표시합니다.
+
+예시:
+    python scripts/cleanup_upload_sessions.py
+    python scripts/cleanup_upload_sessions.py --dry-run
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.db.models import UploadSession
+from app.services.s3 import abort_multipart_upload
+from app.services.direct_upload import DIRECT_UPLOAD_SESSION_TTL_HOURS
+
+
+def cleanup_upload_sessions(dry_run=False):
+    """만료된 업로드 세션의 멀티파트 업로드 취소"""
+    db = SessionLocal()
+    cutoff = datetime.utcnow() - timedelta(hours=DIRECT_UPLOAD_SESSION_TTL_HOURS)
+    
+    try:
+        sessions = db.query(UploadSession).filter(
+            UploadSession.status == "uploading",
+            UploadSession.created_at < cutoff
+        ).all()
+        print(f"만료된 업로드 세션: {len(sessions)}개 ({cutoff} 이전 생성)")
+        
+        aborted = 0
+        for session in sessions:
+            if dry_run:
+                print(f"  - 세션 {session.id}: {session.filename} ({session.file_size:,} bytes)")
+                continue
+            try:
+                abort_multipart_upload(session.s3_key, session.s3_upload_id)
+            except Exception as e:
+                # 이미 S3 수명 주기 규칙 등으로 삭제된 업로드도 세션은 정리
+                print(f"  ⚠️ 세션 {session.id} 멀티파트 업로드 취소 실패: {e}")
+            session.status = "aborted"
+            db.commit()
+            aborted += 1
+        
+        if not dry_run:
+            print(f"업로드 세션 정리 완료: {aborted}개")
+        
+    except Exception as e:
+        print(f"업로드 세션 정리 중 오류 발생: {str(e)}")
+        db.rollback()
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="만료된 S3 직접 업로드 세션 정리")
+    parser.add_argument("--dry-run", action="store_true", help="정리 대상만 출력")
+    args = parser.parse_args()
+    sys.exit(cleanup_upload_sessions(args.dry_run))
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+S3 버킷 CORS 설정 스크립트 (직접 업로드용, 버킷당 1회)
+
+브라우저가 파트별 Pre-signed URL로 PUT하고 응답의 ETag 헤더를 읽을 수 있도록
+대시보드 origin에 PUT을 허용하고 ETag 헤더를 노출합니다. 기존 CORS 규칙은 교체됩니다.
+
+예시:
+    python scripts/configure_s3_cors.py --origin https://admin.example.com
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.services.s3 import s3_client, AWS_S3_BUCKET_NAME  # noqa: E402
+
+
+def configure_cors(origins):
+    s3_client.put_bucket_cors(
+        Bucket=AWS_S3_BUCKET_NAME,
+        CORSConfiguration={
+            "CORSRules": [
+                {
+                    "AllowedOrigins": origins,
+                    "AllowedMethods": ["PUT", "GET", "HEAD"],
+                    "AllowedHeaders": ["*"],
+                    "ExposeHeaders": ["ETag"],
+                    "MaxAgeSeconds": 3600,
+                }
+            ]
+        }
+    )
+    print(f"S3 버킷 CORS 설정 완료: {AWS_S3_BUCKET_NAME} ({', '.join(origins)})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="S3 직접 업로드용 버킷 CORS 설정")
+    parser.add_argument(
+        "--origin", action="append", required=True,
+        help="허용할 대시보드 origin (여러 번 지정 가능)"
+    )
+    args = parser.parse_args()
+    configure_cors(args.origin)
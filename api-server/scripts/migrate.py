@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+DB 마이그레이션 일회성 실행 스크립트 (배포당 1회)
+
+1. MySQL 서버 연결 대기
+2. 데이터베이스가 없으면 생성
+3. MySQL advisory lock을 잡고 alembic upgrade head 실행
+   (여러 컨테이너가 동시에 실행해도 한 곳에서만 마이그레이션 수행)
+
+서버 시작(start.sh)과 분리되어 있어 스케일 아웃 시 새 컨테이너는 이 과정을 건너뜁니다.
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pymysql
+from alembic import command
+from alembic.config import Config
+from dotenv import load_dotenv
+
+load_dotenv()
+
+API_SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MIGRATION_LOCK_NAME = "hello_sally_migrations"
+MIGRATION_LOCK_TIMEOUT = int(os.getenv("MIGRATION_LOCK_TIMEOUT", "300"))  # 초
+DB_WAIT_RETRIES = int(os.getenv("DB_WAIT_RETRIES", "30"))
+DB_WAIT_INTERVAL = int(os.getenv("DB_WAIT_INTERVAL", "2"))  # 초
+
+
+def get_db_config():
+    env = os.getenv('ENV', 'development')
+    if env == 'production':
+        host = os.getenv('DB_HOST')
+        port = int(os.getenv('DB_PORT', '3306'))
+        user = os.getenv('DB_USER')
+        password = os.getenv('DB_PASSWORD')
+        database = os.getenv('DB_NAME', 'hello_sally_prod')
+    else:
+        host = os.getenv('DB_HOST', 'db')
+        port = int(os.getenv('DB_PORT', '3306'))
+        user = os.getenv('DB_USER', 'sally_dev_user')
+        password = os.getenv('DB_PASSWORD', 'sally_dev_password')
+        database = os.getenv('DB_NAME', 'hello_sally_dev')
+    return host, port, user, password, database
+
+
+def connect(host, port, user, password, database=None):
+    return pymysql.connect(
+        host=host,
+        port=port,
+        user=user,
+        password=password,
+        database=database,
+        charset='utf8mb4',
+        autocommit=True
+    )
+
+
+def wait_for_server(host, port, user, password):
+    """MySQL 서버 연결 대기"""
+    for i in range(DB_WAIT_RETRIES):
+        try:
+            connect(host, port, user, password).close()
+            print('✅ MySQL server connection successful!')
+            return
+        except Exception as e:
+            if i == DB_WAIT_RETRIES - 1:
+                print(f'❌ MySQL server connection failed after {DB_WAIT_RETRIES} attempts: {e}')
+                sys.exit(1)
+            print(f'⏳ Server connection attempt {i+1}/{DB_WAIT_RETRIES} failed, retrying in {DB_WAIT_INTERVAL} seconds...')
+            time.sleep(DB_WAIT_INTERVAL)
+
+
+def create_database_if_not_exists(host, port, user, password, database):
+    connection = connect(host, port, user, password)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW DATABASES LIKE %s", (database,))
+            if cursor.fetchone():
+                print(f'✅ Database {database} already exists')
+                return
+            print(f'📦 Creating database: {database}')
+            cursor.execute(
+                f'CREATE DATABASE `{database}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci'
+            )
+            print(f'✅ Database {database} created successfully!')
+    finally:
+        connection.close()
+
+
+def run_migrations_with_lock(host, port, user, password, database):
+    """advisory lock을 잡은 상태에서 alembic upgrade head 실행"""
+    lock_connection = connect(host, port, user, password, database)
+    try:
+        with lock_connection.cursor() as cursor:
+            print(f'🔒 Acquiring migration lock ({MIGRATION_LOCK_TIMEOUT}s timeout)...')
+            cursor.execute("SELECT GET_LOCK(%s, %s)", (MIGRATION_LOCK_NAME, MIGRATION_LOCK_TIMEOUT))
+            if cursor.fetchone()[0] != 1:
+                print('❌ Could not acquire migration lock')
+                sys.exit(1)
+
+        try:
+            alembic_config = Config(os.path.join(API_SERVER_DIR, 'alembic.ini'))
+            alembic_config.set_main_option('script_location', os.path.join(API_SERVER_DIR, 'alembic'))
+            command.upgrade(alembic_config, 'head')
+        finally:
+            with lock_connection.cursor() as cursor:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (MIGRATION_LOCK_NAME,))
+            print('🔓 Migration lock released')
+    finally:
+        lock_connection.close()
+
+
+def main():
+    host, port, user, password, database = get_db_config()
+
+    print('🔍 Step 1: Waiting for MySQL server connection...')
+    wait_for_server(host, port, user, password)
+
+    print('🔍 Step 2: Creating database if needed...')
+    create_database_if_not_exists(host, port, user, password, database)
+
+    print('📊 Step 3: Running database migrations...')
+    run_migrations_with_lock(host, port, user, password, database)
+    print('✅ Database migrations completed successfully!')
+
+
+if __name__ == '__main__':
+    main()
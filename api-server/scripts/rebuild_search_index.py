@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+검색 색인 재구성 스크립트
+
+기존 Transcript와 AI 분석 결과를 모두 다시 색인합니다. 검색 기능 도입 이전 데이터의
+초기 색인이나 색인 실패 후 복구에 사용하세요.
+
+예시:
+    python scripts/rebuild_search_index.py
+    python scripts/rebuild_search_index.py --report-id 12
+"""
+
+import argparse
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.db.models import Transcript, AudioFile, ReportData
+from app.services.search import index_transcript, index_report_data
+
+BATCH_SIZE = 50
+
+
+def rebuild_search_index(report_id=None):
+    """Transcript/AI 분석 결과를 배치 단위로 재색인 (배치마다 커밋)"""
+    db = SessionLocal()
+    started = time.time()
+    documents = 0
+    
+    try:
+        transcript_query = db.query(Transcript, AudioFile.report_id).join(
+            AudioFile, Transcript.audio_file_id == AudioFile.id
+        )
+        report_data_query = db.query(ReportData)
+        if report_id:
+            transcript_query = transcript_query.filter(AudioFile.report_id == report_id)
+            report_data_query = report_data_query.filter(ReportData.report_id == report_id)
+        
+        last_id = 0
+        while True:
+            rows = transcript_query.filter(Transcript.id > last_id).order_by(
+                Transcript.id
+            ).limit(BATCH_SIZE).all()
+            if not rows:
+                break
+            for transcript, transcript_report_id in rows:
+                documents += index_transcript(db, transcript, transcript_report_id)
+                last_id = transcript.id
+            db.commit()
+            db.expunge_all()
+            print(f"Transcript 색인 중... (id {last_id}까지, 문서 {documents:,}개)")
+        
+        last_id = 0
+        while True:
+            rows = report_data_query.filter(ReportData.id > last_id).order_by(
+                ReportData.id
+            ).limit(BATCH_SIZE).all()
+            if not rows:
+                break
+            for report_data in rows:
+                documents += index_report_data(db, report_data)
+                last_id = report_data.id
+            db.commit()
+            db.expunge_all()
+        
+        print(f"검색 색인 재구성 완료: 문서 {documents:,}개 ({time.time() - started:.1f}초)")
+        
+    except Exception as e:
+        print(f"검색 색인 재구성 중 오류 발생: {str(e)}")
+        db.rollback()
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="검색 색인 재구성")
+    parser.add_argument("--report-id", type=int, default=None, help="특정 보고서만 재색인")
+    args = parser.parse_args()
+    sys.exit(rebuild_search_index(args.report_id))
@@ -0,0 +1,22 @@
+#!/bin/bash
+# 서버 시작 엔트리포인트 (DB 대기/마이그레이션 없이 바로 시작)
+# 운영 환경은 배포 시 migrate.sh를 별도로 1회 실행하며,
+# 개발 환경은 기본적으로 시작 전에 마이그레이션을 함께 실행합니다.
+
+if [ "$ENV" = "production" ]; then
+    RUN_MIGRATIONS=${RUN_MIGRATIONS:-false}
+else
+    RUN_MIGRATIONS=${RUN_MIGRATIONS:-true}
+fi
+
+if [ "$RUN_MIGRATIONS" = "true" ]; then
+    ./migrate.sh || exit 1
+fi
+
+echo "🌟 Starting FastAPI server..."
+if [ "$ENV" = "production" ]; then
+    # 멀티 워커 모드 (워커 수: WEB_CONCURRENCY, 기본 CPU 코어 수)
+    exec gunicorn -c gunicorn.conf.py app.main:app
+else
+    exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+fi
@@ -0,0 +1,78 @@
+import pytest
+
+from app.services import audio_chunking
+from app.services.audio_chunking import plan_segments, stitch_segment_results
+
+
+@pytest.fixture
+def chunk_settings(monkeypatch):
+    monkeypatch.setattr(audio_chunking, "CHUNK_TARGET_LENGTH", 600)
+    monkeypatch.setattr(audio_chunking, "CHUNK_SEARCH_WINDOW", 60)
+    monkeypatch.setattr(audio_chunking, "CHUNK_OVERLAP", 15)
+
+
+def test_plan_segments_splits_at_nearest_silence(chunk_settings):
+    segments = plan_segments(1_800_000, [(590_000, 594_000), (1_250_000, 1_252_000)])
+
+    assert [(s["own_start_ms"], s["own_end_ms"]) for s in segments] == [
+        (0, 592_000), (592_000, 1_251_000), (1_251_000, 1_800_000)
+    ]
+    assert segments[0]["start_ms"] == 0
+    assert segments[1]["start_ms"] == 577_000
+    assert segments[1]["end_ms"] == 1_266_000
+    assert segments[-1]["end_ms"] == 1_800_000
+
+
+def test_plan_segments_without_silence_cuts_at_target(chunk_settings):
+    segments = plan_segments(1_500_000, [])
+
+    assert [s["own_end_ms"] for s in segments] == [600_000, 1_500_000]
+
+
+def test_plan_segments_short_recording_is_single_segment(chunk_settings):
+    assert plan_segments(800_000, [(400_000, 401_000)]) == [
+        {"start_ms": 0, "end_ms": 800_000, "own_start_ms": 0, "own_end_ms": 800_000}
+    ]
+
+
+def test_plan_segments_always_advances(monkeypatch, chunk_settings):
+    # 목표 길이가 탐색 범위보다 짧아도 이전 분할 지점 근처의 무음을 다시 고르지 않음
+    monkeypatch.setattr(audio_chunking, "CHUNK_TARGET_LENGTH", 50)
+    segments = plan_segments(600_000, [(40_000, 42_000)])
+
+    cuts = [s["own_start_ms"] for s in segments]
+    assert cuts == sorted(set(cuts))
+    assert all(s["own_end_ms"] - s["own_start_ms"] >= 25_000 for s in segments)
+    assert segments[-1]["own_end_ms"] == 600_000
+
+
+def test_stitch_segment_results_offsets_dedupes_and_maps_speakers():
+    segments = [
+        {"start_ms": 0, "end_ms": 20_000, "own_start_ms": 0, "own_end_ms": 10_000},
+        {"start_ms": 5_000, "end_ms": 30_000, "own_start_ms": 10_000, "own_end_ms": 30_000},
+    ]
+    results = [
+        {"results": {"utterances": [
+            {"start_at": 0, "duration": 4_000, "spk": 0, "msg": "안녕"},
+            {"start_at": 6_000, "duration": 6_000, "spk": 1, "msg": "반가워"},
+            {"start_at": 13_000, "duration": 3_000, "spk": 0, "msg": "겹침 A"},
+        ]}},
+        {"results": {"utterances": [
+            # 두 번째 세그먼트의 화자 번호는 첫 번째와 반대로 매겨짐
+            {"start_at": 1_000, "duration": 6_000, "spk": 0, "msg": "반가워"},
+            {"start_at": 8_000, "duration": 3_000, "spk": 1, "msg": "겹침 A"},
+            {"start_at": 15_000, "duration": 2_000, "spk": 1, "msg": "끝"},
+        ]}},
+    ]
+
+    stitched = stitch_segment_results(segments, results)
+    utterances = stitched["results"]["utterances"]
+
+    assert [(u["start_at"], u["spk"], u["msg"]) for u in utterances] == [
+        (0, 0, "안녕"),
+        (6_000, 1, "반가워"),
+        (13_000, 0, "겹침 A"),
+        (20_000, 0, "끝"),
+    ]
+    assert all("end_at" not in u for u in utterances)
+    assert stitched["segments"] == segments